@@ -3,23 +3,54 @@ Author:     David Walshe
 Date:       10 May 2021
 """
 
+import atexit
 import logging
 
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_marshmallow import Marshmallow
-from flask_restful import Api
 
 from configurations.env_setup import get_config
 from app.common.logger import init_logger
-
-init_logger(get_config("dev").LOGGER_CONFIG)
+from app.common.cache import CredentialCache, TokenCache
+from app.common.tokens import TokenSigner, AdminSecret
+from app.common.principal import EpochTable
+from app.common.hashing import HashingService
+from app.common.admission import AdmissionController
+from app.common.roles import RoleRegistry
+from app.common.bloom import EmailFilter
+from app.common.json_backend import JSONProvider
+from app.common.writebehind import LastLoginBuffer
+from app.common.sqlite import SQLiteProfile
+from app.common.replica import ReadReplica
+from app.common.writer import WriteQueue
 
 logger = logging.getLogger(__name__)
 
 # Construct Flask extensions, initialise in factory function.
 db = SQLAlchemy()
 ma = Marshmallow()
+credential_cache = CredentialCache()
+token_cache = TokenCache()
+token_signer = TokenSigner()
+admin_secret = AdminSecret()
+credential_epochs = EpochTable()
+hasher = HashingService()
+admission = AdmissionController()
+roles = RoleRegistry()
+email_filter = EmailFilter()
+json_provider = JSONProvider()
+last_logins = LastLoginBuffer()
+sqlite_profile = SQLiteProfile()
+read_db = ReadReplica()
+writer = WriteQueue()
+
+# Stop the password hashing worker processes on interpreter exit.
+atexit.register(hasher.shutdown)
+# Write any buffered last login times on interpreter exit.
+atexit.register(last_logins.shutdown)
+# Commit any queued writes on interpreter exit.
+atexit.register(writer.shutdown)
 
 
 def create_app(config_name: str = "dev") -> Flask:
@@ -39,6 +70,8 @@ def create_app(config_name: str = "dev") -> Flask:
 
     app = setup_api(app)
 
+    app = setup_commands(app)
+
     return app
 
 
@@ -51,6 +84,8 @@ def setup_env(app: Flask, config_name: str) -> Flask:
     """
     # Get environment configuration.
     config = get_config(config_name)
+    # Configure logging for the environment, once per logger configuration.
+    init_logger(config.LOGGER_CONFIG)
     # Inject configuration into application instance.
     app.config.from_object(config)
     # Initialise application configuration settings if required.
@@ -68,21 +103,77 @@ def init_plugins(app: Flask) -> Flask:
     """
     # Initialise Database.
     db.init_app(app)
-    db.create_all(app=app)
-
-    try:
-        with app.app_context():
-            # Add roles to database
-            from app.models import Role
-            _ = [db.session.add(Role(name=role)) for role in ["user", "admin"]]
 
-            db.session.commit()
-    except Exception:
-        logger.debug("Role table already setup.")
+    # Apply the SQLite pragma profile to each new connection, attached before the first connection is made.
+    sqlite_profile.init_app(app)
+    with app.app_context():
+        sqlite_profile.attach(db.engine)
+        logger.info(f"SQLite profile: {sqlite_profile.report(db.engine)}")
+
+    # Create the tables and seed the roles, skipped when the database is already at the current schema version.
+    from app.models import User
+    from app.models.schema import ensure_schema
+    with app.app_context():
+        ensure_schema(db)
+
+    # Initialise the read-only engine and session used by read-only handlers.
+    read_db.init_app(app)
+    with app.app_context():
+        read_db.bind(db)
+        if read_db.separate:
+            sqlite_profile.attach(read_db.engine, read_only=True)
+
+    # Load the role registry, resolves role ids to names without per-User Role loads.
+    roles.init_app(app)
+    with app.app_context():
+        from app.models import Role
+        roles.load(db.session, Role)
 
     # Initialise Marshmallow
     ma.init_app(app)
 
+    # Initialise the JSON backend used for responses and request bodies.
+    json_provider.init_app(app)
+
+    # Initialise password hashing service.
+    hasher.init_app(app)
+
+    # Initialise password verification admission control.
+    admission.init_app(app)
+
+    # Initialise verified credential cache.
+    credential_cache.init_app(app)
+
+    # Initialise authentication token signer.
+    token_signer.init_app(app)
+
+    # Derive the admin registration secret.
+    admin_secret.init_app(app)
+
+    # Initialise decoded token cache, invalidated on User updates/deletes.
+    token_cache.init_app(app)
+    token_cache.watch(db.session, User)
+
+    # Initialise credential epoch table for stateless tokens.
+    credential_epochs.init_app(app)
+    credential_epochs.watch(db.session, User)
+
+    # Initialise the registered email filter, built from the users table.
+    email_filter.init_app(app)
+    email_filter.watch(db.session, User)
+    with app.app_context():
+        email_filter.rebuild()
+
+    # Initialise the last login write-behind buffer.
+    last_logins.init_app(app)
+    with app.app_context():
+        last_logins.bind(db.engine, User)
+
+    # Initialise the single writer, commits mutations in groups when enabled.
+    writer.init_app(app)
+    with app.app_context():
+        writer.bind(db.session, db.engine)
+
     return app
 
 
@@ -94,10 +185,15 @@ def setup_api(app: Flask) -> Flask:
     :return: The
     """
     # Initialise and route Flask-RESTful API for User.
+    from flask_restful import Api
     from .api import get_blueprint, UsersApiV1, LoginApiV1, RegisterApiV1
     api_bp = get_blueprint()
     api = Api(api_bp)
 
+    # Encode Flask-RESTful responses with the configured JSON backend.
+    api.representations["application/json"] = lambda data, code, headers=None: json_provider.response(data, code,
+                                                                                                      headers)
+
     # Setup API Routes/Endpoints.
     # api.add_resource(UsersApiV1, "/api/v1/users/me", endpoint="user")
     api.add_resource(UsersApiV1, "/api/v1/users/<string:id>", endpoint="user")
@@ -109,3 +205,16 @@ def setup_api(app: Flask) -> Flask:
     app.register_blueprint(api_bp)
 
     return app
+
+
+def setup_commands(app: Flask) -> Flask:
+    """
+    Registers the Flask CLI commands.
+
+    :param app: The Flask object.
+    :return: The Flask object.
+    """
+    from .commands import register_commands
+    register_commands(app)
+
+    return app
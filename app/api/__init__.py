@@ -6,8 +6,15 @@ Date:       13 May 2021
 from flask import Blueprint
 
 from .v1 import LoginApiV1, RegisterApiV1, UsersApiV1
+from .context import reset_auth_context, report_auth_context
 
 
 def get_blueprint():
     """API Blueprint factory."""
-    return Blueprint("api", __name__)
+    api_bp = Blueprint("api", __name__)
+
+    # Scope the authentication context to each request and emit its counters.
+    api_bp.before_request(reset_auth_context)
+    api_bp.after_request(report_auth_context)
+
+    return api_bp
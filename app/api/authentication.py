@@ -4,14 +4,17 @@ Date:       13 May 2021
 """
 
 import logging
+from typing import Union
 
-from flask import g, current_app  # Flask globals
+from flask import g, request, abort  # Flask globals
 from flask_httpauth import HTTPBasicAuth, HTTPTokenAuth, MultiAuth
-from itsdangerous import TimedJSONWebSignatureSerializer as JWS
-from werkzeug.security import check_password_hash
 
+from .. import admin_secret, admission, credential_cache, credential_epochs, email_filter, token_cache, token_signer
+from ..common.admission import AdmissionRejected
+from ..common.principal import Principal
 from ..models import User
-from .errors import unauthorized
+from .context import get_auth_context
+from .errors import unauthorized, too_many_requests
 
 # Setup authentication handlers.
 basic_auth = HTTPBasicAuth()
@@ -32,19 +35,32 @@ def verify_password(email_or_token: str, password: str) -> bool:
     return _verify_password(email_or_token, password)
 
 
-def _verify_password(email: str, password: str) -> bool:
+def _verify_password(email: str, password: str) -> Union[User, bool]:
     """
     Verifies a user's email and password combination for API access.
 
+    The result is memoized on the request's authentication context, nested
+    "login_required" handlers reuse it instead of verifying the password again.
+
     :param email: The user email to identify and check credentials for or an authentication token.
     :param password: The user password to verify.
-    :return: True if credentials were correct else False.
+    :return: The authenticated User if credentials were correct else False.
     """
-    # Get the user information from the DB.
-    user = User.query.filter_by(email=email).first()
+    ctx = get_auth_context()
+
+    if ctx.resolved_for("basic", email, password):
+        return ctx.user or False
+
+    # Get the user information from the DB, unless the email was never registered.
+    if email_filter.might_contain(email):
+        user = User.query.filter_by(email=email).first()
+        ctx.user_lookups += 1
+    else:
+        user = None
 
     # If the user does not exist in the DB, return False.
     if not user:
+        ctx.resolve("basic", email, password, user=None, token_used=False)
         return False
 
     # Set flask global state.
@@ -52,8 +68,29 @@ def _verify_password(email: str, password: str) -> bool:
 
     logger.debug("Authorized with Email/Password.")
 
-    # Check if the users password is correct.
-    return user.verify_password(password=password)
+    # Check if the users password is correct, skipping the hash work for recently verified credentials.
+    if not credential_cache.verify(email, password, user.password_hash,
+                                   verifier=lambda: _check_password(user, password)):
+        user = None
+
+    return ctx.resolve("basic", email, password, user=user, token_used=False) or False
+
+
+def _check_password(user: User, password: str) -> bool:
+    """
+    Runs the full password verification under admission control.
+
+    Floods are rejected with a 429 error before any hashing runs.
+
+    :param user: The user to verify the password for.
+    :param password: The user password to verify.
+    :return: True if the password is correct else False.
+    """
+    try:
+        with admission.admit(user.email, request.remote_addr):
+            return user.verify_password(password=password)
+    except AdmissionRejected:
+        abort(too_many_requests("Too many authentication attempts, try again later."))
 
 
 # ======================================================================================================================
@@ -65,29 +102,53 @@ def verify_token(token: str):
     """
     Verifies a user's Bearer token for API access.
 
+    The result is memoized on the request's authentication context, nested
+    "login_required" handlers reuse it instead of verifying the token again.
+
     :param token: The token supplied by the client.
     :return: True if the token identified user is not None, else False.
     """
-    # Generate JWT signer.
-    jws = JWS(current_app.config["SECRET_KEY"], current_app.config["TOKEN_EXPIRY"])
-    try:
-        data = jws.loads(token)
-    except Exception as err:
-        logger.debug(f"{err}")
-        return False
+    ctx = get_auth_context()
+
+    if ctx.resolved_for("bearer", token):
+        return ctx.user
+
+    # Reuse the decoded token for repeat requests, skipping the signature check.
+    entry = token_cache.get(token)
+
+    if entry is not None:
+        data, header = entry.claims, None
+    else:
+        try:
+            data, header = token_signer.loads(token)
+        except Exception as err:
+            logger.debug(f"{err}")
+            return ctx.resolve("bearer", token, user=None, token_used=True) or False
 
     # Set flask global state.
     set_globals(token_used=True)
 
-    # Return active user.
-    user = User.user_from_token_props(data)
+    if credential_epochs.enabled and Principal.is_stateless(data):
+        # Stateless token, check the credential epoch and build a Principal without loading the User.
+        user = credential_epochs.resolve(data)
+    elif entry is not None and entry.user is not None:
+        # Restore the cached User snapshot without querying the database.
+        user = User.from_snapshot(entry.user)
+    else:
+        # Return active user.
+        user = User.user_from_token_props(data)
+        ctx.user_lookups += 1
 
     if user is not None:
         logger.debug("Authorized with Token.")
+
+        if entry is None:
+            snapshot = None if isinstance(user, Principal) else user.as_snapshot()
+            token_cache.set(token, claims=data, user=snapshot, expires_at=header["exp"])
     else:
         logger.warning("Authentication failed.")
 
-    return user
+    return ctx.resolve("bearer", token, user=user, token_used=True)
 
 
 def set_globals(token_used: bool) -> None:
@@ -123,18 +184,15 @@ def token_auth_error():
 # ======================================================================================================================
 
 @basic_auth.get_user_roles
-def basic_auth_get_user_roles(login_details):
-    """Return the current users role from the database for username/password holders."""
-    user = User.query.filter_by(email=login_details["username"]).first()
-
-    return user.get_roles()
+def basic_auth_get_user_roles(user):
+    """Return the current users role for username/password holders, resolved once per request."""
+    return get_auth_context().get_roles()
 
 
 @token_auth.get_user_roles
 def token_auth_get_user_roles(user):
-    """Return the current users role from the database for token holders."""
-    print(user)
-    return user.get_roles()
+    """Return the current users role for token holders, resolved once per request."""
+    return get_auth_context().get_roles()
 
 
 def verify_admin_password(password: str) -> bool:
@@ -144,11 +202,7 @@ def verify_admin_password(password: str) -> bool:
     :param password: The password for
     :return:
     """
-    # Ensure password is a string before checking.
-    if not isinstance(password, str):
-        return False
-
-    return check_password_hash(current_app.config["ADMIN_SECRET_KEY"], password)
+    return admin_secret.verify(password)
 
 
 class Access:
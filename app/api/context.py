@@ -0,0 +1,116 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Optional, Tuple, Union
+
+from flask import g, Response
+
+from app.models import User
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AuthContext:
+    """
+    Request scoped record of the authentication work carried out for the current request.
+
+    Memoized on the Flask globals so nested "login_required" decorators and the role callbacks
+    reuse the first credential verification instead of repeating it.
+
+    :param credentials: The (scheme, *credentials) tuple the cached result belongs to.
+    :param user: The authenticated User object, None if authentication failed.
+    :param roles: The role name(s) of the authenticated User.
+    :param token_used: Flag to denote a Bearer token was used for authentication.
+    :param verifications: The number of credential verifications performed for this request.
+    :param user_lookups: The number of User database lookups performed for this request.
+    """
+    credentials: Optional[Tuple[str, ...]] = None
+    user: Optional[object] = None
+    roles: Optional[Union[str, Tuple[str]]] = None
+    token_used: bool = False
+    verifications: int = 0
+    user_lookups: int = 0
+
+    def resolved_for(self, *credentials: str) -> bool:
+        """
+        Check if the authentication result for the given credentials is already known.
+
+        :param credentials: The scheme and credentials supplied by the client.
+        :return: True if the credentials have already been verified during this request.
+        """
+        return self.credentials == credentials
+
+    def resolve(self, *credentials: str, user: Optional[object], token_used: bool) -> Optional[object]:
+        """
+        Stores the authentication result for the given credentials.
+
+        :param credentials: The scheme and credentials supplied by the client.
+        :param user: The authenticated User object, None if authentication failed.
+        :param token_used: Flag to denote a Bearer token was used for authentication.
+        :return: The authenticated User object or None.
+        """
+        self.credentials = credentials
+        self.user = user
+        self.roles = None
+        self.token_used = token_used
+        self.verifications += 1
+
+        return user
+
+    def load_user(self) -> Optional[object]:
+        """
+        Returns the authenticated User as a database model, loading it if the request was authenticated
+        with a stateless token Principal.
+        """
+        if self.user is not None and not isinstance(self.user, User):
+            self.user = User.query.get(self.user.id)
+            self.user_lookups += 1
+
+        return self.user
+
+    def get_roles(self) -> Optional[Union[str, Tuple[str]]]:
+        """Returns the authenticated User's role(s), only resolved once per request."""
+        if self.roles is None and self.user is not None:
+            self.roles = self.user.get_roles()
+
+        return self.roles
+
+
+def get_auth_context() -> AuthContext:
+    """
+    Returns the authentication context for the current request, creating it if required.
+
+    :return: The request scoped AuthContext object.
+    """
+    if "auth_context" not in g:
+        g.auth_context = AuthContext()
+
+    return g.auth_context
+
+
+def reset_auth_context() -> None:
+    """
+    Before request hook to start every request with a fresh authentication context.
+
+    The Flask globals are application context scoped, which can outlive a single request.
+    """
+    g.auth_context = AuthContext()
+
+
+def report_auth_context(response: Response) -> Response:
+    """
+    After request hook to emit the authentication counters for the current request.
+
+    :param response: The outgoing response.
+    :return: The unaltered response.
+    """
+    if "auth_context" in g:
+        ctx: AuthContext = g.auth_context
+        logger.debug(f"Auth context: {ctx.verifications} verification(s), {ctx.user_lookups} user lookup(s).")
+
+    return response
@@ -5,7 +5,9 @@ Date:       13 May 2021
 
 import logging
 
-from flask import jsonify, Response
+from flask import Response
+
+from .. import json_provider
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +20,7 @@ def make_error(msg: str, error: str) -> Response:
     :param error: The text description of the error.
     :return: A flask error response object.
     """
-    return jsonify({
+    return json_provider.response({
         "error": error,
         "message": msg,
     })
@@ -63,6 +65,19 @@ def not_found(msg: str) -> Response:
     return res
 
 
+def too_many_requests(msg: str) -> Response:
+    """
+    Creates and returns an error response for a 429 - Too Many Requests error.
+
+    :param msg: The message to include in the error.
+    :return: The 429 Error Response.
+    """
+    res = make_error(msg, "Too Many Requests")
+    res.status_code = 429
+
+    return res
+
+
 def internal_server_error(msg: str) -> Response:
     """
     Creates and returns an error response for a 500 - Internal Server Error error.
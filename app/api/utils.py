@@ -5,12 +5,12 @@ Date:       13 May 2021
 
 import logging
 from datetime import datetime
-import json
 from dataclasses import dataclass, asdict
 from typing import Dict, Any
 
 from sqlalchemy.engine.row import Row
 
+from .. import json_provider, roles
 from ..models import User
 
 logger = logging.getLogger(__name__)
@@ -50,12 +50,12 @@ class UserUtils:
         """
         # Convert to JSON if of type bytes.
         if isinstance(data, bytes):
-            data = json.loads(data)
+            data = json_provider.loads(data)
 
         return User(**asdict(cls(
             username=data.get("username", None),
             email=data.get("email", None),
             password=data.get("password", None),
             last_login=datetime.now().replace(microsecond=0),
-            role_id=2 if is_admin else 1
+            role_id=roles.id("admin" if is_admin else "user")
         )))
@@ -5,6 +5,10 @@ Date:       16 May 2021
 
 import logging
 from abc import abstractmethod
+from typing import Iterable
+
+from app import token_cache, credential_epochs
+from app.api.context import get_auth_context
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +25,16 @@ class Handler:
         """
         self.id = id
 
+    @property
+    def current_user(self):
+        """The User authenticated for this request, shared with the authentication callbacks."""
+        return get_auth_context().user
+
+    @property
+    def current_user_model(self):
+        """The User model authenticated for this request, loaded from the database for stateless tokens."""
+        return get_auth_context().load_user()
+
     def handle(self):
         """
         External interface method to handle both users types, User and Admin accounts.
@@ -35,6 +49,20 @@ class Handler:
         else:
             return self.handle_admin()
 
+    @staticmethod
+    def forget_users(ids: Iterable[int]) -> None:
+        """
+        Drops changed or deleted users from the token caches, needed after Core statements which bypass the
+        session listeners.
+
+        :param ids: The changed User ids.
+        """
+        ids = set(ids)
+
+        if ids:
+            token_cache.discard_users(ids)
+            credential_epochs.discard_users(ids)
+
     @abstractmethod
     def handle_admin(self):
         pass
@@ -4,15 +4,18 @@ Date:       16 May 2021
 """
 
 import logging
-from typing import Union, List, Dict, Any
+from functools import partial
+from typing import Union, List, Dict, Any, Tuple
 
-from flask import make_response
+from flask import current_app
+from sqlalchemy import bindparam, select, text
+from sqlalchemy.engine import Connection
 
-from app import db
+from app import db, json_provider, email_filter, writer
 from app.models.user import User
 from app.api.authentication import auth, Access
 from app.api.errors import bad_request, not_found
-from app.api.v1.schema import UserSchema, ValidationError
+from app.api.v1.schema import UserSchema, UserSerializer, ValidationError
 from app.api.v1.handlers.base import Handler
 
 logger = logging.getLogger(__name__)
@@ -23,12 +26,12 @@ class DeleteHandler(Handler):
     @auth.login_required(role=Access.ALL())
     def handle_user(self):
         """As a User, delete your own account."""
-        user: User = auth.current_user()
+        user: User = self.current_user
 
         user = self.delete(user.id)
 
         logger.debug("User closed their account.")
-        return make_response(user, 200)
+        return json_provider.response(user, 200)
 
     @auth.login_required(role=Access.ADMIN_ONLY())
     def handle_admin(self):
@@ -60,13 +63,17 @@ class DeleteHandler(Handler):
         # Delete users.
         users = self.delete(ids)
 
-        return make_response(users, 200)
+        return json_provider.response(users, 200)
 
     @staticmethod
-    def delete(ids: Union[int, List[int]]) -> Dict[str, Any]:
+    def delete(ids: Union[int, List[int]]) -> List[Dict[str, Any]]:
         """
         Helper method to delete users from the database and return there usernames and ids.
 
+        Ids are deleted in chunks of USERS_DELETE_CHUNK_SIZE, each committed on its own so the write lock is only
+        held for one chunk and the statement stays under SQLite's bound parameter limit. Each chunk is a single
+        "DELETE ... RETURNING" where supported, else a SELECT followed by a DELETE.
+
         :param ids: The ids of the users to remove from the database.
         :return: The ids and usernames of the accounts that were deleted.
         """
@@ -74,14 +81,54 @@ class DeleteHandler(Handler):
         if isinstance(ids, int):
             ids = [ids]
 
-        # Get all users for deletion that are currently in DB.
-        users = db.session.query(User).where(User.id.in_(ids)).all()
+        ids = sorted({user_id for user_id in ids if user_id is not None})
+        chunk_size = current_app.config["USERS_DELETE_CHUNK_SIZE"]
+        delete_chunk = DeleteHandler._delete_returning if supports_returning() else DeleteHandler._select_delete
+
+        deleted = []
+        for start in range(0, len(ids), chunk_size):
+            rows = writer.execute(partial(delete_chunk, ids[start:start + chunk_size]))
 
-        # DeleteHandler all users passed.
-        db.session.query(User).where(User.id.in_(ids)).delete()
-        db.session.commit()
+            DeleteHandler._forget([user_id for user_id, _ in rows])
+            deleted.extend(rows)
 
         # Return the id, usernames for the deleted users.
-        users = UserSchema(many=True, only=("id", "username")).dumps(users)
+        users = [{"id": user_id, "username": username} for user_id, username in sorted(deleted)]
+
+        return UserSerializer.get(many=True, only=("id", "username")).dump(users, native=True)
+
+    @staticmethod
+    def _delete_returning(ids: List[int], connection: Connection) -> List[Tuple[int, str]]:
+        """Write job deleting a chunk of users with a single statement, returning their ids and usernames."""
+        statement = text(f"DELETE FROM {User.__tablename__} WHERE id IN :ids RETURNING id, username")
+
+        return connection.execute(statement.bindparams(bindparam("ids", expanding=True)), {"ids": ids}).all()
+
+    @staticmethod
+    def _select_delete(ids: List[int], connection: Connection) -> List[Tuple[int, str]]:
+        """Write job deleting a chunk of users, selecting their ids and usernames first."""
+        rows = connection.execute(select(User.id, User.username).where(User.id.in_(ids))).all()
+
+        if rows:
+            connection.execute(User.__table__.delete().where(User.id.in_([user_id for user_id, _ in rows])))
+
+        return rows
+
+    @staticmethod
+    def _forget(ids: List[int]) -> None:
+        """Drops deleted users from the caches and email filter."""
+        if not ids:
+            return
+
+        Handler.forget_users(ids)
+        email_filter.discard(len(ids))
+
+
+def supports_returning() -> bool:
+    """Check if the database supports "DELETE ... RETURNING", SQLite added it in 3.35."""
+    dialect = db.engine.dialect
+
+    if dialect.name == "sqlite":
+        return dialect.dbapi.sqlite_version_info >= (3, 35, 0)
 
-        return users
+    return dialect.name == "postgresql"
@@ -5,18 +5,23 @@ Date:       16 May 2021
 
 import logging
 
-from flask import make_response
+from flask import request, current_app
 
+from app import read_db
 from app.models.user import User
 from app.api.authentication import auth, Access
-from app.api.errors import not_found
-from app.api.v1.schema import UserSchema
+from app.api.errors import not_found, bad_request
+from app.api.v1.schema import UserSchema, UserSerializer
+from app.api.v1.pagination import KeysetPage, PaginationError
 from app.api.v1.handlers.base import Handler
 
 logger = logging.getLogger(__name__)
 
 
 class RetrieveHandler(Handler):
+    # Fields returned per role, the users table is queried for only these columns.
+    ADMIN_FIELDS = ("id", "email", "username", "role_name", "last_login")
+    USER_FIELDS = ("id", "username", "last_login")
 
     def __init__(self, id: int):
         """
@@ -25,7 +30,10 @@ class RetrieveHandler(Handler):
         :param id: ID of an individual user to return.
         """
         super().__init__(id)
+        self.only = self.USER_FIELDS
         self.many = False
+        self.page = None
+        self.streaming = False
 
     @auth.login_required(role=Access.ALL())
     def handle(self):
@@ -39,10 +47,16 @@ class RetrieveHandler(Handler):
             return self.handle_me()
 
         # Get current logged in user.
-        user = auth.current_user()
+        user = self.current_user
 
-        # Get the requested user(s) objects.
-        users = self.get_users()
+        # Only query the columns returned to the User's role.
+        self.only = self.ADMIN_FIELDS if user.is_admin else self.USER_FIELDS
+
+        # Get the requested user(s) rows.
+        try:
+            users = self.get_users()
+        except PaginationError as err:
+            return bad_request(str(err))
 
         # Return 404 if user not found using /#
         if users is None:
@@ -62,9 +76,12 @@ class RetrieveHandler(Handler):
         :return: User data.
         """
         # Gather only certain data to return.
-        data = UserSchema(only=("id", "email", "username", "role_name", "last_login"), many=self.many).jsonify(users)
+        serializer = UserSerializer.get(only=self.ADMIN_FIELDS, many=self.many)
+
+        if self.streaming:
+            return serializer.stream(users, current_app.config["USERS_STREAM_BATCH_SIZE"])
 
-        return make_response(data, 200)
+        return self.paginated(serializer.jsonify(users))
 
     def handle_user(self, users):
         """
@@ -73,28 +90,39 @@ class RetrieveHandler(Handler):
         :param users: The users to gather data on.
         :return: User data.
         """
-        data = UserSchema(only=("id", "username", "last_login"), many=self.many).jsonify(users)
+        serializer = UserSerializer.get(only=self.USER_FIELDS, many=self.many)
+
+        if self.streaming:
+            return serializer.stream(users, current_app.config["USERS_STREAM_BATCH_SIZE"])
 
-        return make_response(data, 200)
+        return self.paginated(serializer.jsonify(users))
 
-    @staticmethod
-    def handle_me():
+    def handle_me(self):
         """
         Handles the common /me endpoint for both ADMIN and USER roles.
 
         :return: Returns data on the current signed in User.
         """
         # Get current User object.
-        user = auth.current_user()
+        user = self.current_user
 
         # Convert the current User object into json.
-        data = UserSchema(only=("id", "username", "email", "last_login",)).jsonify(user)
+        return UserSerializer.get(only=("id", "username", "email", "last_login",)).jsonify(user)
+
+    def query(self):
+        """
+        Returns a query for only the columns needed by the requested fields.
 
-        return make_response(data, 200)
+        Rows are returned instead of User entities, skipping the unused columns, the identity map and
+        the "password_hash" entirely. Queries run on the read-only session, off the primary's pool.
+
+        :return: A projected User query.
+        """
+        return read_db.session.query(*UserSchema.columns_for(self.only))
 
     def get_users(self):
         """
-        Helper method to get User object(s) depending on if an id
+        Helper method to get User row(s) depending on if an id
         is passed or not.
 
         :return: A list or a single user.
@@ -106,20 +134,43 @@ class RetrieveHandler(Handler):
 
     def get_single_user(self):
         """
-        Returns a single user object keyed on the id requested.
+        Returns a single user row keyed on the id requested.
 
         Returns None if ID does not match a DB row.
 
-        :return: A User object or None.
+        :return: A User row or None.
         """
         # Query for a single user.
-        return User.query.get(self.id)
+        return self.query().filter(User.id == self.id).first()
 
     def get_all_users(self):
         """
-        Gathers all users in the Database.
+        Gathers a page of users in the Database, see KeysetPage for the "limit", "sort" and "cursor" arguments.
 
-        :return: A list of all users in the Database.
+        With the "stream" argument set the full listing is returned as a query, streamed in batches.
+
+        :return: A list of users in the Database, or a query over all of them when streaming.
         """
         self.many = True
-        return User.query.all()
+
+        if request.args.get("stream", "").lower() in ("1", "true"):
+            self.streaming = True
+            return self.query().order_by(User.id)
+
+        self.page = KeysetPage.from_request()
+
+        return self.page.apply(self.query())
+
+    def paginated(self, response):
+        """
+        Adds the next page link to a listing response.
+
+        :param response: The response object.
+        :return: The response object.
+        """
+        link = self.page.link_header() if self.page is not None else None
+
+        if link is not None:
+            response.headers["Link"] = link
+
+        return response
@@ -4,10 +4,16 @@ Date:       16 May 2021
 """
 
 import logging
+from collections import defaultdict
+from functools import partial
+from typing import Any, Dict, List, Tuple
 
-from flask import make_response
+from flask import current_app, make_response, request
+from marshmallow import ValidationError, fields
+from sqlalchemy import bindparam
+from sqlalchemy.engine import Connection
 
-from app import db
+from app import db, hasher, json_provider, roles, writer
 from app.models.user import User
 from app.api.authentication import auth, Access
 from app.api.errors import bad_request, not_found
@@ -24,6 +30,10 @@ class UpdateHandler(Handler):
         """
         Handles administrator role updates.
         """
+        # PUT /api/v1/users updates a batch of users.
+        if self.id is None:
+            return self.update_many(only=("username", "password", "role_id"))
+
         # Get the user to update.
         user = User.query.filter_by(id=self.id).first()
 
@@ -37,7 +47,7 @@ class UpdateHandler(Handler):
         """
         Handles user role updates
         """
-        user: User = auth.current_user()
+        user: User = self.current_user_model
 
         return self.update(user, only=("username", "password"))
 
@@ -55,21 +65,191 @@ class UpdateHandler(Handler):
         if data is None:
             return bad_request("Malformed request data.")
 
-        update = False
-
         # Update username and/or password.
-        for key in only:
-            if data.get(key) is not None:
-                logger.debug(f"{key} - Updated.")
-                setattr(user, key, data.get(key))
-                update = True
+        values = {key: data.get(key) for key in only if data.get(key) is not None}
+        logger.debug(f"{', '.join(values)} - Updated.")
 
         # If the request didn't contain any updatable fields, send back error.
-        if not update:
+        if not values:
             return bad_request(f"Bad request data - Only {only} user fields can be updated.")
 
+        # The schema's "role_id" is dump only, deserialize and check it here as in "update_many".
+        if "role_id" in values:
+            values["role_id"] = UpdateHandler._load_role_id(values["role_id"])
+
+            if not UpdateHandler._is_role_id(values["role_id"]):
+                return bad_request("Unknown role_id.")
+
+        if "password" in values:
+            values["password_hash"] = hasher.hash(values.pop("password"))
+
         # Commit changes to database
-        db.session.add(user)
-        db.session.commit()
+        writer.execute(partial(update_users, {user.id: values}))
+        Handler.forget_users([user.id])
 
         return make_response("", 204)
+
+    @staticmethod
+    def update_many(only: tuple):
+        """
+        Updates a batch of users in one transaction.
+
+        The request body is a JSON list of objects with an "id" and any of the "only" fields. Items are validated
+        independently, items sharing the same set of fields are applied with a single executemany UPDATE and the
+        new passwords are hashed in parallel.
+
+        :param only: The fields that can be altered by the update.
+        :return: A list with a result per item, in request order: {"id", "status"} plus a "message" on failure.
+        """
+        try:
+            items = json_provider.loads(request.data)
+        except ValueError:
+            return bad_request("Malformed request data.")
+
+        if not isinstance(items, list) or not items:
+            return bad_request("Request data must be a non-empty list of users.")
+
+        max_items = current_app.config["USERS_BATCH_MAX_ITEMS"]
+
+        if len(items) > max_items:
+            return bad_request(f"At most {max_items} users can be updated per request.")
+
+        try:
+            data, errors = UserSchema(only=("id",) + only).load(items, many=True), {}
+        except ValidationError as err:
+            data, errors = err.valid_data, err.messages
+
+        results: List[Dict[str, Any]] = []
+        updates: Dict[int, Dict[str, Any]] = {}
+
+        for index, item in enumerate(data):
+            user_id = item.get("id")
+
+            # The schema's "role_id" is dump only, deserialize it here so "2" is accepted like an id of "2".
+            if item.get("role_id") is not None:
+                item["role_id"] = UpdateHandler._load_role_id(item["role_id"])
+
+            result = {"id": user_id, "status": 200}
+            results.append(result)
+
+            error = UpdateHandler._item_error(item, errors.get(index), only)
+            if error is None and user_id in updates:
+                error = "Duplicate id."
+
+            if error is not None:
+                result.update(status=400, message=error)
+                continue
+
+            updates[user_id] = {key: item[key] for key in only if item.get(key) is not None}
+
+        # Check the Users exist with a single query.
+        existing = {user_id for user_id, in db.session.query(User.id).filter(User.id.in_(list(updates)))}
+
+        for result in results:
+            if result["status"] == 200 and result["id"] not in existing:
+                result.update(status=404, message="User does not exist.")
+                del updates[result["id"]]
+
+        UpdateHandler._apply(updates)
+
+        return json_provider.response(results, 200)
+
+    @staticmethod
+    def _item_error(item: Dict[str, Any], errors: Dict[str, List[str]], only: tuple) -> str:
+        """
+        Checks a single batch update item.
+
+        :param item: The deserialized item.
+        :param errors: The schema validation errors for the item.
+        :param only: The fields that can be altered by the update.
+        :return: An error message, None if the item is valid.
+        """
+        if errors:
+            return "; ".join(f"{key}: {' '.join(map(str, value))}" for key, value in errors.items())
+
+        if not isinstance(item.get("id"), int):
+            return "An integer id is required."
+
+        if not any(item.get(key) is not None for key in only):
+            return f"Only {only} user fields can be updated."
+
+        if item.get("role_id") is not None and not UpdateHandler._is_role_id(item["role_id"]):
+            return "Unknown role_id."
+
+        return None
+
+    @staticmethod
+    def _load_role_id(value: Any) -> Any:
+        """
+        Deserializes a role id from an update request.
+
+        :param value: The role id from the request.
+        :return: The role id as an integer, or the value unchanged if it is not an integer.
+        """
+        # JSON true/false would otherwise be loaded as 1/0.
+        if isinstance(value, bool):
+            return value
+
+        try:
+            return fields.Integer().deserialize(value)
+        except ValidationError:
+            return value
+
+    @staticmethod
+    def _is_role_id(value: Any) -> bool:
+        """
+        Check if a deserialized role id is the integer id of a known role.
+
+        :param value: The deserialized role id.
+        :return: True if the role exists, else False.
+        """
+        return isinstance(value, int) and not isinstance(value, bool) and roles.name(value) is not None
+
+    @staticmethod
+    def _apply(updates: Dict[int, Dict[str, Any]]) -> None:
+        """
+        Hashes the new passwords and writes the batch updates in one transaction.
+
+        :param updates: The new field values keyed by User id.
+        """
+        if not updates:
+            return
+
+        with_password = [user_id for user_id, values in updates.items() if "password" in values]
+        hashes = hasher.hash_many([updates[user_id]["password"] for user_id in with_password])
+
+        for user_id, password_hash in zip(with_password, hashes):
+            del updates[user_id]["password"]
+            updates[user_id]["password_hash"] = password_hash
+
+        statements = writer.execute(partial(update_users, updates))
+        Handler.forget_users(updates)
+
+        logger.debug(f"Batch updated {len(updates)} user(s) with {statements} statement(s).")
+
+
+def update_users(updates: Dict[int, Dict[str, Any]], connection: Connection) -> int:
+    """
+    Write job updating users, one executemany UPDATE per set of updated columns.
+
+    Every updatable column is carried by tokens, so the credential epoch is bumped as in "before_update".
+
+    :param updates: The new column values keyed by User id.
+    :param connection: The write connection.
+    :return: The number of UPDATE statements executed.
+    """
+    groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = defaultdict(list)
+
+    for user_id, values in updates.items():
+        groups[tuple(sorted(values))].append({"_id": user_id, **{f"_{key}": value for key, value in values.items()}})
+
+    table = User.__table__
+
+    for columns, params in groups.items():
+        statement = (table.update()
+                     .where(table.c.id == bindparam("_id"))
+                     .values({**{key: bindparam(f"_{key}") for key in columns},
+                              "credential_epoch": table.c.credential_epoch + 1}))
+        connection.execute(statement, params)
+
+    return len(groups)
@@ -5,11 +5,14 @@ Date:       14 May 2021
 
 import logging
 from datetime import datetime
+from functools import partial
 
-from flask import make_response, request
+from flask import request
 from flask_restful import Resource
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm.attributes import set_committed_value
 
-from app import db
+from app import json_provider, last_logins, writer
 from app.models.user import User
 from app.api.errors import bad_request
 from app.api.v1.schema import UserSchema
@@ -34,19 +37,37 @@ class LoginApiV1(Resource):
         # Unpack request.
         data = UserSchema(only=("email", "password")).parse_request(as_ns=True)
 
-        # Create new User object from request body to check Database against.
-        current_user = User.query.filter_by(email=data.email).first()
+        # Load the User with a single query, the loaded row is reused for the token.
+        current_user = User.user_from_email(data.email)
 
         # User does not exist, return a 400 error.
-        if not current_user or not current_user.already_exists:
+        if current_user is None:
             logger.error("Bad Request - User does not have an account.")
             return bad_request("Login error.")
 
         logger.info(f"User {current_user.id} logged in.")
 
-        current_user.last_login = datetime.now().replace(microsecond=0)
+        last_login = datetime.now().replace(microsecond=0)
 
-        db.session.add(current_user)
-        db.session.commit()
+        # Update the loaded User without marking it as changed. The token is issued before the write, its commit
+        # expires the loaded User and would reload it.
+        set_committed_value(current_user, "last_login", last_login)
+        token = current_user.generate_auth_token()
 
-        return make_response(current_user.generate_auth_token(), 200)
+        # Written by the write-behind buffer when enabled, else straight away.
+        if not last_logins.record(current_user.id, last_login):
+            writer.execute(partial(update_last_login, current_user.id, last_login))
+
+        return json_provider.response(token, 200)
+
+
+def update_last_login(user_id: int, last_login: datetime, connection: Connection) -> None:
+    """
+    Write job storing a user's last login time.
+
+    :param user_id: The User id.
+    :param last_login: The login time.
+    :param connection: The write connection.
+    """
+    table = User.__table__
+    connection.execute(table.update().where(table.c.id == user_id).values(last_login=last_login))
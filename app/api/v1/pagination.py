@@ -0,0 +1,177 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from flask import current_app, request
+from itsdangerous import URLSafeSerializer, BadSignature
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+
+class PaginationError(ValueError):
+    """Raised when the pagination parameters of a request are invalid."""
+    pass
+
+
+class KeysetPage:
+    # Sortable columns, paired with a parser to restore their cursor values.
+    SORT_KEYS = {
+        "id": int,
+        "last_login": datetime.fromisoformat,
+        "username": str,
+    }
+
+    def __init__(self, limit: int, sort: str = "id", descending: bool = False, after: Tuple[Any, int] = None):
+        """
+        Keyset (cursor) pagination over the users table.
+
+        Rows are ordered by the sort key with the id as a tie-breaker, the next page starts strictly after the
+        last (key, id) pair returned, so each page is an index range scan regardless of how deep it is.
+
+        :param limit: The number of Users per page.
+        :param sort: The column to sort on, one of SORT_KEYS.
+        :param descending: Sort in descending order.
+        :param after: The (key, id) pair of the last User on the previous page.
+        """
+        self.limit = limit
+        self.sort = sort
+        self.descending = descending
+        self.after = after
+        self.next_cursor: Optional[str] = None
+
+    @classmethod
+    def from_request(cls) -> "KeysetPage":
+        """
+        Factory method to create a KeysetPage from the "limit", "sort" and "cursor" request arguments.
+
+        :return: A KeysetPage object.
+        :raises PaginationError: If an argument is invalid.
+        """
+        config = current_app.config
+
+        try:
+            limit = int(request.args.get("limit", config["USERS_PAGE_SIZE"]))
+        except ValueError:
+            raise PaginationError("limit must be an integer.")
+
+        if limit < 1:
+            raise PaginationError("limit must be greater than 0.")
+
+        # Enforce the maximum page size.
+        limit = min(limit, config["USERS_MAX_PAGE_SIZE"])
+
+        cursor = request.args.get("cursor")
+
+        if cursor:
+            return cls(limit=limit, **cls.decode_cursor(cursor))
+
+        sort = request.args.get("sort", "id")
+        descending = sort.startswith("-")
+        sort = sort.lstrip("-")
+
+        if sort not in cls.SORT_KEYS:
+            raise PaginationError(f"sort must be one of {', '.join(cls.SORT_KEYS)}.")
+
+        return cls(limit=limit, sort=sort, descending=descending)
+
+    def apply(self, query: Query) -> List[Any]:
+        """
+        Fetches a page of User rows, setting "next_cursor" if more Users follow.
+
+        :param query: The User query to paginate, entities or projected rows.
+        :return: The User rows on this page, the sort key and id must be selected.
+        """
+        column = getattr(User, self.sort)
+
+        if self.after is not None:
+            query = query.filter(self._after_clause(column, *self.after))
+
+        if self.descending:
+            query = query.order_by(column.desc(), User.id.desc())
+        else:
+            query = query.order_by(column.asc(), User.id.asc())
+
+        # Fetch one extra row to find out if there is a next page.
+        users = query.limit(self.limit + 1).all()
+
+        if len(users) > self.limit:
+            users = users[:self.limit]
+            last = users[-1]
+            self.next_cursor = self.encode_cursor(getattr(last, self.sort), last.id)
+
+        return users
+
+    def link_header(self) -> Optional[str]:
+        """
+        Returns the "Link" header pointing to the next page, None on the last page.
+        """
+        if self.next_cursor is None:
+            return None
+
+        return f'<{request.base_url}?{urlencode({"limit": self.limit, "cursor": self.next_cursor})}>; rel="next"'
+
+    def encode_cursor(self, value: Any, user_id: int) -> str:
+        """
+        Encodes the position after a User as an opaque, signed cursor.
+
+        :param value: The User's sort key value.
+        :param user_id: The User's id.
+        :return: The cursor string.
+        """
+        if isinstance(value, datetime):
+            value = value.isoformat()
+
+        return self._serializer().dumps({"s": self.sort, "d": self.descending, "k": [value, user_id]})
+
+    @classmethod
+    def decode_cursor(cls, cursor: str) -> Dict[str, Any]:
+        """
+        Decodes a cursor created by "encode_cursor".
+
+        :param cursor: The cursor string supplied by the client.
+        :return: The sort, descending and after arguments for a KeysetPage.
+        :raises PaginationError: If the cursor is invalid.
+        """
+        try:
+            data = cls._serializer().loads(cursor)
+            sort = data["s"]
+            value, user_id = data["k"]
+
+            if value is not None:
+                value = cls.SORT_KEYS[sort](value)
+
+            return dict(sort=sort, descending=bool(data["d"]), after=(value, int(user_id)))
+        except (BadSignature, KeyError, TypeError, ValueError):
+            raise PaginationError("Invalid cursor.")
+
+    @staticmethod
+    def _serializer() -> URLSafeSerializer:
+        """Returns the serializer used to sign cursors."""
+        return URLSafeSerializer(current_app.config["SECRET_KEY"], salt="users-cursor")
+
+    def _after_clause(self, column, value: Any, user_id: int):
+        """
+        Builds the keyset condition for rows strictly after (value, user_id).
+
+        SQLite sorts NULLs first ascending and last descending, a NULL sort key is handled explicitly.
+        """
+        if self.descending:
+            if value is None:
+                return and_(column.is_(None), User.id < user_id)
+
+            return or_(column < value, and_(column == value, User.id < user_id), column.is_(None))
+
+        if value is None:
+            return or_(and_(column.is_(None), User.id > user_id), column.isnot(None))
+
+        return or_(column > value, and_(column == value, User.id > user_id))
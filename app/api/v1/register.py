@@ -4,12 +4,15 @@ Date:       14 May 2021
 """
 
 import logging
+from functools import partial
+from typing import Any, Dict
 
-from flask import make_response
 from flask_restful import Resource
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import IntegrityError
 
-from app import db
-from app.models.user import User
+from app import json_provider, email_filter, writer
+from app.models.user import User, new_credential_epoch
 from app.api.errors import bad_request
 from app.api.utils import UserUtils
 from app.api.authentication import verify_admin_password
@@ -31,25 +34,41 @@ class RegisterApiV1(Resource):
         # Unpack request.
         data = UserSchema(only=("email", "password")).parse_request()
 
-        # Check if user is an admin.
-        is_admin = verify_admin_password(data.get("admin_password"))
+        # Check if user is an admin, only when an admin password was sent.
+        is_admin = "admin_password" in data and verify_admin_password(data["admin_password"])
 
-        # Create new User object from request body to check Database against.
+        # Create new User object from request body.
         new_user: User = UserUtils.create_user_from(data, is_admin=is_admin)
 
-        # User already exists, return a 400 error.
-        if new_user.already_exists:
+        new_user.credential_epoch = new_credential_epoch()
+        values = {key: value for key, value in new_user.as_snapshot().items() if key != "id"}
+
+        # Add new user to database with a single INSERT, the unique index on email rejects existing accounts.
+        try:
+            new_user.id = writer.execute(partial(insert_user, values))
+        except IntegrityError:
             logger.error("Registration error.")
             # Send back ambiguous message for security.
             return bad_request("Registration failed.")
 
-        # Add new user to database.
-        db.session.add(new_user)
-        db.session.commit()
+        # The Core INSERT bypasses the session listener which adds flushed emails.
+        email_filter.add(new_user.email)
+        token = new_user.generate_auth_token()
 
         if is_admin:
             logger.info("New admin created.")
         else:
             logger.info("New user created.")
 
-        return make_response(new_user.generate_auth_token(), 201)
+        return json_provider.response(token, 201)
+
+
+def insert_user(values: Dict[str, Any], connection: Connection) -> int:
+    """
+    Write job inserting a new user.
+
+    :param values: The new User's column values.
+    :param connection: The write connection.
+    :return: The new User's id.
+    """
+    return connection.execute(User.__table__.insert().values(**values)).inserted_primary_key[0]
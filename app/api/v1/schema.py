@@ -4,17 +4,20 @@ Date:       16 May 2021
 """
 
 import logging
-import json
 from json.decoder import JSONDecodeError
-from typing import List, Dict, Union
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Dict, Optional, Tuple, Union
 from types import SimpleNamespace
 from datetime import datetime
 from dataclasses import dataclass
 
-from flask import jsonify, request
-from marshmallow import fields, validate, ValidationError, INCLUDE
+from flask import request, Response, stream_with_context
+from marshmallow import fields, validate, ValidationError, INCLUDE, missing
+from sqlalchemy import Column
+from sqlalchemy.orm import Query
 
-from app import ma
+from app import ma, roles, json_provider
 from app.models import User
 
 logger = logging.getLogger(__name__)
@@ -50,27 +53,45 @@ class UserSchema(ma.SQLAlchemySchema):
     role_id = fields.Method("init_role_id")
     role_name = fields.Method("init_role_name")
 
+    @staticmethod
+    def columns_for(only: Iterable[str]) -> List[Column]:
+        """
+        Maps schema fields to the User columns needed to dump them, the id is always included.
+
+        :param only: The schema fields to be dumped.
+        :return: A list of User columns.
+        """
+        columns = [User.id]
+
+        for name in only:
+            column = User.role_id if name in ("role", "role_id", "role_name") else getattr(User, name)
+
+            if column not in columns:
+                columns.append(column)
+
+        return columns
+
     def init_role_id(self, obj):
         """Initialisation method to set the role id from a User object."""
         if isinstance(obj, dict):
             return obj["role_id"]
         else:
-            return obj.role.id
+            return obj.role_id
 
     def init_role_name(self, obj):
         """Initialisation method to set the role name from a User object."""
         if isinstance(obj, dict):
             return obj["role_name"]
         else:
-            return obj.role.name
+            return roles.name(obj.role_id)
 
-    def jsonify(self, data) -> str:
+    def jsonify(self, data) -> Response:
         """
-        Return the dumped object(s) as a json string.
+        Return the dumped object(s) as a json response, encoded by the configured JSON backend.
 
-        :return: User object(s) as a JSON string.
+        :return: User object(s) as a JSON response.
         """
-        return jsonify(self.dump(data))
+        return json_provider.response(self.dump(data))
 
     @classmethod
     def parse_request(cls, *, index: str = None, many: bool = False, only: tuple = None, as_ns=False) -> Union[dict, UserDescriptor, List[UserDescriptor]]:
@@ -104,7 +125,7 @@ class UserSchema(ma.SQLAlchemySchema):
         if not data:
             try:
                 # Get the request data as a dictionary.
-                data = json.loads(request.data)
+                data = json_provider.loads(request.data)
             except JSONDecodeError:
                 return None
 
@@ -140,3 +161,169 @@ class UserSchema(ma.SQLAlchemySchema):
         errors = {list(item.keys())[0]: list(item.values())[0] for item in errors}
 
         return errors
+
+
+class UserSerializer:
+
+    def __init__(self, only: Optional[Tuple[str, ...]] = None, many: bool = False):
+        """
+        Compiled UserSchema serializer, output is identical to "UserSchema(only, many).dump".
+
+        The schema's fields are resolved once into a plan of (key, attribute, formatter), common field types are
+        formatted directly instead of through marshmallow's per-field dispatch. Responses use a second plan leaving
+        datetimes for the JSON backend to encode natively. Use "UserSerializer.get" to share one serializer per
+        (only, many) combination.
+
+        :param only: Whitelist of attributes to return.
+        :param many: Flag to denote more than one User to dump.
+        """
+        self.only = only
+        self.many = many
+        self.schema = UserSchema(only=only, many=many)
+        self._plan = [self._compile(name, field) for name, field in self.schema.dump_fields.items()]
+        self._native_plan = [self._compile(name, field, native=True) for name, field in self.schema.dump_fields.items()]
+
+    @staticmethod
+    def get(only: Iterable[str] = None, many: bool = False) -> "UserSerializer":
+        """
+        Returns the cached serializer for a set of fields.
+
+        :param only: Whitelist of attributes to return.
+        :param many: Flag to denote more than one User to dump.
+        :return: A UserSerializer object.
+        """
+        return _cached_serializer(tuple(only) if only is not None else None, many)
+
+    def dump(self, data: Any, native: bool = False) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Serializes User object(s) or row(s).
+
+        :param data: A User object or row, or a list of them when "many" is set.
+        :param native: Leave datetimes for the JSON backend to encode instead of converting them to strings.
+        :return: The serialized User(s).
+        """
+        plan = self._native_plan if native else self._plan
+
+        if self.many:
+            return [self._dump_one(obj, plan) for obj in data]
+
+        return self._dump_one(data, plan)
+
+    def jsonify(self, data: Any, status: int = 200) -> Response:
+        """
+        Return the dumped object(s) as a json response, encoded by the configured JSON backend.
+
+        :param data: A User object or row, or a list of them when "many" is set.
+        :param status: The response status code.
+        :return: User object(s) as a JSON response.
+        """
+        return json_provider.response(self.dump(data, native=True), status)
+
+    def stream(self, query: Query, batch_size: int) -> Response:
+        """
+        Return the Users of a query as a streamed JSON array.
+
+        Rows are fetched and serialized "batch_size" at a time, peak memory is bounded by the batch
+        size instead of the number of rows.
+
+        :param query: The User query to stream.
+        :param batch_size: The number of rows fetched and serialized per chunk.
+        :return: A streamed JSON response.
+        """
+        plan = self._native_plan
+        dumps = json_provider.dumps
+
+        def generate() -> Iterator[bytes]:
+            yield b"["
+
+            separator = b""
+            for batch in chunked(query.yield_per(batch_size), batch_size):
+                yield separator + b",".join(dumps(self._dump_one(obj, plan)) for obj in batch)
+                separator = b","
+
+            yield b"]"
+
+        return Response(stream_with_context(generate()), mimetype="application/json")
+
+    @staticmethod
+    def _dump_one(obj: Any, plan: List[Tuple[str, Optional[str], Callable[[Any], Any]]]) -> Dict[str, Any]:
+        """Serializes a single User object or row through a field plan."""
+        result = {}
+        is_dict = isinstance(obj, dict)
+
+        for key, attribute, formatter in plan:
+            if attribute is None:
+                value = formatter(obj)
+            else:
+                value = obj.get(attribute, missing) if is_dict else getattr(obj, attribute, missing)
+
+                if value is not None and value is not missing:
+                    value = formatter(value)
+
+            if value is not missing:
+                result[key] = value
+
+        return result
+
+    def _compile(self, name: str, field: fields.Field,
+                 native: bool = False) -> Tuple[str, Optional[str], Callable[[Any], Any]]:
+        """
+        Builds the plan entry for a schema field.
+
+        :param name: The field name.
+        :param field: The marshmallow field.
+        :param native: Pass datetimes through unconverted, for the JSON backend to encode.
+        :return: The output key, the attribute to read and the function formatting its value. With no
+                 attribute the function is passed the whole object and returns the value or "missing".
+        """
+        key = field.data_key or name
+
+        if isinstance(field, fields.Method):
+            return key, None, getattr(self.schema, field.serialize_method_name)
+
+        formatter = _FORMATTERS.get((type(field), getattr(field, "format", None) or "iso"))
+
+        if native and formatter is datetime.isoformat:
+            formatter = _passthrough
+
+        if formatter is None or getattr(field, "as_string", False):
+            # Uncommon fields fall back to marshmallow.
+            return key, None, lambda obj: field.serialize(name, obj, accessor=self.schema.get_attribute)
+
+        return key, field.attribute or name, formatter
+
+
+# Direct formatters matching marshmallow's serialization, keyed on (field type, format).
+_FORMATTERS = {
+    (fields.Integer, "iso"): int,
+    (fields.String, "iso"): str,
+    (fields.DateTime, "iso"): datetime.isoformat,
+    (fields.DateTime, "iso8601"): datetime.isoformat,
+}
+
+
+def _passthrough(value: Any) -> Any:
+    """Returns a value unchanged, for types the JSON backend encodes natively."""
+    return value
+
+
+@lru_cache(maxsize=None)
+def _cached_serializer(only: Optional[Tuple[str, ...]], many: bool) -> UserSerializer:
+    """Creates one UserSerializer per (only, many) combination."""
+    return UserSerializer(only=only, many=many)
+
+
+def chunked(iterable: Iterable, size: int) -> Iterator[list]:
+    """
+    Splits an iterable into lists of up to "size" items.
+
+    :param iterable: The iterable to split.
+    :param size: The maximum number of items per list.
+    :return: A generator of lists.
+    """
+    iterator = iter(iterable)
+    batch = list(islice(iterator, size))
+
+    while batch:
+        yield batch
+        batch = list(islice(iterator, size))
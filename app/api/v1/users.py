@@ -38,11 +38,12 @@ class UsersApiV1(Resource):
         """
         return DeleteHandler(id=id).handle()
 
-    def put(self, id: int):
+    def put(self, id: int = None):
         """
-        Deletes one or more users from the database.
+        Updates one or more users in the database.
 
-        :return 200: User update was successful.
+        :return 200: Batch update (Admin only), returns a result per user.
+        :return 204: User update was successful.
         :return 401: Authentication failed.
         :return 404: User not found in database (Admin single user updates only).
         """
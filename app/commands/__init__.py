@@ -0,0 +1,19 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+from flask import Flask
+
+from .hashing import hashing_cli
+from .users import users_cli
+
+
+def register_commands(app: Flask) -> None:
+    """
+    Registers the application's Flask CLI command groups.
+
+    :param app: The Flask object.
+    """
+    app.cli.add_command(hashing_cli)
+    app.cli.add_command(users_cli)
@@ -0,0 +1,50 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import logging
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+from app.common.hashing import calibrate
+
+logger = logging.getLogger(__name__)
+
+hashing_cli = AppGroup("hashing", help="Password hashing tools.")
+
+# Default PBKDF2 iteration counts measured during calibration.
+CANDIDATES = "50000,100000,150000,200000,260000,320000,400000,600000,800000,1000000"
+
+
+@hashing_cli.command("calibrate")
+@click.option("--target-p99", type=float, default=None,
+              help="Target p99 verification latency in ms. Default: PASSWORD_HASH_TARGET_P99_MS.")
+@click.option("--samples", type=int, default=20, show_default=True,
+              help="Verifications timed per iteration count.")
+@click.option("--candidates", default=CANDIDATES, show_default=True,
+              help="Comma separated PBKDF2 iteration counts to measure.")
+def calibrate_command(target_p99: float, samples: int, candidates: str):
+    """Measures verification latency on this host and suggests the highest hash cost within the target p99."""
+    method = current_app.config["PASSWORD_HASH_METHOD"]
+    target_p99 = target_p99 or current_app.config["PASSWORD_HASH_TARGET_P99_MS"]
+
+    if not method.startswith("pbkdf2:"):
+        raise click.UsageError(f"Calibration is only supported for PBKDF2 methods, not '{method}'.")
+
+    results = calibrate(method, [int(item) for item in candidates.split(",")], samples=samples)
+
+    click.echo(f"{'iterations':>12} {'p50 (ms)':>10} {'p99 (ms)':>10}")
+    for result in results:
+        click.echo(f"{result.iterations:>12} {result.p50_ms:>10.2f} {result.p99_ms:>10.2f}")
+
+    within_target = [result for result in results if result.p99_ms <= target_p99]
+
+    if not within_target:
+        click.echo(f"No iteration count meets the {target_p99}ms p99 target.")
+        return
+
+    click.echo(f"Suggested for a {target_p99}ms p99 target: "
+               f"PASSWORD_HASH_ITERATIONS = {max(result.iterations for result in within_target)}")
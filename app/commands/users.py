@@ -0,0 +1,235 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import csv
+import logging
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from functools import partial
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from werkzeug.security import generate_password_hash
+
+from app import db, hasher, json_provider, roles
+from app.models import User
+from app.models.user import new_credential_epoch
+
+logger = logging.getLogger(__name__)
+
+users_cli = AppGroup("users", help="User account tools.")
+
+
+@dataclass
+class ImportProgress:
+    """Counters for a user import, saved as the checkpoint after each committed batch."""
+    path: str
+    records: int = 0
+    inserted: int = 0
+    skipped: int = 0
+    invalid: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns dictionary representation of object, useful for logging/JSON encoding."""
+        return asdict(self)
+
+
+class _InlineExecutor:
+    """Runs "map" on the calling thread, used when no hashing workers are configured."""
+
+    @staticmethod
+    def map(func, *iterables, chunksize: int = 1):
+        return map(func, *iterables)
+
+
+class UserImporter:
+
+    def __init__(self, path: str, batch_size: int, workers: int, checkpoint: str = None):
+        """
+        Bulk imports users from a CSV or NDJSON file.
+
+        Records are streamed from disk in batches, passwords are hashed across a process pool and each batch
+        is written with a single executemany INSERT and commit. Progress is saved to a checkpoint file after
+        every batch so an interrupted import resumes after the last committed batch.
+
+        Each record needs an "email" and "password", "username" and "role" (a role name) are optional.
+        Existing emails are skipped.
+
+        :param path: The CSV (.csv) or NDJSON file to import.
+        :param batch_size: The number of records inserted per transaction.
+        :param workers: The number of hashing processes, 0 hashes on the calling thread.
+        :param checkpoint: The checkpoint file. Default: "<path>.checkpoint".
+        """
+        self.path = os.path.abspath(path)
+        self.batch_size = batch_size
+        self.workers = workers
+        self.checkpoint = checkpoint or f"{path}.checkpoint"
+        self.method = hasher.method
+        self.progress = ImportProgress(path=self.path)
+
+    def resume(self) -> bool:
+        """
+        Loads the checkpoint for this file, if one exists.
+
+        :return: True if a checkpoint was loaded.
+        """
+        if not os.path.exists(self.checkpoint):
+            return False
+
+        with open(self.checkpoint, "rb") as fh:
+            saved = ImportProgress(**json_provider.loads(fh.read()))
+
+        if saved.path != self.path:
+            raise click.UsageError(f"Checkpoint {self.checkpoint} belongs to {saved.path}.")
+
+        self.progress = saved
+        return True
+
+    def run(self, report=None) -> ImportProgress:
+        """
+        Imports the remaining records.
+
+        :param report: Called with the progress and elapsed seconds after each batch.
+        :return: The final progress counters.
+        """
+        start = time.perf_counter()
+        records = islice(self.read(), self.progress.records, None)
+
+        with self._executor() as executor:
+            while True:
+                batch = list(islice(records, self.batch_size))
+
+                if not batch:
+                    break
+
+                self._import_batch(batch, executor)
+                self._save_checkpoint()
+
+                if report is not None:
+                    report(self.progress, time.perf_counter() - start)
+
+        # The import completed, a checkpoint would skip the whole file next time.
+        if os.path.exists(self.checkpoint):
+            os.remove(self.checkpoint)
+
+        return self.progress
+
+    def read(self) -> Iterator[Dict[str, Any]]:
+        """Streams the records from the import file."""
+        with open(self.path, newline="", encoding="utf8") as fh:
+            if self.path.lower().endswith(".csv"):
+                yield from csv.DictReader(fh)
+            else:
+                for line in fh:
+                    if line.strip():
+                        yield json_provider.loads(line)
+
+    def _import_batch(self, batch: List[Dict[str, Any]], executor) -> None:
+        """Hashes and inserts a batch of records in one transaction."""
+        valid = []
+
+        for offset, record in enumerate(batch, start=self.progress.records + 1):
+            row = self._row_from(record)
+
+            if row is None:
+                logger.warning(f"Skipping invalid record {offset}.")
+                self.progress.invalid += 1
+            else:
+                valid.append(row)
+
+        passwords = [row.pop("password") for row in valid]
+        hashes = executor.map(partial(generate_password_hash, method=self.method), passwords,
+                              chunksize=max(len(passwords) // (self.workers * 4 or 1), 1))
+
+        for row, password_hash in zip(valid, hashes):
+            row["password_hash"] = password_hash
+
+        inserted = 0
+        if valid:
+            # Existing emails are ignored rather than failing the whole batch.
+            statement = User.__table__.insert().prefix_with("OR IGNORE", dialect="sqlite")
+            inserted = db.session.execute(statement, valid).rowcount
+            db.session.commit()
+
+        self.progress.records += len(batch)
+        self.progress.inserted += inserted
+        self.progress.skipped += len(valid) - inserted
+
+    @staticmethod
+    def _row_from(record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Maps an import record to a users table row.
+
+        :param record: The record read from the import file.
+        :return: The row values, None if the record is invalid.
+        """
+        email = (record.get("email") or "").strip()
+        password = record.get("password")
+        role_id = roles.id(record.get("role") or "user")
+
+        if "@" not in email or not password or role_id is None:
+            return None
+
+        return {
+            "email": email,
+            "username": record.get("username") or None,
+            "password": password,
+            "role_id": role_id,
+            "last_login": None,
+            "credential_epoch": new_credential_epoch(),
+        }
+
+    def _save_checkpoint(self) -> None:
+        """Atomically writes the progress counters to the checkpoint file."""
+        tmp = f"{self.checkpoint}.tmp"
+
+        with open(tmp, "wb") as fh:
+            fh.write(json_provider.dumps(self.progress.as_dict()))
+
+        os.replace(tmp, self.checkpoint)
+
+    @contextmanager
+    def _executor(self) -> Iterator[Executor]:
+        """Yields the executor used to hash passwords."""
+        if not self.workers:
+            yield _InlineExecutor()
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            yield executor
+
+
+@users_cli.command("import")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--batch-size", type=int, default=None,
+              help="Records inserted per transaction. Default: USERS_IMPORT_BATCH_SIZE.")
+@click.option("--workers", type=int, default=None,
+              help="Password hashing processes, 0 hashes in this process. Default: CPU count.")
+@click.option("--checkpoint", default=None, help="Checkpoint file. Default: <PATH>.checkpoint.")
+@click.option("--restart", is_flag=True, help="Ignore an existing checkpoint and start from the first record.")
+def import_command(path: str, batch_size: int, workers: Optional[int], checkpoint: str, restart: bool):
+    """Imports users from a CSV or NDJSON file, resuming from the last checkpoint if interrupted."""
+    importer = UserImporter(path,
+                            batch_size=batch_size or current_app.config["USERS_IMPORT_BATCH_SIZE"],
+                            workers=(os.cpu_count() or 1) if workers is None else workers,
+                            checkpoint=checkpoint)
+
+    if not restart and importer.resume():
+        click.echo(f"Resuming after record {importer.progress.records}.")
+
+    def report(progress: ImportProgress, seconds: float) -> None:
+        click.echo(f"{progress.records} records, {progress.inserted} inserted, {progress.skipped} skipped, "
+                   f"{progress.invalid} invalid, {progress.records / seconds if seconds else 0:.0f} records/s")
+
+    progress = importer.run(report=report)
+
+    click.echo(f"Import complete: {progress.inserted} inserted, {progress.skipped} skipped, "
+               f"{progress.invalid} invalid.")
@@ -0,0 +1,209 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from threading import Condition, Lock
+from typing import Dict, Hashable, Iterator
+
+from flask import Flask
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request is shed by the admission controller."""
+    pass
+
+
+@dataclass
+class AdmissionStats:
+    """Counters for the admission controller."""
+    admitted: int = 0
+    queued: int = 0
+    shed: int = 0
+    in_flight: int = 0
+    waiting: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        """Returns dictionary representation of object, useful for logging/JSON encoding."""
+        return asdict(self)
+
+
+class TokenBucket:
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Token bucket rate limiter, starts full.
+
+        :param rate: Tokens added per second.
+        :param capacity: Maximum number of tokens held (burst size).
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def take(self) -> bool:
+        """
+        Takes a token from the bucket, if one is available.
+
+        :return: True if a token was taken, else False.
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+        if self.tokens < 1:
+            return False
+
+        self.tokens -= 1
+        return True
+
+
+class RateLimiter:
+
+    def __init__(self, rate: float, capacity: float, maxsize: int = 10000):
+        """
+        Keyed collection of token buckets, the least recently used bucket is dropped when full.
+
+        :param rate: Tokens added per second to each bucket.
+        :param capacity: Burst size of each bucket.
+        :param maxsize: Maximum number of buckets tracked.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.maxsize = maxsize
+        self._buckets: "OrderedDict[Hashable, TokenBucket]" = OrderedDict()
+        self._lock = Lock()
+
+    def allow(self, key: Hashable) -> bool:
+        """
+        Takes a token from the bucket for the key.
+
+        :param key: The key to rate limit on.
+        :return: True if the request is allowed, else False.
+        """
+        with self._lock:
+            bucket = self._buckets.get(key)
+
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(self.rate, self.capacity)
+
+                if len(self._buckets) > self.maxsize:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+
+            return bucket.take()
+
+
+class AdmissionController:
+
+    def __init__(self, app: Flask = None):
+        """
+        Admission control for expensive credential verification.
+
+        Per-email and per-client token buckets shed floods before any hashing runs, and a bounded
+        concurrency gate caps the number of verifications running at once with a bounded wait queue.
+
+        :param app: The Flask object.
+        """
+        self.enabled = False
+        self.max_concurrent = 1
+        self.queue_size = 0
+        self.queue_timeout = 0.0
+        self._email_limiter = None
+        self._client_limiter = None
+        self._condition = Condition()
+        self._stats = AdmissionStats()
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Initialises the controller from the application configuration.
+
+        :param app: The Flask object.
+        """
+        self.enabled = app.config["ADMISSION_ENABLED"]
+        self.max_concurrent = app.config["ADMISSION_MAX_CONCURRENT"]
+        self.queue_size = app.config["ADMISSION_QUEUE_SIZE"]
+        self.queue_timeout = app.config["ADMISSION_QUEUE_TIMEOUT"]
+        self._email_limiter = RateLimiter(app.config["ADMISSION_EMAIL_RATE"], app.config["ADMISSION_EMAIL_BURST"])
+        self._client_limiter = RateLimiter(app.config["ADMISSION_CLIENT_RATE"], app.config["ADMISSION_CLIENT_BURST"])
+        self._stats = AdmissionStats()
+
+        logger.debug(f"Admission control enabled: {self.enabled}")
+
+    @contextmanager
+    def admit(self, email: str, client: str) -> Iterator[None]:
+        """
+        Context manager guarding a credential verification.
+
+        :param email: The email the credentials are for.
+        :param client: The client identifier, e.g. the remote address.
+        :raises AdmissionRejected: If a rate limit is exceeded or the wait queue is full.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        if not self._email_limiter.allow(email):
+            self._shed("Rate limit exceeded for email.")
+        if not self._client_limiter.allow(client):
+            self._shed(f"Rate limit exceeded for client {client}.")
+
+        self._acquire()
+        try:
+            yield
+        finally:
+            self._release()
+
+    @property
+    def stats(self) -> AdmissionStats:
+        """Returns a snapshot of the admission counters."""
+        with self._condition:
+            return AdmissionStats(**asdict(self._stats))
+
+    def _acquire(self) -> None:
+        """Takes a verification slot, waiting in the bounded queue if all slots are busy."""
+        with self._condition:
+            if self._stats.in_flight >= self.max_concurrent:
+                if self._stats.waiting >= self.queue_size:
+                    self._shed("Verification queue full.")
+
+                self._stats.queued += 1
+                self._stats.waiting += 1
+                try:
+                    admitted = self._condition.wait_for(lambda: self._stats.in_flight < self.max_concurrent,
+                                                        timeout=self.queue_timeout)
+                finally:
+                    self._stats.waiting -= 1
+
+                if not admitted:
+                    self._shed("Timed out waiting for a verification slot.")
+
+            self._stats.in_flight += 1
+            self._stats.admitted += 1
+
+    def _release(self) -> None:
+        """Returns a verification slot and wakes the next waiter."""
+        with self._condition:
+            self._stats.in_flight -= 1
+            self._condition.notify()
+
+    def _shed(self, reason: str) -> None:
+        """Counts and rejects a request."""
+        # Condition uses a re-entrant lock, safe to call while holding it.
+        with self._condition:
+            self._stats.shed += 1
+
+        logger.warning(f"Credential verification shed: {reason}")
+        raise AdmissionRejected(reason)
@@ -0,0 +1,313 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import logging
+import math
+import os
+import time
+from dataclasses import dataclass, asdict
+from hashlib import blake2b
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from flask import Flask
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import scoped_session
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BloomStats:
+    """Sizing and occupancy statistics for a Bloom filter."""
+    count: int
+    capacity: int
+    error_rate: float
+    bits: int
+    hashes: int
+    memory_bytes: int
+    estimated_error_rate: float
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns dictionary representation of object, useful for logging/JSON encoding."""
+        return asdict(self)
+
+
+class BloomFilter:
+
+    def __init__(self, capacity: int, error_rate: float):
+        """
+        Fixed size Bloom filter, answers "definitely absent" or "possibly present" with no false negatives.
+
+        Bit positions are derived from a keyed BLAKE2b digest using double hashing, the key is random per
+        filter so clients cannot craft values that collide.
+
+        :param capacity: The number of items the filter is sized for.
+        :param error_rate: The target false positive rate at capacity, e.g. 0.01.
+        """
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1.")
+
+        self.capacity = max(int(capacity), 1)
+        self.error_rate = error_rate
+        self.bits = max(int(math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2)), 8)
+        self.hashes = max(int(round(self.bits / self.capacity * math.log(2))), 1)
+        self.count = 0
+        self._array = bytearray((self.bits + 7) // 8)
+        self._key = os.urandom(16)
+
+    def add(self, item: str) -> None:
+        """
+        Adds an item to the filter.
+
+        :param item: The item to add.
+        """
+        for position in self._positions(item):
+            self._array[position >> 3] |= 1 << (position & 7)
+
+        self.count += 1
+
+    def update(self, items: Iterable[str]) -> None:
+        """
+        Adds a number of items to the filter.
+
+        :param items: The items to add.
+        """
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: str) -> bool:
+        """Check if an item is possibly in the filter, False means it was definitely never added."""
+        return all(self._array[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    @property
+    def memory_bytes(self) -> int:
+        """Returns the size of the bit array in bytes."""
+        return len(self._array)
+
+    @property
+    def stats(self) -> BloomStats:
+        """Returns the filter sizing and its estimated false positive rate at the current count."""
+        estimated = (1 - math.exp(-self.hashes * self.count / self.bits)) ** self.hashes
+
+        return BloomStats(count=self.count, capacity=self.capacity, error_rate=self.error_rate, bits=self.bits,
+                          hashes=self.hashes, memory_bytes=self.memory_bytes, estimated_error_rate=estimated)
+
+    def _positions(self, item: str) -> Iterator[int]:
+        """Yields the bit positions for an item."""
+        digest = blake2b(item.encode("utf8"), digest_size=16, key=self._key).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.bits
+
+
+class EmailFilter:
+
+    def __init__(self, app: Flask = None):
+        """
+        Negative lookup filter of registered User emails, lets lookups for unknown emails skip the database.
+
+        New emails are added as they are flushed. A Bloom filter cannot remove items, deleted emails stay as
+        false positives until the filter is rebuilt, which happens once deletes pass EMAIL_FILTER_REBUILD_RATIO
+        of the entries, the filter grows past its capacity or it is older than EMAIL_FILTER_REBUILD_INTERVAL.
+
+        Users written by other processes, e.g. other workers or "flask users import", are picked up before a
+        negative answer: at most once per EMAIL_FILTER_REFRESH seconds, Users with an id above the highest one
+        seen are loaded with a single indexed query. A User registered elsewhere is rejected for at most
+        EMAIL_FILTER_REFRESH seconds. Ids reused after another process deletes the newest Users are only seen
+        by the next full rebuild.
+
+        :param app: The Flask object.
+        """
+        self.enabled = False
+        self.capacity = 1
+        self.error_rate = 0.01
+        self.rebuild_ratio = 0.25
+        self.refresh = 5.0
+        self.rebuild_interval = 600.0
+        self._filter: Optional[BloomFilter] = None
+        self._stale = 0
+        self._added: List[str] = []
+        self._watermark: Optional[int] = None
+        self._built = 0.0
+        self._checked = 0.0
+        self._lookup: Optional[Callable[[Optional[int]], Iterable[Tuple[int, str]]]] = None
+        self._model = None
+        self._lock = Lock()
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Initialises the filter from the application configuration.
+
+        :param app: The Flask object.
+        """
+        self.enabled = app.config["EMAIL_FILTER_ENABLED"]
+        self.capacity = app.config["EMAIL_FILTER_CAPACITY"]
+        self.error_rate = app.config["EMAIL_FILTER_ERROR_RATE"]
+        self.rebuild_ratio = app.config["EMAIL_FILTER_REBUILD_RATIO"]
+        self.refresh = app.config["EMAIL_FILTER_REFRESH"]
+        self.rebuild_interval = app.config["EMAIL_FILTER_REBUILD_INTERVAL"]
+        self._filter = None
+        self._stale = 0
+        self._added = []
+        self._watermark = None
+
+        logger.debug(f"Email filter enabled: {self.enabled}")
+
+    def watch(self, session: scoped_session, model: type) -> None:
+        """
+        Registers the database lookup used to rebuild the filter and the session listeners keeping it current.
+
+        :param session: The session to load emails with and listen to.
+        :param model: The User model class.
+        """
+        def lookup(after: Optional[int] = None) -> Iterable[Tuple[int, str]]:
+            query = session.query(model.id, model.email)
+            if after is not None:
+                query = query.filter(model.id > after)
+            return query.order_by(model.id).yield_per(1000)
+
+        self._lookup = lookup
+        self._model = model
+
+        if not event.contains(session, "after_flush", self._on_flush):
+            event.listen(session, "after_flush", self._on_flush)
+            event.listen(session, "after_bulk_delete", self._on_bulk_delete)
+
+    def rebuild(self) -> None:
+        """Rebuilds the filter from the emails in the database, requires an application context."""
+        if not self.enabled or self._lookup is None:
+            return
+
+        with self._lock:
+            rows = list(self._lookup())
+            emails = [email for _, email in rows if email]
+            bloom = BloomFilter(max(self.capacity, 2 * (len(emails) + len(self._added))), self.error_rate)
+            bloom.update(emails)
+            # Emails flushed by transactions the lookup could not see yet must not become false negatives.
+            bloom.update(self._added)
+
+            self._filter = bloom
+            self._stale = 0
+            self._added = []
+            self._watermark = rows[-1][0] if rows else None
+            self._built = self._checked = time.monotonic()
+
+        logger.info(f"Email filter built: {bloom.stats.as_dict()}")
+
+    def might_contain(self, email: str) -> bool:
+        """
+        Check if an email may belong to a registered User.
+
+        :param email: The email to check.
+        :return: False if the email is definitely not registered, else True.
+        """
+        if not self.enabled or email is None:
+            return True
+
+        if self._needs_rebuild():
+            self.rebuild()
+
+        bloom = self._filter
+
+        if bloom is None or email in bloom:
+            return True
+
+        # Only trust a negative once Users added by other processes have been loaded.
+        return self._catch_up() and email in self._filter
+
+    def _catch_up(self) -> bool:
+        """
+        Adds the Users written since the last build or catch-up, at most once per EMAIL_FILTER_REFRESH.
+
+        :return: True if new emails were added.
+        """
+        now = time.monotonic()
+
+        if self._lookup is None or now - self._checked < self.refresh:
+            return False
+
+        self._checked = now
+        rows = list(self._lookup(self._watermark))
+
+        if not rows:
+            return False
+
+        with self._lock:
+            _ = [self._filter.add(email) for _, email in rows if email]
+            self._watermark = max(rows[-1][0], self._watermark if self._watermark is not None else rows[-1][0])
+
+        logger.debug(f"Email filter caught up on {len(rows)} User(s) written elsewhere.")
+
+        return True
+
+    @property
+    def stats(self) -> Optional[BloomStats]:
+        """Returns the current filter statistics, None if not built."""
+        return self._filter.stats if self._filter is not None else None
+
+    def add(self, email: str) -> None:
+        """
+        Adds an email written outside of the session listeners, e.g. by a Core INSERT.
+
+        The email is also recorded for the next rebuild.
+
+        :param email: The registered email.
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            if not email:
+                return
+
+            if self._filter is not None:
+                self._filter.add(email)
+
+            self._added.append(email)
+
+    def discard(self, n: int = 1) -> None:
+        """
+        Records emails deleted outside of the session listeners, they are dropped on the next rebuild.
+
+        :param n: The number of deleted emails.
+        """
+        self._stale += n
+
+    def _needs_rebuild(self) -> bool:
+        """Check if the filter is missing, over capacity or holds too many deleted emails."""
+        bloom = self._filter
+
+        if bloom is None:
+            return self._lookup is not None
+
+        return (bloom.count > bloom.capacity or self._stale > bloom.count * self.rebuild_ratio
+                or time.monotonic() - self._built > self.rebuild_interval)
+
+    def _on_flush(self, session, flush_context) -> None:
+        """Session "after_flush" listener, adds new or changed emails and counts deleted ones."""
+        if not self.enabled:
+            return
+
+        for obj in session.new:
+            if isinstance(obj, self._model):
+                self.add(obj.email)
+
+        # Only changed emails, last login updates must not grow the filter.
+        for obj in session.dirty:
+            if isinstance(obj, self._model):
+                _ = [self.add(email) for email in inspect(obj).attrs.email.history.added]
+
+        self.discard(sum(1 for obj in session.deleted if isinstance(obj, self._model)))
+
+    def _on_bulk_delete(self, delete_context) -> None:
+        """Session "after_bulk_delete" listener, counts the deleted emails."""
+        if self.enabled and getattr(delete_context.mapper, "class_", None) is self._model:
+            self.discard(max(delete_context.result.rowcount, 0))
@@ -0,0 +1,326 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import hmac
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from hashlib import sha256
+from itertools import chain
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from flask import Flask
+from sqlalchemy import event
+from sqlalchemy.orm import scoped_session
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    """Hit/Miss/Eviction counters for a cache instance."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+    maxsize: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        """Returns dictionary representation of object, useful for logging/JSON encoding."""
+        return asdict(self)
+
+
+class LRUCache:
+
+    def __init__(self, maxsize: int = 1024, ttl: float = None):
+        """
+        Thread-safe, bounded least-recently-used cache with an optional time-to-live per entry.
+
+        :param maxsize: The maximum number of entries held before the least recently used is evicted.
+        :param ttl: The default lifetime of an entry in seconds, None to never expire.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = Lock()
+        self._stats = CacheStats(maxsize=maxsize)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the value stored for the key, if present and not expired.
+
+        :param key: The key to lookup.
+        :param default: The value to return on a cache miss.
+        :return: The cached value or the default.
+        """
+        with self._lock:
+            expires_at, value = self._data.get(key, (None, _MISSING))
+
+            if value is not _MISSING and expires_at is not None and expires_at <= time.monotonic():
+                # Expired entries count as a miss.
+                del self._data[key]
+                value = _MISSING
+
+            if value is _MISSING:
+                self._stats.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self._stats.hits += 1
+
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float = None) -> None:
+        """
+        Stores a value in the cache, evicting the least recently used entry if full.
+
+        :param key: The key to store the value against.
+        :param value: The value to store.
+        :param ttl: Lifetime of this entry in seconds, defaults to the cache ttl.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = None if ttl is None else time.monotonic() + ttl
+
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._stats.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Removes and returns the value stored for the key."""
+        with self._lock:
+            return self._data.pop(key, (None, default))[1]
+
+    def discard_where(self, predicate: Callable[[Any], bool]) -> int:
+        """
+        Removes all entries whose value matches the predicate.
+
+        :param predicate: Callable returning True for values to drop.
+        :return: The number of entries removed.
+        """
+        with self._lock:
+            keys = [key for key, (_, value) in self._data.items() if predicate(value)]
+            _ = [self._data.pop(key) for key in keys]
+
+        return len(keys)
+
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        with self._lock:
+            self._data.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Returns a snapshot of the cache statistics."""
+        with self._lock:
+            return CacheStats(**{**asdict(self._stats), "size": len(self._data)})
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class CredentialCache:
+
+    def __init__(self, app: Flask = None):
+        """
+        Cache of successful password verifications, used to skip the PBKDF2 work for repeat Basic auth requests.
+
+        Entries are keyed on a keyed HMAC of the email, password and stored password hash, so no plaintext is held
+        and entries go stale by themselves when the stored password hash changes.
+
+        :param app: The Flask object.
+        """
+        self.enabled = False
+        self._secret = b""
+        self._cache = LRUCache()
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Initialises the cache from the application configuration.
+
+        :param app: The Flask object.
+        """
+        self.enabled = app.config["CREDENTIAL_CACHE_ENABLED"]
+        self._secret = (app.config["SECRET_KEY"] or "").encode("utf8")
+        self._cache = LRUCache(maxsize=app.config["CREDENTIAL_CACHE_SIZE"], ttl=app.config["CREDENTIAL_CACHE_TTL"])
+
+        logger.debug(f"Credential cache enabled: {self.enabled}")
+
+    def key(self, email: str, password: str, password_hash: str) -> bytes:
+        """
+        Derives the cache key for a set of credentials.
+
+        :param email: The user's email.
+        :param password: The plain-text password supplied by the client.
+        :param password_hash: The password hash currently stored for the user.
+        :return: A HMAC-SHA256 digest of the credentials.
+        """
+        message = "\0".join([email or "", password or "", password_hash or ""]).encode("utf8")
+
+        return hmac.new(self._secret, message, sha256).digest()
+
+    def verify(self, email: str, password: str, password_hash: str, verifier: Callable[[], bool]) -> bool:
+        """
+        Verifies a set of credentials, only calling the verifier on a cache miss.
+
+        Only successful verifications are cached.
+
+        :param email: The user's email.
+        :param password: The plain-text password supplied by the client.
+        :param password_hash: The password hash currently stored for the user.
+        :param verifier: Callable to run the full password verification.
+        :return: True if the credentials are valid, else False.
+        """
+        if not self.enabled:
+            return verifier()
+
+        key = self.key(email, password, password_hash)
+
+        if self._cache.get(key, False):
+            return True
+
+        verified = verifier()
+
+        if verified:
+            self._cache.set(key, True)
+
+        return verified
+
+    def clear(self) -> None:
+        """Removes all cached verifications."""
+        self._cache.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Returns the hit/miss/eviction statistics for the cache."""
+        return self._cache.stats
+
+
+@dataclass
+class TokenEntry:
+    """A decoded Bearer token and a snapshot of the identified User's columns (None for stateless tokens)."""
+    claims: Dict[str, Any]
+    user: Optional[Dict[str, Any]]
+
+
+class TokenCache:
+
+    def __init__(self, app: Flask = None):
+        """
+        Cache of decoded Bearer tokens keyed on the raw token string.
+
+        Entries hold a snapshot of the identified User's columns, repeat requests with the same token skip the
+        signature verification and the User lookup. Entries live for at most TOKEN_CACHE_TTL seconds, or until
+        the token expires if sooner, and are dropped straight away when a User is changed by this process. A
+        password change, demotion or deletion by another process is seen within TOKEN_CACHE_TTL seconds.
+
+        :param app: The Flask object.
+        """
+        self.enabled = False
+        self.ttl = 5.0
+        self._cache = LRUCache()
+        self._model = None
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Initialises the cache from the application configuration.
+
+        :param app: The Flask object.
+        """
+        self.enabled = app.config["TOKEN_CACHE_ENABLED"]
+        self.ttl = app.config["TOKEN_CACHE_TTL"]
+        self._cache = LRUCache(maxsize=app.config["TOKEN_CACHE_SIZE"])
+
+        logger.debug(f"Token cache enabled: {self.enabled}")
+
+    def watch(self, session: scoped_session, model: type) -> None:
+        """
+        Registers session event listeners to drop cached identities when a User is updated or deleted.
+
+        :param session: The session (or session factory) to listen on.
+        :param model: The User model class.
+        """
+        self._model = model
+
+        if not event.contains(session, "after_flush", self._on_flush):
+            event.listen(session, "after_flush", self._on_flush)
+            event.listen(session, "do_orm_execute", self._on_orm_execute)
+
+    def get(self, token: str) -> Optional[TokenEntry]:
+        """
+        Returns the cached entry for the token, if present and not expired.
+
+        :param token: The raw token supplied by the client.
+        :return: A TokenEntry object or None.
+        """
+        if not self.enabled:
+            return None
+
+        return self._cache.get(token)
+
+    def set(self, token: str, claims: Dict[str, Any], user: Optional[Dict[str, Any]], expires_at: float) -> None:
+        """
+        Stores a decoded token for TOKEN_CACHE_TTL seconds, or until its expiry time if sooner.
+
+        :param token: The raw token supplied by the client.
+        :param claims: The decoded token claims.
+        :param user: A snapshot of the identified User's columns.
+        :param expires_at: The token's expiry as a UNIX timestamp.
+        """
+        ttl = min(expires_at - time.time(), self.ttl)
+
+        if not self.enabled or ttl <= 0:
+            return
+
+        self._cache.set(token, TokenEntry(claims=claims, user=user), ttl=ttl)
+
+    def discard_users(self, ids: set) -> int:
+        """
+        Drops all cached tokens for the given User ids.
+
+        :param ids: The User ids to drop.
+        :return: The number of tokens dropped.
+        """
+        return self._cache.discard_where(lambda entry: entry.claims.get("id") in ids)
+
+    def clear(self) -> None:
+        """Removes all cached tokens."""
+        self._cache.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Returns the hit/miss/eviction statistics for the cache."""
+        return self._cache.stats
+
+    def _on_flush(self, session, flush_context) -> None:
+        """Session "after_flush" listener, drops tokens of updated or deleted Users."""
+        ids = {obj.id for obj in chain(session.dirty, session.deleted) if isinstance(obj, self._model)}
+
+        if ids and self.discard_users(ids):
+            logger.debug(f"Dropped cached tokens for {len(ids)} user(s).")
+
+    def _on_orm_execute(self, orm_execute_state) -> None:
+        """Session "do_orm_execute" listener, bulk User updates/deletes drop the whole cache."""
+        if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+            return
+
+        mapper = orm_execute_state.bind_mapper
+
+        if mapper is not None and mapper.class_ is self._model:
+            self.clear()
+            logger.debug("Dropped all cached tokens after bulk user change.")
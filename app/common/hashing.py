@@ -0,0 +1,250 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import logging
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from functools import partial
+from threading import BoundedSemaphore, Lock
+from typing import Any, Callable, Dict, List, Sequence
+
+from flask import Flask
+from werkzeug.security import generate_password_hash, check_password_hash
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HashingStats:
+    """Queue depth and latency statistics for the hashing service."""
+    submitted: int = 0
+    completed: int = 0
+    queue_depth: int = 0
+    last_latency_ms: float = 0.0
+    mean_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns dictionary representation of object, useful for logging/JSON encoding."""
+        return asdict(self)
+
+
+class HashingService:
+
+    def __init__(self, app: Flask = None):
+        """
+        Password hashing service, runs the deliberately slow hash functions in a process pool so they
+        do not hold the request thread's GIL.
+
+        With PASSWORD_HASH_WORKERS set to 0 hashing runs synchronously on the calling thread.
+
+        :param app: The Flask object.
+        """
+        self.workers = 0
+        self.queue_size = 0
+        self.method = "pbkdf2:sha256"
+        self._pool = None
+        self._slots = None
+        self._lock = Lock()
+        self._stats = HashingStats()
+        self._total_latency_ms = 0.0
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Initialises the service from the application configuration.
+
+        :param app: The Flask object.
+        """
+        self.shutdown()
+
+        self.method = hash_method(app.config["PASSWORD_HASH_METHOD"], app.config["PASSWORD_HASH_ITERATIONS"])
+        self.workers = app.config["PASSWORD_HASH_WORKERS"]
+        self.queue_size = app.config["PASSWORD_HASH_QUEUE_SIZE"]
+        self._slots = BoundedSemaphore(self.workers + self.queue_size) if self.workers else None
+
+        logger.debug(f"Password hashing method: {self.method}, workers: {self.workers or 'synchronous'}")
+
+    def hash(self, password: str) -> str:
+        """
+        Generates a salted hash of a plain-text password.
+
+        :param password: The password to hash.
+        :return: The salted password hash.
+        """
+        return self._run(generate_password_hash, password, self.method)
+
+    def hash_many(self, passwords: Sequence[str]) -> List[str]:
+        """
+        Generates salted hashes for a number of plain-text passwords, spread across the process pool.
+
+        The batch holds a single queue slot while it runs, callers should bound its size.
+
+        :param passwords: The passwords to hash.
+        :return: The salted password hashes, in the order of the passwords.
+        """
+        if not self.workers or len(passwords) < 2:
+            return [self.hash(password) for password in passwords]
+
+        start = time.perf_counter()
+
+        with self._slots:
+            self._record(queued=True)
+            try:
+                chunksize = max(len(passwords) // (self.workers * 4), 1)
+                return list(self._get_pool().map(partial(generate_password_hash, method=self.method), passwords,
+                                                 chunksize=chunksize))
+            finally:
+                self._record(queued=False, latency=time.perf_counter() - start)
+
+    def verify(self, password_hash: str, password: str) -> bool:
+        """
+        Verifies a plain-text password against a salted hash.
+
+        :param password_hash: The stored password hash.
+        :param password: The password to verify.
+        :return: True if the password matches, else False.
+        """
+        return self._run(check_password_hash, password_hash, password)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """
+        Check if a stored hash was made with a different method or cost than currently configured.
+
+        :param password_hash: The stored password hash.
+        :return: True if the hash should be regenerated with the current method.
+        """
+        return (password_hash or "").split("$", 1)[0] != self.method
+
+    def shutdown(self) -> None:
+        """Stops the process pool, if running."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    @property
+    def stats(self) -> HashingStats:
+        """Returns a snapshot of the service statistics."""
+        with self._lock:
+            return HashingStats(**asdict(self._stats))
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Returns the process pool, started lazily so it is created after any worker process fork."""
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+
+            return self._pool
+
+    def _run(self, func: Callable, *args) -> Any:
+        """
+        Runs a hash function in the process pool, or synchronously if no workers are configured.
+
+        Blocks while the pool and its queue are full.
+
+        :param func: The hash function to run.
+        :param args: The arguments to the hash function.
+        :return: The result of the hash function.
+        """
+        start = time.perf_counter()
+
+        if not self.workers:
+            self._record(queued=True)
+            try:
+                return func(*args)
+            finally:
+                self._record(queued=False, latency=time.perf_counter() - start)
+
+        with self._slots:
+            self._record(queued=True)
+            try:
+                return self._get_pool().submit(func, *args).result()
+            finally:
+                self._record(queued=False, latency=time.perf_counter() - start)
+
+    def _record(self, queued: bool, latency: float = 0.0) -> None:
+        """Updates the queue depth and latency statistics."""
+        with self._lock:
+            if queued:
+                self._stats.submitted += 1
+                self._stats.queue_depth += 1
+                return
+
+            latency_ms = latency * 1000
+            self._stats.queue_depth -= 1
+            self._stats.completed += 1
+            self._stats.last_latency_ms = latency_ms
+            self._stats.max_latency_ms = max(self._stats.max_latency_ms, latency_ms)
+            self._total_latency_ms += latency_ms
+            self._stats.mean_latency_ms = self._total_latency_ms / self._stats.completed
+
+
+def hash_method(method: str, iterations: int = None) -> str:
+    """
+    Builds the werkzeug hash method string, including the iteration count for PBKDF2 methods.
+
+    :param method: The hash method, e.g. "pbkdf2:sha256".
+    :param iterations: The PBKDF2 iteration count.
+    :return: The method string, e.g. "pbkdf2:sha256:150000".
+    """
+    if method.startswith("pbkdf2:") and iterations and method.count(":") == 1:
+        return f"{method}:{iterations}"
+
+    return method
+
+
+@dataclass
+class CalibrationResult:
+    """Verification latency measured for a single hash cost."""
+    iterations: int
+    p50_ms: float
+    p99_ms: float
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """
+    Returns the nearest-rank percentile of a set of samples.
+
+    :param samples: The measured samples.
+    :param pct: The percentile to return, 0-100.
+    :return: The sample at the requested percentile.
+    """
+    ordered = sorted(samples)
+    rank = max(math.ceil(pct / 100 * len(ordered)) - 1, 0)
+
+    return ordered[rank]
+
+
+def calibrate(method: str, candidates: Sequence[int], samples: int = 20) -> List[CalibrationResult]:
+    """
+    Measures password verification latency on the current host for a range of PBKDF2 iteration counts.
+
+    :param method: The PBKDF2 hash method, e.g. "pbkdf2:sha256".
+    :param candidates: The iteration counts to measure.
+    :param samples: The number of verifications timed per iteration count.
+    :return: A CalibrationResult for each candidate.
+    """
+    results = []
+
+    for iterations in candidates:
+        password_hash = generate_password_hash("calibration", hash_method(method, iterations))
+
+        latencies = []
+        for _ in range(samples):
+            start = time.perf_counter()
+            check_password_hash(password_hash, "calibration")
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        results.append(CalibrationResult(iterations=iterations,
+                                         p50_ms=percentile(latencies, 50),
+                                         p99_ms=percentile(latencies, 99)))
+
+    return results
@@ -0,0 +1,151 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import json
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, Union
+
+from flask import Flask, Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency.
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _default(obj: Any) -> Any:
+    """Encodes types the JSON encoders do not handle natively."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class StdlibJSONBackend:
+    name = "stdlib"
+
+    def __init__(self, sort_keys: bool = True, ensure_ascii: bool = True):
+        """
+        JSON backend using the standard library "json" module, compact output matching Flask's "jsonify".
+
+        :param sort_keys: Sort object keys.
+        :param ensure_ascii: Escape non-ASCII characters.
+        """
+        self._encoder = json.JSONEncoder(sort_keys=sort_keys, ensure_ascii=ensure_ascii, separators=(",", ":"),
+                                         default=_default)
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encodes an object as JSON."""
+        return self._encoder.encode(obj).encode("utf8")
+
+    @staticmethod
+    def loads(data: Union[bytes, str]) -> Any:
+        """Decodes a JSON document."""
+        return json.loads(data)
+
+
+class OrjsonJSONBackend:
+    name = "orjson"
+
+    def __init__(self, sort_keys: bool = True, ensure_ascii: bool = True):
+        """
+        JSON backend using "orjson", encodes datetimes natively as ISO 8601.
+
+        orjson always writes UTF-8, "ensure_ascii" is not supported.
+
+        :param sort_keys: Sort object keys.
+        :param ensure_ascii: Ignored.
+        """
+        self._option = orjson.OPT_SORT_KEYS if sort_keys else 0
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encodes an object as JSON."""
+        return orjson.dumps(obj, default=_default, option=self._option)
+
+    @staticmethod
+    def loads(data: Union[bytes, str]) -> Any:
+        """Decodes a JSON document."""
+        return orjson.loads(data)
+
+
+BACKENDS = {
+    StdlibJSONBackend.name: StdlibJSONBackend,
+    OrjsonJSONBackend.name: OrjsonJSONBackend,
+}
+
+
+class JSONProvider:
+
+    def __init__(self, app: Flask = None):
+        """
+        Application wide JSON encoder for responses and request bodies.
+
+        JSON_BACKEND selects "orjson" or "stdlib", "auto" uses orjson when installed.
+
+        :param app: The Flask object.
+        """
+        self.backend = StdlibJSONBackend()
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Selects the JSON backend from the application configuration.
+
+        :param app: The Flask object.
+        """
+        name = app.config["JSON_BACKEND"]
+
+        if name == "auto":
+            name = OrjsonJSONBackend.name if orjson is not None else StdlibJSONBackend.name
+        elif name == OrjsonJSONBackend.name and orjson is None:
+            logger.warning("JSON_BACKEND is orjson but it is not installed, using stdlib.")
+            name = StdlibJSONBackend.name
+
+        if name not in BACKENDS:
+            raise ValueError(f"Unknown JSON_BACKEND '{name}', expected one of: auto, {', '.join(BACKENDS)}.")
+
+        self.backend = BACKENDS[name](sort_keys=app.config["JSON_SORT_KEYS"], ensure_ascii=app.config["JSON_AS_ASCII"])
+
+        logger.debug(f"JSON backend: {self.backend.name}")
+
+    @property
+    def name(self) -> str:
+        """The name of the active backend."""
+        return self.backend.name
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encodes an object as JSON.
+
+        :param obj: The object to encode.
+        :return: The UTF-8 encoded JSON document.
+        """
+        return self.backend.dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decodes a JSON document.
+
+        :param data: The JSON document.
+        :return: The decoded object.
+        :raises ValueError: If the document is not valid JSON.
+        """
+        return self.backend.loads(data)
+
+    def response(self, obj: Any, status: int = 200, headers: Dict[str, str] = None) -> Response:
+        """
+        Creates a JSON response, a drop in replacement for "jsonify".
+
+        :param obj: The object to encode.
+        :param status: The response status code.
+        :param headers: Additional response headers.
+        :return: A Flask response object with the "application/json" mimetype.
+        """
+        return Response(self.dumps(obj) + b"\n", status=status, headers=headers, mimetype="application/json")
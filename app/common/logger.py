@@ -5,24 +5,39 @@ Date:       13 May 2021
 
 import logging
 import logging.config
+from typing import Optional
 
-import yaml
 from colorama import Fore
 
 logger = logging.getLogger(__name__)
 
+# The configuration file logging was last initialised from.
+_config_file: Optional[str] = None
+
 
 def init_logger(config_file: str) -> None:
     """
     Initialised the logger from a configuration file.
 
+    Skipped if already initialised from the same file, creating further applications keeps the existing handlers.
+
     :param config_file: The path to the config file to initialise the logger with.
     """
+    global _config_file
+
+    if config_file == _config_file:
+        return
+
+    # Only needed once per process.
+    import yaml
+
     with open(config_file, "r") as fh:
         config = yaml.safe_load(fh.read())
 
         logging.config.dictConfig(config)
 
+    _config_file = config_file
+
 
 class ColorFormatter(logging.Formatter):
     """Adds colored output to logger."""
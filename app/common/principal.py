@@ -0,0 +1,195 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import chain
+from typing import Any, Dict, Optional, Tuple, Union
+
+from flask import Flask
+from sqlalchemy import event
+from sqlalchemy.orm import scoped_session
+
+from app.common.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+_REVOKED = -1
+
+
+@dataclass
+class Principal:
+    """
+    Lightweight stand-in for a User, built from stateless token claims without an ORM load.
+
+    :param id: The User's id.
+    :param username: The User's username when the token was issued.
+    :param email: The User's email when the token was issued.
+    :param last_login: The User's last login time when the token was issued.
+    :param role: The User's role name.
+    :param epoch: The User's credential epoch when the token was issued.
+    """
+    id: int
+    username: str
+    email: str
+    last_login: Optional[datetime]
+    role: str
+    epoch: int
+
+    @staticmethod
+    def claims_for(user: Any) -> Dict[str, Any]:
+        """
+        Returns the stateless claims to embed in a User's token.
+
+        :param user: The User object the token is issued for.
+        :return: A dictionary of token claims.
+        """
+        return {
+            "username": user.username,
+            "email": user.email,
+            "last_login": user.last_login.isoformat() if user.last_login else None,
+            "role": user.get_roles(),
+            "epoch": user.credential_epoch or 0
+        }
+
+    @staticmethod
+    def is_stateless(claims: Dict[str, Any]) -> bool:
+        """Check if a set of token claims carries the stateless role/epoch claims."""
+        return "role" in claims and "epoch" in claims
+
+    @classmethod
+    def from_claims(cls, claims: Dict[str, Any]) -> "Principal":
+        """
+        Factory method to create a Principal from a set of stateless token claims.
+
+        :param claims: The decoded token claims.
+        :return: A Principal object.
+        """
+        last_login = claims.get("last_login")
+
+        return cls(
+            id=claims["id"],
+            username=claims.get("username"),
+            email=claims.get("email"),
+            last_login=datetime.fromisoformat(last_login) if last_login else None,
+            role=claims["role"],
+            epoch=claims["epoch"]
+        )
+
+    def get_roles(self) -> Union[str, Tuple[str]]:
+        """Returns the Principal's role name."""
+        return self.role
+
+    @property
+    def is_admin(self) -> bool:
+        """Check if the Principal is an Admin User."""
+        return self.role == "admin"
+
+
+class EpochTable:
+
+    def __init__(self, app: Flask = None):
+        """
+        In-memory table of User credential epochs, used to revoke stateless tokens.
+
+        Entries are refreshed from the database with a single column primary key lookup once they are older than
+        TOKEN_EPOCH_REFRESH seconds, and dropped straight away when a User is changed by this process.
+
+        :param app: The Flask object.
+        """
+        self.enabled = False
+        self._epochs = LRUCache()
+        self._lookup = None
+        self._model = None
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Initialises the table from the application configuration.
+
+        :param app: The Flask object.
+        """
+        self.enabled = app.config["TOKEN_STATELESS"]
+        self._epochs = LRUCache(maxsize=app.config["TOKEN_EPOCH_TABLE_SIZE"], ttl=app.config["TOKEN_EPOCH_REFRESH"])
+
+        logger.debug(f"Stateless tokens enabled: {self.enabled}")
+
+    def watch(self, session: scoped_session, model: type) -> None:
+        """
+        Registers the database lookup and session listeners keeping the table current.
+
+        :param session: The session to run epoch lookups on and listen to.
+        :param model: The User model class.
+        """
+        self._lookup = lambda user_id: session.query(model.credential_epoch).filter(model.id == user_id).scalar()
+        self._model = model
+
+        if not event.contains(session, "after_flush", self._on_flush):
+            event.listen(session, "after_flush", self._on_flush)
+            event.listen(session, "do_orm_execute", self._on_orm_execute)
+
+    def current(self, user_id: int) -> Optional[int]:
+        """
+        Returns the current credential epoch for a User.
+
+        :param user_id: The User's id.
+        :return: The credential epoch, None if the User no longer exists.
+        """
+        epoch = self._epochs.get(user_id)
+
+        if epoch is None:
+            epoch = self._lookup(user_id)
+            self._epochs.set(user_id, _REVOKED if epoch is None else epoch)
+
+        return None if epoch == _REVOKED else epoch
+
+    def resolve(self, claims: Dict[str, Any]) -> Optional[Principal]:
+        """
+        Builds a Principal from stateless token claims if the token has not been revoked.
+
+        New Users start at a random epoch, so a User reusing a deleted User's id does not match its tokens.
+
+        :param claims: The decoded token claims.
+        :return: A Principal object or None if the User's credential epoch has moved on.
+        """
+        principal = Principal.from_claims(claims)
+
+        if self.current(principal.id) != principal.epoch:
+            logger.debug("Stateless token revoked.")
+            return None
+
+        return principal
+
+    def discard_users(self, ids: set) -> None:
+        """
+        Drops the epochs of Users changed outside of the session listeners, e.g. by a raw SQL statement.
+
+        :param ids: The User ids to drop.
+        """
+        for user_id in ids:
+            self._epochs.pop(user_id)
+
+    def clear(self) -> None:
+        """Removes all entries, forcing a refresh on next use."""
+        self._epochs.clear()
+
+    def _on_flush(self, session, flush_context) -> None:
+        """Session "after_flush" listener, drops the epochs of updated or deleted Users."""
+        for obj in chain(session.dirty, session.deleted):
+            if isinstance(obj, self._model):
+                self._epochs.pop(obj.id)
+
+    def _on_orm_execute(self, orm_execute_state) -> None:
+        """Session "do_orm_execute" listener, bulk User updates/deletes drop the whole table."""
+        if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+            return
+
+        mapper = orm_execute_state.bind_mapper
+
+        if mapper is not None and mapper.class_ is self._model:
+            self.clear()
@@ -0,0 +1,171 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import logging
+from dataclasses import dataclass, asdict
+from threading import Lock
+from typing import Any, Dict, Optional
+
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import scoped_session
+from sqlalchemy.pool import QueuePool
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PoolStats:
+    """Connection pool size and checkout statistics."""
+    size: Optional[int] = None
+    connections: int = 0
+    checked_out: int = 0
+    peak_checked_out: int = 0
+    checkouts: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns dictionary representation of object, useful for logging/JSON encoding."""
+        return asdict(self)
+
+
+class PoolMonitor:
+
+    def __init__(self, engine: Engine):
+        """
+        Counts the connections and checkouts of an engine's pool.
+
+        :param engine: The engine to monitor.
+        """
+        self._engine = engine
+        self._lock = Lock()
+        self._stats = PoolStats()
+
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "close", self._on_close)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+
+    @property
+    def stats(self) -> PoolStats:
+        """Returns a snapshot of the pool statistics."""
+        pool = self._engine.pool
+
+        with self._lock:
+            # Only sized pools (QueuePool) report a size.
+            size = pool.size() if callable(getattr(pool, "size", None)) else None
+
+            return PoolStats(**{**asdict(self._stats), "size": size})
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        """Pool "connect" listener, counts a new connection."""
+        with self._lock:
+            self._stats.connections += 1
+
+    def _on_close(self, dbapi_connection, connection_record) -> None:
+        """Pool "close" listener, counts a closed connection."""
+        with self._lock:
+            self._stats.connections -= 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        """Pool "checkout" listener, counts a connection taken from the pool."""
+        with self._lock:
+            self._stats.checkouts += 1
+            self._stats.checked_out += 1
+            self._stats.peak_checked_out = max(self._stats.peak_checked_out, self._stats.checked_out)
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        """Pool "checkin" listener, counts a connection returned to the pool."""
+        with self._lock:
+            self._stats.checked_out -= 1
+
+
+class ReadReplica:
+
+    def __init__(self, app: Flask = None):
+        """
+        Read-only engine and session for handlers that never write, with a pool separate from the primary's.
+
+        SQLALCHEMY_READ_DATABASE_URI selects the read database, e.g. a replica. When unset, a file SQLite
+        primary is reopened read-only ("mode=ro") and any other primary, such as an in-memory database,
+        is shared.
+
+        :param app: The Flask object.
+        """
+        self.url = None
+        self.pool_size = 10
+        self.max_overflow = 10
+        self.engine: Optional[Engine] = None
+        self.session: Optional[scoped_session] = None
+        self._monitors: Dict[str, PoolMonitor] = {}
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Initialises the read database settings from the application configuration.
+
+        :param app: The Flask object.
+        """
+        self.url = app.config["SQLALCHEMY_READ_DATABASE_URI"]
+        self.pool_size = app.config["SQLALCHEMY_READ_POOL_SIZE"]
+        self.max_overflow = app.config["SQLALCHEMY_READ_MAX_OVERFLOW"]
+        self.engine = None
+        self.session = None
+        self._monitors = {}
+
+        app.teardown_appcontext(self._teardown)
+
+    def bind(self, db: SQLAlchemy) -> None:
+        """
+        Creates the read engine and session, requires an application context.
+
+        :param db: The primary database.
+        """
+        primary = db.engine
+        url = self.url or read_only_url(primary.url)
+
+        self.engine = primary if url is None else create_engine(url, poolclass=QueuePool, pool_size=self.pool_size,
+                                                                max_overflow=self.max_overflow)
+        # Without "binds" the session would route every mapped table to the primary engine.
+        self.session = db.create_scoped_session(options={"bind": self.engine, "binds": {}})
+
+        self._monitors = {"primary": PoolMonitor(primary)}
+        if self.engine is not primary:
+            self._monitors["read"] = PoolMonitor(self.engine)
+
+        logger.debug(f"Read database: {self.engine.url if self.engine is not primary else 'primary'}")
+
+    @property
+    def separate(self) -> bool:
+        """Check if reads have their own engine."""
+        return "read" in self._monitors
+
+    @property
+    def stats(self) -> Dict[str, PoolStats]:
+        """Returns the statistics for each pool, "primary" and, when separate, "read"."""
+        return {name: monitor.stats for name, monitor in self._monitors.items()}
+
+    def _teardown(self, exception: Optional[BaseException]) -> None:
+        """Application context teardown, returns the read session's connection to its pool."""
+        if self.session is not None:
+            self.session.remove()
+
+
+def read_only_url(url) -> Optional[str]:
+    """
+    Builds a read-only URI for a file SQLite database.
+
+    :param url: The primary database URL.
+    :return: The read-only URI, None if the database cannot be reopened read-only.
+    """
+    url = make_url(url)
+
+    if url.get_backend_name() != "sqlite" or url.database in (None, "", ":memory:") or url.query.get("uri"):
+        return None
+
+    return f"sqlite:///file:{url.database}?mode=ro&uri=true"
@@ -0,0 +1,109 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import logging
+import time
+from threading import Lock
+from types import MappingProxyType
+from typing import Callable, Iterable, Mapping, Optional, Tuple
+
+from flask import Flask
+from sqlalchemy.orm import scoped_session
+
+logger = logging.getLogger(__name__)
+
+
+class RoleRegistry:
+
+    def __init__(self, app: Flask = None):
+        """
+        Process-wide, read-only mapping of role ids to role names.
+
+        The roles table only changes when seeded, so it is loaded once at startup and resolved in memory
+        rather than lazily loading a Role per User. An unknown role id or name triggers a reload, at most once
+        every "refresh" seconds so requests with bogus roles cannot force a query each.
+
+        :param app: The Flask object.
+        """
+        self.refresh = 60.0
+        self._names: Mapping[int, str] = MappingProxyType({})
+        self._ids: Mapping[str, int] = MappingProxyType({})
+        self._lookup: Optional[Callable[[], Iterable[Tuple[int, str]]]] = None
+        self._loaded = float("-inf")
+        self._lock = Lock()
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Clears any roles loaded for a previous application.
+
+        :param app: The Flask object.
+        """
+        self.refresh = app.config["ROLES_REFRESH"]
+        self._names = MappingProxyType({})
+        self._ids = MappingProxyType({})
+        self._loaded = float("-inf")
+
+    def load(self, session: scoped_session, model: type) -> None:
+        """
+        Registers the database lookup for the roles table and loads it.
+
+        :param session: The session to load roles with.
+        :param model: The Role model class.
+        """
+        self._lookup = lambda: session.query(model.id, model.name).all()
+        self.reload()
+
+    def reload(self, min_age: float = 0) -> None:
+        """
+        Reloads the roles from the database, requires an application context.
+
+        :param min_age: Skip the reload if the roles were loaded less than this many seconds ago.
+        """
+        if self._lookup is None:
+            return
+
+        with self._lock:
+            if time.monotonic() - self._loaded < min_age:
+                return
+
+            rows = self._lookup()
+            self._loaded = time.monotonic()
+            # Swap in new mappings, readers never see a partially built registry.
+            self._names = MappingProxyType({role_id: name for role_id, name in rows})
+            self._ids = MappingProxyType({name: role_id for role_id, name in rows})
+
+        logger.debug(f"Loaded roles: {dict(self._names)}")
+
+    def name(self, role_id: int) -> Optional[str]:
+        """
+        Resolves a role id to its name.
+
+        :param role_id: The role id.
+        :return: The role name, None if no such role exists.
+        """
+        if role_id is not None and role_id not in self._names:
+            self.reload(min_age=self.refresh)
+
+        return self._names.get(role_id)
+
+    def id(self, name: str) -> Optional[int]:
+        """
+        Resolves a role name to its id.
+
+        :param name: The role name.
+        :return: The role id, None if no such role exists.
+        """
+        if name is not None and name not in self._ids:
+            self.reload(min_age=self.refresh)
+
+        return self._ids.get(name)
+
+    @property
+    def names(self) -> Mapping[int, str]:
+        """Returns a read-only mapping of role ids to names."""
+        return self._names
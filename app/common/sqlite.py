@@ -0,0 +1,99 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import logging
+from typing import Any, Dict, Union
+
+from flask import Flask
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Pragmas that may be set from the configuration, values are interpolated so names are never taken from elsewhere.
+PRAGMAS = ("journal_mode", "synchronous", "cache_size", "mmap_size", "temp_store", "busy_timeout",
+           "wal_autocheckpoint", "foreign_keys")
+
+
+class SQLiteProfile:
+
+    def __init__(self, app: Flask = None):
+        """
+        Applies the SQLITE_PRAGMAS performance profile to every new SQLite connection.
+
+        WAL journaling lets readers run alongside a writer, and a busy timeout makes writers wait for the lock
+        instead of failing with "database is locked". Other databases are left untouched.
+
+        :param app: The Flask object.
+        """
+        self.pragmas: Dict[str, Union[str, int]] = {}
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Reads and validates the pragma profile from the application configuration.
+
+        :param app: The Flask object.
+        :raises ValueError: If a pragma or value is not allowed.
+        """
+        pragmas = dict(app.config["SQLITE_PRAGMAS"])
+
+        for name, value in pragmas.items():
+            if name not in PRAGMAS:
+                raise ValueError(f"Unsupported SQLite pragma '{name}', expected one of: {', '.join(PRAGMAS)}.")
+
+            if not isinstance(value, int) and not str(value).isalnum():
+                raise ValueError(f"Invalid value for SQLite pragma '{name}': {value!r}.")
+
+        self.pragmas = pragmas
+
+    def attach(self, engine: Engine, read_only: bool = False) -> None:
+        """
+        Registers the connection listener on an engine, before its first connection is made.
+
+        :param engine: The database engine.
+        :param read_only: The engine opens read-only connections, the journal mode is left to the writer.
+        """
+        if engine.dialect.name != "sqlite" or not self.pragmas:
+            return
+
+        listener = self._on_read_only_connect if read_only else self._on_connect
+
+        if not event.contains(engine, "connect", listener):
+            event.listen(engine, "connect", listener)
+
+    def report(self, engine: Engine) -> Dict[str, Any]:
+        """
+        Reads back the configured pragmas from a pooled connection.
+
+        :param engine: The database engine.
+        :return: The value in effect for each configured pragma, empty for other databases.
+        """
+        if engine.dialect.name != "sqlite":
+            return {}
+
+        with engine.connect() as connection:
+            return {name: connection.exec_driver_sql(f"PRAGMA {name}").scalar() for name in self.pragmas}
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        """Engine "connect" listener, applies the pragmas to a new DBAPI connection."""
+        self._apply(dbapi_connection, self.pragmas)
+
+    def _on_read_only_connect(self, dbapi_connection, connection_record) -> None:
+        """Engine "connect" listener for read-only connections, which cannot change the journal mode."""
+        self._apply(dbapi_connection, {name: value for name, value in self.pragmas.items() if name != "journal_mode"})
+
+    @staticmethod
+    def _apply(dbapi_connection, pragmas: Dict[str, Union[str, int]]) -> None:
+        """Sets pragmas on a DBAPI connection."""
+        cursor = dbapi_connection.cursor()
+
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
@@ -0,0 +1,136 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import hmac
+import logging
+from base64 import urlsafe_b64encode
+from hashlib import sha256
+from typing import Any, Dict, Tuple
+
+from flask import Flask
+from itsdangerous import TimedJSONWebSignatureSerializer as JWS
+
+logger = logging.getLogger(__name__)
+
+
+class TokenSigner:
+    # Number of HMAC bytes kept for a credential fingerprint.
+    FINGERPRINT_BYTES = 12
+
+    def __init__(self, app: Flask = None):
+        """
+        Application wide signer for authentication tokens, built once per application instead of per request.
+
+        :param app: The Flask object.
+        """
+        self._serializer = None
+        self._secret = b""
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Builds the token serializer from the application configuration.
+
+        :param app: The Flask object.
+        """
+        self._secret = (app.config["SECRET_KEY"] or "").encode("utf8")
+        self._serializer = JWS(app.config["SECRET_KEY"],
+                               expires_in=app.config["TOKEN_EXPIRY"],
+                               algorithm_name=app.config["TOKEN_ALGORITHM"])
+
+        logger.debug(f"TOKEN_ALGORITHM set to {app.config['TOKEN_ALGORITHM']}")
+
+    def dumps(self, claims: Dict[str, Any]) -> str:
+        """
+        Signs a set of claims.
+
+        :param claims: The claims to embed in the token.
+        :return: The signed token.
+        """
+        return self._serializer.dumps(claims).decode("utf8")
+
+    def loads(self, token: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Verifies a token's signature and expiry.
+
+        :param token: The token supplied by the client.
+        :return: The token claims and header.
+        :raises BadSignature: If the token is invalid or has expired.
+        """
+        return self._serializer.loads(token, return_header=True)
+
+    def fingerprint(self, credential: str) -> str:
+        """
+        Derives a short, keyed fingerprint of a User's credential key.
+
+        Tokens carry the fingerprint, a credential change alters the key and invalidates all tokens issued
+        before it.
+
+        :param credential: The User's credential key, see "User.credential_key".
+        :return: A URL safe fingerprint string.
+        """
+        digest = hmac.new(self._secret, (credential or "").encode("utf8"), sha256).digest()
+
+        return urlsafe_b64encode(digest[:self.FINGERPRINT_BYTES]).decode("ascii")
+
+    def verify_fingerprint(self, credential: str, fingerprint: str) -> bool:
+        """
+        Constant time check of a token fingerprint against a User's credential key.
+
+        :param credential: The User's current credential key.
+        :param fingerprint: The fingerprint carried by the token.
+        :return: True if the fingerprint matches, else False.
+        """
+        return hmac.compare_digest(self.fingerprint(credential), fingerprint or "")
+
+
+class AdminSecret:
+
+    def __init__(self, app: Flask = None):
+        """
+        Checks the admin password sent on registration against ADMIN_SECRET_KEY.
+
+        The secret is reduced to an HMAC digest keyed with SECRET_KEY once, when the application is created,
+        and candidates are compared in constant time. The digest never leaves the process, so no slow password
+        hash is needed to protect it.
+
+        :param app: The Flask object.
+        """
+        self._key = b""
+        self._digest = None
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Derives the admin secret digest from the application configuration.
+
+        :param app: The Flask object.
+        """
+        self._key = (app.config["SECRET_KEY"] or "").encode("utf8")
+        secret = app.config["ADMIN_SECRET_KEY"]
+        self._digest = self._mac(secret) if secret else None
+
+        if self._digest is None:
+            logger.warning("ADMIN_SECRET_KEY not set, admin registration is disabled.")
+
+    def verify(self, password: str) -> bool:
+        """
+        Constant time check of a password against the admin secret.
+
+        :param password: The admin password supplied by the client.
+        :return: True if the password matches, else False.
+        """
+        if self._digest is None or not isinstance(password, str):
+            return False
+
+        return hmac.compare_digest(self._mac(password), self._digest)
+
+    def _mac(self, value: str) -> bytes:
+        """Keyed digest of a secret."""
+        return hmac.new(self._key, value.encode("utf8"), sha256).digest()
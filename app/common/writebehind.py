@@ -0,0 +1,180 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import logging
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from threading import Event, Lock, Thread
+from typing import Any, Dict, Optional
+
+from flask import Flask
+from sqlalchemy import bindparam
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WriteBehindStats:
+    """Buffer occupancy and flush statistics for the last login buffer."""
+    pending: int = 0
+    recorded: int = 0
+    written: int = 0
+    flushes: int = 0
+    failures: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns dictionary representation of object, useful for logging/JSON encoding."""
+        return asdict(self)
+
+
+class LastLoginBuffer:
+
+    def __init__(self, app: Flask = None):
+        """
+        Write-behind buffer for User last login times.
+
+        Logins record their timestamp in memory instead of committing an UPDATE each, a background thread writes
+        the buffered timestamps as one batched UPDATE every LAST_LOGIN_FLUSH_INTERVAL seconds, or sooner once
+        LAST_LOGIN_FLUSH_SIZE Users are pending. The interval bounds how stale a stored last login may be.
+
+        Buffered timestamps are flushed on shutdown, but are lost if the process is killed.
+
+        :param app: The Flask object.
+        """
+        self.enabled = False
+        self.interval = 1.0
+        self.max_entries = 500
+        self._engine: Optional[Engine] = None
+        self._statement = None
+        self._pending: Dict[int, datetime] = {}
+        self._lock = Lock()
+        self._wake = Event()
+        self._stopping = Event()
+        self._thread: Optional[Thread] = None
+        self._stats = WriteBehindStats()
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Initialises the buffer from the application configuration.
+
+        :param app: The Flask object.
+        """
+        self.shutdown()
+
+        self.enabled = app.config["LAST_LOGIN_WRITE_BEHIND"]
+        self.interval = app.config["LAST_LOGIN_FLUSH_INTERVAL"]
+        self.max_entries = app.config["LAST_LOGIN_FLUSH_SIZE"]
+        self._stats = WriteBehindStats()
+
+        logger.debug(f"Last login write-behind enabled: {self.enabled}")
+
+    def bind(self, engine: Engine, model: type) -> None:
+        """
+        Registers the engine and User model the buffered timestamps are written to.
+
+        Flushes use their own connection, they never touch a request's session.
+
+        :param engine: The database engine.
+        :param model: The User model class.
+        """
+        self._engine = engine
+        self._statement = (model.__table__.update()
+                           .where(model.__table__.c.id == bindparam("_id"))
+                           .values(last_login=bindparam("_last_login")))
+
+    def record(self, user_id: int, last_login: datetime) -> bool:
+        """
+        Buffers a User's last login time.
+
+        :param user_id: The User's id.
+        :param last_login: The login time.
+        :return: True if buffered, False if write-behind is disabled and the caller must write it.
+        """
+        if not self.enabled or self._engine is None:
+            return False
+
+        with self._lock:
+            self._pending[user_id] = last_login
+            self._stats.recorded += 1
+            full = len(self._pending) >= self.max_entries
+
+            if self._thread is None:
+                self._start()
+
+        if full:
+            self._wake.set()
+
+        return True
+
+    def flush(self) -> int:
+        """
+        Writes the buffered timestamps with a single executemany UPDATE.
+
+        On failure the timestamps are kept for the next flush, unless the User has logged in again since.
+
+        :return: The number of Users written.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        if not pending:
+            return 0
+
+        try:
+            with self._engine.begin() as connection:
+                connection.execute(self._statement, [{"_id": user_id, "_last_login": last_login}
+                                                     for user_id, last_login in pending.items()])
+        except Exception:
+            logger.exception(f"Failed to write {len(pending)} last login time(s), retrying on the next flush.")
+
+            with self._lock:
+                self._stats.failures += 1
+                _ = [self._pending.setdefault(user_id, last_login) for user_id, last_login in pending.items()]
+
+            return 0
+
+        with self._lock:
+            self._stats.written += len(pending)
+            self._stats.flushes += 1
+
+        logger.debug(f"Wrote {len(pending)} last login time(s).")
+
+        return len(pending)
+
+    def shutdown(self) -> None:
+        """Stops the flush thread, if running, and writes any buffered timestamps."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+
+        if thread is not None:
+            self._stopping.set()
+            self._wake.set()
+            thread.join()
+
+        if self._engine is not None:
+            self.flush()
+
+    @property
+    def stats(self) -> WriteBehindStats:
+        """Returns a snapshot of the buffer statistics."""
+        with self._lock:
+            return WriteBehindStats(**{**asdict(self._stats), "pending": len(self._pending)})
+
+    def _start(self) -> None:
+        """Starts the flush thread, lazily so it is created after any worker process fork."""
+        self._stopping.clear()
+        self._thread = Thread(target=self._run, name="last-login-flush", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Flush thread, writes the buffer every interval or when woken by a full buffer."""
+        while not self._stopping.is_set():
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            self.flush()
@@ -0,0 +1,294 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import logging
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, asdict
+from queue import Empty, Queue
+from threading import Lock, Thread
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from flask import Flask
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import scoped_session
+
+logger = logging.getLogger(__name__)
+
+# A unit of work, runs its statements on the connection it is given and must not commit.
+Job = Callable[[Connection], Any]
+
+_STOP = object()
+
+
+@dataclass
+class WriterStats:
+    """Queue depth and group commit statistics for the writer."""
+    queue_depth: int = 0
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    groups: int = 0
+    largest_group: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns dictionary representation of object, useful for logging/JSON encoding."""
+        return asdict(self)
+
+
+class WriteQueue:
+
+    def __init__(self, app: Flask = None):
+        """
+        Single writer with group commit for database mutations.
+
+        With WRITE_QUEUE_ENABLED a dedicated thread owns the write connection, request threads submit jobs and
+        wait on a future for the result. The thread commits every job queued while the previous group was
+        committing as one transaction, one lock acquisition and one fsync for the group. If a job fails the
+        group is rolled back and its jobs are retried one transaction each, so only the failing job sees the
+        error. If the connection is lost, or cannot be opened, the jobs fail and the next group reconnects.
+
+        When disabled a job runs on the calling thread's session connection and is committed straight away.
+
+        The writer needs a file or server database, an in-memory database shares one connection across threads.
+
+        :param app: The Flask object.
+        """
+        self.enabled = False
+        self.max_batch = 64
+        self.max_wait = 0.0
+        self._session: Optional[scoped_session] = None
+        self._engine: Optional[Engine] = None
+        self._queue: Queue = Queue()
+        self._thread: Optional[Thread] = None
+        self._lock = Lock()
+        self._stats = WriterStats()
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Initialises the writer from the application configuration.
+
+        :param app: The Flask object.
+        """
+        self.shutdown()
+
+        self.enabled = app.config["WRITE_QUEUE_ENABLED"]
+        self.max_batch = app.config["WRITE_QUEUE_MAX_BATCH"]
+        self.max_wait = app.config["WRITE_QUEUE_MAX_WAIT"]
+        self._queue = Queue(maxsize=app.config["WRITE_QUEUE_SIZE"])
+        self._stats = WriterStats()
+
+        logger.debug(f"Write queue enabled: {self.enabled}")
+
+    def bind(self, session: scoped_session, engine: Engine) -> None:
+        """
+        Registers the session used when disabled and the engine the writer thread connects to.
+
+        :param session: The request session.
+        :param engine: The primary database engine.
+        """
+        self._session = session
+        self._engine = engine
+
+    def execute(self, job: Job) -> Any:
+        """
+        Runs a job and commits it, through the writer thread when enabled.
+
+        :param job: The job to run.
+        :return: The job's result.
+        :raises Exception: Any error raised by the job or its commit.
+        """
+        if not self.enabled:
+            try:
+                result = job(self._session.connection())
+                self._session.commit()
+            except Exception:
+                self._session.rollback()
+                raise
+
+            return result
+
+        # End the request's read transaction, with a rollback journal its shared lock would block the writer.
+        self._session.commit()
+
+        return self.submit(job).result()
+
+    def submit(self, job: Job) -> Future:
+        """
+        Queues a job for the writer thread, blocks while the queue is full.
+
+        :param job: The job to run.
+        :return: A future resolved once the job's group is committed.
+        """
+        future = Future()
+
+        with self._lock:
+            if self._thread is None:
+                self._start()
+
+            self._stats.submitted += 1
+            self._stats.queue_depth += 1
+
+        self._queue.put((job, future))
+
+        return future
+
+    def shutdown(self) -> None:
+        """Stops the writer thread, if running, after the queued jobs are committed."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+
+    @property
+    def stats(self) -> WriterStats:
+        """Returns a snapshot of the writer statistics."""
+        with self._lock:
+            return WriterStats(**asdict(self._stats))
+
+    def _start(self) -> None:
+        """Starts the writer thread, lazily so it is created after any worker process fork."""
+        self._thread = Thread(target=self._run, name="db-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Writer thread, commits queued jobs in groups until stopped."""
+        connection = None
+        stopping = False
+
+        while not stopping:
+            item = self._queue.get()
+
+            if item is _STOP:
+                break
+
+            group, stopping = self._collect(item)
+            group = self._start_group(group)
+
+            if not group:
+                continue
+
+            if connection is None:
+                connection, failure = self._connect()
+
+            if connection is None:
+                self._done(group, error=failure)
+            elif self._commit(connection, group) is not None:
+                self._discard(connection)
+                connection = None
+
+        if connection is not None:
+            connection.close()
+
+    def _connect(self) -> Tuple[Optional[Connection], Optional[Exception]]:
+        """
+        Opens the writer connection.
+
+        :return: The connection and None, or None and the error if the connection failed.
+        """
+        try:
+            return self._engine.connect(), None
+        except Exception as err:
+            logger.exception("Database writer failed to connect.")
+            return None, err
+
+    @staticmethod
+    def _discard(connection: Connection) -> None:
+        """Drops a lost connection, so it is not returned to the pool."""
+        logger.warning("Database writer connection lost, reconnecting on the next group.")
+
+        try:
+            connection.invalidate()
+            connection.close()
+        except Exception:
+            logger.debug("Error closing the lost writer connection.", exc_info=True)
+
+    def _collect(self, first: Tuple[Job, Future]) -> Tuple[List[Tuple[Job, Future]], bool]:
+        """
+        Gathers the jobs queued behind the first, waiting up to WRITE_QUEUE_MAX_WAIT for more.
+
+        :return: The group and whether a stop was requested.
+        """
+        group = [first]
+        deadline = time.perf_counter() + self.max_wait
+
+        while len(group) < self.max_batch:
+            try:
+                remaining = deadline - time.perf_counter()
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except Empty:
+                break
+
+            if item is _STOP:
+                return group, True
+
+            group.append(item)
+
+        return group, False
+
+    def _start_group(self, group: List[Tuple[Job, Future]]) -> List[Tuple[Job, Future]]:
+        """Marks the group's futures as running, dropping cancelled jobs."""
+        running = [(job, future) for job, future in group if future.set_running_or_notify_cancel()]
+
+        with self._lock:
+            self._stats.queue_depth -= len(group) - len(running)
+
+        return running
+
+    def _commit(self, connection: Connection, group: List[Tuple[Job, Future]]) -> Optional[DBAPIError]:
+        """
+        Runs a group of jobs in one transaction, retrying them individually if any fails.
+
+        :return: The error if the connection was lost, the jobs not yet committed are failed with it.
+        """
+        try:
+            with connection.begin():
+                results = [job(connection) for job, _ in group]
+        except Exception as err:
+            if isinstance(err, DBAPIError) and err.connection_invalidated:
+                self._done(group, error=err)
+                return err
+
+            if len(group) > 1:
+                logger.debug(f"Group of {len(group)} failed, retrying jobs individually.")
+
+                for index, item in enumerate(group):
+                    lost = self._commit(connection, [item])
+
+                    if lost is not None:
+                        self._done(group[index + 1:], error=lost)
+                        return lost
+
+                return None
+
+            self._done(group, error=err)
+            return None
+
+        self._done(group, results=results)
+        return None
+
+    def _done(self, group: List[Tuple[Job, Future]], results: List[Any] = None, error: Exception = None) -> None:
+        """Resolves the futures of a committed or failed group."""
+        with self._lock:
+            self._stats.queue_depth -= len(group)
+
+            if error is not None:
+                self._stats.failed += len(group)
+            else:
+                self._stats.completed += len(group)
+                self._stats.groups += 1
+                self._stats.largest_group = max(self._stats.largest_group, len(group))
+
+        for index, (_, future) in enumerate(group):
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(results[index])
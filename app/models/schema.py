@@ -0,0 +1,148 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import logging
+from typing import Optional
+
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from .user import User, Role
+
+logger = logging.getLogger(__name__)
+
+ROLES = ("user", "admin")
+
+
+def add_indexes(db: SQLAlchemy) -> None:
+    """
+    Version 1, adds the indexes introduced after the users table was first created.
+
+    :param db: The database.
+    """
+    _ = [index.create(db.engine, checkfirst=True) for index in User.__table__.indexes]
+
+
+def add_credential_epoch(db: SQLAlchemy) -> None:
+    """
+    Version 2, adds the users "credential_epoch" column, existing users start at epoch 0.
+
+    Also repairs databases stamped as version 1 before the column was migrated.
+
+    :param db: The database.
+    """
+    if _has_column(db.engine, "users", "credential_epoch"):
+        return
+
+    try:
+        with db.engine.begin() as connection:
+            connection.exec_driver_sql("ALTER TABLE users ADD COLUMN credential_epoch INTEGER NOT NULL DEFAULT 0")
+    except OperationalError:
+        # Added by another process starting at the same time.
+        if not _has_column(db.engine, "users", "credential_epoch"):
+            raise
+
+    logger.info("Added column users.credential_epoch.")
+
+
+# Steps upgrading a database from the previous version, each is idempotent. Append a step to change the schema,
+# SCHEMA_VERSION follows.
+MIGRATIONS = (add_indexes, add_credential_epoch)
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def ensure_schema(db: SQLAlchemy) -> bool:
+    """
+    Creates the missing tables, runs the migration steps after the stored version and seeds the roles, unless the
+    database is already at SCHEMA_VERSION.
+
+    The version is read with a single query, so restarting workers against a set up database skip the DDL
+    checks and role inserts. A database at version 0 is either new or older than stored versions, all steps run
+    against it. Databases without a stored version (other than SQLite) run all steps on every start. The version is
+    stored only once every step has run. Requires an application context.
+
+    :param db: The database.
+    :return: True if the schema was created or updated, False if it was current.
+    :raises RuntimeError: If the database was set up by a newer version of the application.
+    """
+    version = schema_version(db.engine)
+
+    if version is not None and version > SCHEMA_VERSION:
+        raise RuntimeError(f"Database schema version {version} is newer than supported ({SCHEMA_VERSION}).")
+
+    if version == SCHEMA_VERSION:
+        logger.debug(f"Database schema is current (version {version}).")
+        return False
+
+    db.create_all()
+
+    for step in MIGRATIONS[version or 0:]:
+        logger.debug(f"Running schema migration step '{step.__name__}'.")
+        step(db)
+
+    seed_roles(db)
+
+    if version is not None:
+        with db.engine.begin() as connection:
+            connection.exec_driver_sql(f"PRAGMA user_version = {int(SCHEMA_VERSION)}")
+
+    logger.info(f"Database schema set up (version {version} to {SCHEMA_VERSION}).")
+
+    return True
+
+
+def schema_version(engine: Engine) -> Optional[int]:
+    """
+    Reads the stored schema version, kept in SQLite's "user_version" header field.
+
+    :param engine: The database engine.
+    :return: The schema version, 0 for a new database, None if the database cannot store one.
+    """
+    if engine.dialect.name != "sqlite":
+        return None
+
+    with engine.connect() as connection:
+        return connection.exec_driver_sql("PRAGMA user_version").scalar()
+
+
+def seed_roles(db: SQLAlchemy) -> int:
+    """
+    Adds the roles missing from the roles table.
+
+    :param db: The database.
+    :return: The number of roles added.
+    """
+    existing = {name for name, in db.session.query(Role.name)}
+    missing = [name for name in ROLES if name not in existing]
+
+    if not missing:
+        return 0
+
+    try:
+        db.session.add_all([Role(name=name) for name in missing])
+        db.session.commit()
+    except IntegrityError:
+        # Seeded by another process starting at the same time.
+        db.session.rollback()
+        return 0
+
+    logger.debug(f"Roles added: {', '.join(missing)}")
+
+    return len(missing)
+
+
+def _has_column(engine: Engine, table: str, column: str) -> bool:
+    """
+    Checks the live database for a column, rather than the model metadata.
+
+    :param engine: The database engine.
+    :param table: The table name.
+    :param column: The column name.
+    :return: True if the table has the column, else False.
+    """
+    return column in {info["name"] for info in inspect(engine).get_columns(table)}
@@ -4,18 +4,34 @@ Date:       11 May 2021
 """
 
 import logging
+import secrets
+from functools import partial
 from typing import Union, Dict, Any, Tuple
 from collections import OrderedDict
 
-from flask import current_app
-from werkzeug.security import generate_password_hash, check_password_hash
-from itsdangerous import TimedJSONWebSignatureSerializer as Serializer
+from sqlalchemy import event, inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
 
-from .. import db
+from .. import db, hasher, token_signer, credential_epochs, roles, email_filter, writer
+from ..common.principal import Principal
 
 logger = logging.getLogger(__name__)
 
 
+def new_credential_epoch() -> int:
+    """
+    Returns a random starting credential epoch for a new User.
+
+    SQLite reuses the id of the most recently deleted User, a random start keeps a new account from matching the
+    deleted account's epoch, and so from accepting its tokens. 52 bits stay exact as a JSON number.
+
+    :return: The initial credential epoch.
+    """
+    return secrets.randbits(52)
+
+
 class Role(db.Model):
     """Models a User object from a users SQL table."""
     __tablename__ = "roles"
@@ -31,11 +47,18 @@ class User(db.Model):
 
     # User columns
     id = db.Column(db.Integer, primary_key=True)
-    username = db.Column(db.String)
+    # Indexed for keyset pagination, SQLite appends the rowid (id) to each index entry for the tie-breaker.
+    username = db.Column(db.String, index=True)
     email = db.Column(db.String, unique=True)
     password_hash = db.Column(db.String)
-    last_login = db.Column(db.DateTime)
+    last_login = db.Column(db.DateTime, index=True)
     role_id = db.Column(db.Integer, db.ForeignKey("roles.id"))
+    # Incremented whenever a field carried by a stateless token changes, revoking older tokens. Starts at a random
+    # value, as ids can be reused.
+    credential_epoch = db.Column(db.Integer, nullable=False, default=new_credential_epoch)
+
+    # Fields that bump the credential epoch when changed.
+    CREDENTIAL_FIELDS = ("username", "email", "password_hash", "role_id")
 
     # ======================================================================================================================
     # Password Handling
@@ -49,16 +72,29 @@ class User(db.Model):
     @password.setter
     def password(self, password: str):
         """Converts the plain-text password into a salted hash before storing in the database."""
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = hasher.hash(password)
 
     def verify_password(self, password: str) -> bool:
         """
         Verifies the user password against a salted hash within the database.
 
+        Hashes made with an outdated method or cost are regenerated and stored on a successful verification,
+        through the writer. The password is unchanged, so the credential epoch is not bumped and issued tokens
+        stay valid.
+
         :param password: The password to verify.
         :return: True if password is correct, False otherwise.
         """
-        return check_password_hash(self.password_hash, password)
+        verified = hasher.verify(self.password_hash, password)
+
+        if verified and hasher.needs_rehash(self.password_hash):
+            logger.info(f"Rehashing password for user {self.id} with {hasher.method}.")
+            password_hash = hasher.hash(password)
+            writer.execute(partial(update_password_hash, self.id, password_hash))
+            # Update the loaded User without marking it as changed.
+            set_committed_value(self, "password_hash", password_hash)
+
+        return verified
 
     # ======================================================================================================================
     # Token Handling
@@ -68,42 +104,44 @@ class User(db.Model):
         """
         Generates an authentication token to replace password auth for users.
 
+        The token carries a fingerprint of the credential key, see "credential_key".
+
         :return: A new authentication token.
         """
-        expiration = current_app.config["TOKEN_EXPIRY"]
+        claims = {"id": self.id, "fp": token_signer.fingerprint(self.credential_key)}
 
-        s = Serializer(current_app.config["SECRET_KEY"], expires_in=expiration)
+        # Stateless tokens also carry the role and credential epoch.
+        if credential_epochs.enabled:
+            claims.update(Principal.claims_for(self))
 
-        return dict(token=s.dumps({"id": self.id,
-                                   "email": self.email,
-                                   "password_hash": self.password_hash}).decode("utf8"))
+        return dict(token=token_signer.dumps(claims))
 
     @staticmethod
     def user_from_token_props(data: Dict[str, Any]) -> Union[object, bool]:
         """
         Finds and returns a user identified by a token.
 
-        :param data: A dictionary object containing an email and password_hash field.
-        :return: A User object if a user was found for the email and password supplied, else False.
+        :param data: A dictionary object containing an id and credential fingerprint field.
+        :return: A User object if a user was found for the id and fingerprint supplied, else None.
         """
-        # Check that an email property exists on the data passed.
-        email = data.get("email")
-        password_hash = data.get("password_hash")
+        # Check that an id property exists on the data passed.
+        user_id = data.get("id")
+        fingerprint = data.get("fp")
 
         # Ensure values exist.
-        if not all([email, password_hash]):
+        if user_id is None or fingerprint is None:
             logger.warning("Data missing properties.")
             return None
 
         # Get the identified user.
-        user: User = User.query.filter_by(email=email).first()
+        user: User = User.query.get(user_id)
 
         # If no matching user is returned.
         if user is None:
             return None
 
-        # Ensure the user's details have not been altered since the token was generated.
-        if user.email == email and user.password_hash == password_hash:
+        # Ensure the user's credentials have not been altered since the token was generated.
+        if token_signer.verify_fingerprint(user.credential_key, fingerprint):
             return user
         else:
             return None
@@ -116,6 +154,10 @@ class User(db.Model):
         :param email: A user's email.
         :return: A User object if a user was found for the email supplied, else False.
         """
+        # Skip the database for emails that were never registered.
+        if not email_filter.might_contain(email):
+            return None
+
         # Get the identified user.
         return User.query.filter_by(email=email).first()
 
@@ -125,12 +167,12 @@ class User(db.Model):
 
     def get_roles(self) -> Union[str, Tuple[str]]:
         """Returns the User's role name."""
-        return self.role.name
+        return roles.name(self.role_id)
 
     @property
     def is_admin(self) -> bool:
         """Check if the User is an Admin User."""
-        return True if self.role.name == "admin" else False
+        return True if roles.name(self.role_id) == "admin" else False
 
     # ======================================================================================================================
     # Helpers
@@ -143,11 +185,42 @@ class User(db.Model):
 
         :return: Whether the User already exists.
         """
+        if not email_filter.might_contain(self.email):
+            return False
+
         if self.query.filter_by(email=self.email).first():
             return True
         else:
             return False
 
+    @property
+    def credential_key(self) -> str:
+        """
+        The token fingerprint input, changes with the credential epoch, i.e. with the password, email, username or
+        role, but not when a password is rehashed. The random starting epoch keeps an account reusing a deleted
+        account's id from matching its key.
+        """
+        return f"{self.id}:{self.credential_epoch or 0}"
+
+    def as_snapshot(self) -> Dict[str, Any]:
+        """
+        Returns the User's column values, used to cache the User outside of a session.
+        """
+        return {column.name: getattr(self, column.name) for column in self.__table__.columns}
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict[str, Any]) -> object:
+        """
+        Restores a User from a column snapshot into the current session without querying the database.
+
+        :param snapshot: A dictionary of column values, see "as_snapshot".
+        :return: A persistent User object.
+        """
+        user = cls(**snapshot)
+        make_transient_to_detached(user)
+
+        return db.session.merge(user, load=False)
+
     def as_dict(self) -> dict:
         """
         Returns dictionary representation of object, useful for JSON encoding.
@@ -163,3 +236,23 @@ class User(db.Model):
         """Return string representation of User object."""
         return f"<User {self.username} - {self.last_login}>"
 
+
+@event.listens_for(User, "before_update")
+def bump_credential_epoch(mapper, connection, target: User) -> None:
+    """Mapper "before_update" listener, bumps the credential epoch if a token carried field changed."""
+    state = inspect(target)
+
+    if any(state.attrs[name].history.has_changes() for name in User.CREDENTIAL_FIELDS):
+        target.credential_epoch = (target.credential_epoch or 0) + 1
+
+
+def update_password_hash(user_id: int, password_hash: str, connection: Connection) -> None:
+    """
+    Write job storing a regenerated password hash, without bumping the credential epoch.
+
+    :param user_id: The User id.
+    :param password_hash: The new hash of the unchanged password.
+    :param connection: The write connection.
+    """
+    table = User.__table__
+    connection.execute(table.update().where(table.c.id == user_id).values(password_hash=password_hash))
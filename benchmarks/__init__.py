@@ -0,0 +1,8 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
@@ -0,0 +1,73 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+
+Measures registration throughput from concurrent clients against a file database, with each request committing
+itself and with the single writer grouping commits.
+
+Usage:
+    python -m benchmarks.bench_registration [n] [threads]
+"""
+
+import os
+import sys
+import tempfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import event
+
+from benchmarks.utils import timer
+from configurations.env_setup import TestConfig
+from app import create_app, db, writer
+
+
+def run(write_queue: bool, n: int, threads: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        TestConfig.SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp}/bench.sqlite"
+        TestConfig.WRITE_QUEUE_ENABLED = write_queue
+        # Measure the request path, not the password hash cost.
+        TestConfig.PASSWORD_HASH_ITERATIONS = 1000
+
+        app = create_app("test")
+
+        statements = Counter()
+        with app.app_context():
+            event.listen(db.engine, "before_cursor_execute",
+                         lambda conn, cursor, statement, *args: statements.update([statement.split()[0]]))
+
+        def register(i: int) -> int:
+            with app.test_client() as client:
+                # Every 4th registration reuses an email, exercising the conflict path.
+                email = f"user{i - i % 4 if i % 4 == 3 else i}@example.com"
+                data = {"email": email, "password": "bench"}
+                # Every 8th registration is an admin, checking the admin password.
+                if i % 8 == 7:
+                    data["admin_password"] = os.environ["ADMIN_SECRET_KEY"]
+                try:
+                    return client.post("/api/v1/register", data=data).status_code
+                except Exception:
+                    # Unhandled errors propagate in testing mode.
+                    return 500
+
+        name = "write queue" if write_queue else "per request commits"
+        with timer(f"registration, {name} ({threads} threads)", n) as results:
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                statuses = Counter(pool.map(register, range(n)))
+
+        print(results[0])
+        print(f"status codes: {dict(statuses)}")
+        print(f"statements per registration: { {k: round(v / n, 2) for k, v in statements.items()} }")
+
+        if write_queue:
+            print(f"writer: {writer.stats.as_dict()}")
+            writer.shutdown()
+
+
+def main(n: int = 400, threads: int = 8) -> None:
+    run(False, n, threads)
+    run(True, n, threads)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
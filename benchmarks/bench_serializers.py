@@ -0,0 +1,47 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+
+Compares UserSchema and the compiled UserSerializer throughput for user listings.
+
+Usage:
+    python -m benchmarks.bench_serializers [n]
+"""
+
+import sys
+from datetime import datetime
+
+from benchmarks.utils import timer
+from app import create_app, db
+from app.models import User
+from app.api.v1.schema import UserSchema, UserSerializer
+from app.api.v1.handlers.retrieve import RetrieveHandler
+
+
+def main(n: int = 10000) -> None:
+    app = create_app("test")
+
+    with app.app_context():
+        db.session.execute(User.__table__.insert(), [
+            {"username": f"user{i}", "email": f"user{i}@example.com", "password_hash": "-",
+             "last_login": datetime(2021, 5, 1), "role_id": 1 + i % 2, "credential_epoch": 0}
+            for i in range(n)
+        ])
+        db.session.commit()
+
+        for only in (RetrieveHandler.ADMIN_FIELDS, RetrieveHandler.USER_FIELDS):
+            rows = db.session.query(*UserSchema.columns_for(only)).all()
+
+            with timer(f"UserSchema {len(only)} fields", n) as before:
+                UserSchema(only=only, many=True).dump(rows)
+
+            with timer(f"UserSerializer {len(only)} fields", n) as after:
+                UserSerializer.get(only=only, many=True).dump(rows)
+
+            print(f"{before[0]} rows")
+            print(f"{after[0]} rows")
+            print(f"speed up: {after[0].rate / before[0].rate:.1f}x")
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,92 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+
+Measures read/write throughput under a mixed load on a file database, with SQLite defaults and with the
+configured SQLITE_PRAGMAS profile.
+
+Usage:
+    python -m benchmarks.bench_sqlite_profile [seconds] [readers] [writers]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from sqlalchemy.exc import OperationalError
+
+from benchmarks.utils import Result
+from configurations.env_setup import Config, TestConfig
+from app import create_app, db, sqlite_profile
+
+USERS = 2000
+
+
+def run(pragmas: dict, seconds: float, readers: int, writers: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        TestConfig.SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp}/bench.sqlite"
+        TestConfig.SQLITE_PRAGMAS = pragmas
+
+        app = create_app("test")
+
+        from app.models import User
+
+        with app.app_context():
+            db.session.execute(User.__table__.insert(), [{"email": f"user{i}@example.com", "username": f"user{i}",
+                                                          "role_id": 1, "credential_epoch": 0} for i in range(USERS)])
+            db.session.commit()
+            profile = sqlite_profile.report(db.engine)
+
+        deadline = time.perf_counter() + seconds
+
+        def read() -> tuple:
+            operations = errors = 0
+            with app.app_context():
+                while time.perf_counter() < deadline:
+                    try:
+                        db.session.query(User.id, User.username).filter(User.id == random.randint(1, USERS)).first()
+                        db.session.query(User.id).order_by(User.last_login.desc()).limit(20).all()
+                        db.session.rollback()
+                        operations += 1
+                    except OperationalError:
+                        db.session.rollback()
+                        errors += 1
+            return operations, errors
+
+        def write() -> tuple:
+            operations = errors = 0
+            with app.app_context():
+                while time.perf_counter() < deadline:
+                    try:
+                        db.session.execute(User.__table__.update()
+                                           .where(User.id == random.randint(1, USERS))
+                                           .values(last_login=datetime.now()))
+                        db.session.commit()
+                        operations += 1
+                    except OperationalError:
+                        db.session.rollback()
+                        errors += 1
+            return operations, errors
+
+        with ThreadPoolExecutor(max_workers=readers + writers) as pool:
+            read_futures = [pool.submit(read) for _ in range(readers)]
+            write_futures = [pool.submit(write) for _ in range(writers)]
+            reads = [future.result() for future in read_futures]
+            writes = [future.result() for future in write_futures]
+
+        print(f"profile: {profile or 'sqlite defaults'}")
+        print(Result(name=f"reads ({readers} threads)", operations=sum(ops for ops, _ in reads), seconds=seconds))
+        print(Result(name=f"writes ({writers} threads)", operations=sum(ops for ops, _ in writes), seconds=seconds))
+        print(f"database is locked errors: {sum(errors for _, errors in reads + writes)}")
+
+
+def main(seconds: float = 5, readers: int = 6, writers: int = 2) -> None:
+    run({}, seconds, readers, writers)
+    run(dict(Config.SQLITE_PRAGMAS), seconds, readers, writers)
+
+
+if __name__ == '__main__':
+    main(*[float(arg) for arg in sys.argv[1:2]], *[int(arg) for arg in sys.argv[2:4]])
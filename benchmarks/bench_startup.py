@@ -0,0 +1,59 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+
+Measures worker startup, importing the application and "create_app", in fresh interpreters against a new
+file database and against one already set up.
+
+Usage:
+    python -m benchmarks.bench_startup [runs]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+import benchmarks.utils  # noqa: F401, provides the keys required by the configuration.
+
+# Runs in a fresh interpreter, so the import cost is measured with cold module caches.
+STARTUP = """
+import json, time
+start = time.perf_counter()
+from configurations.env_setup import TestConfig
+TestConfig.SQLALCHEMY_DATABASE_URI = {url!r}
+from app import create_app
+imported = time.perf_counter()
+create_app("test")
+print(json.dumps({{"import": imported - start, "create_app": time.perf_counter() - imported}}))
+"""
+
+
+def boot(url: str) -> dict:
+    """Starts the application in a new interpreter, returning the import and create_app times."""
+    output = subprocess.run([sys.executable, "-c", STARTUP.format(url=url)], check=True, capture_output=True,
+                            text=True, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def report(name: str, timings: list) -> None:
+    """Prints the median of each startup phase."""
+    phases = {phase: statistics.median(timing[phase] for timing in timings) * 1000 for phase in ("import", "create_app")}
+    print(f"{name:<30} import {phases['import']:>8.1f}ms   create_app {phases['create_app']:>8.1f}ms   "
+          f"total {sum(phases.values()):>8.1f}ms")
+
+
+def main(runs: int = 5) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        cold = [boot(f"sqlite:///{tmp}/cold{run}.sqlite") for run in range(runs)]
+        warm = [boot(f"sqlite:///{tmp}/cold0.sqlite") for _ in range(runs)]
+
+    report(f"new database ({runs} runs)", cold)
+    report(f"existing database ({runs} runs)", warm)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
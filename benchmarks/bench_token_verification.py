@@ -0,0 +1,48 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+
+Compares cold and warm Bearer token verification throughput.
+
+Usage:
+    python -m benchmarks.bench_token_verification [n]
+"""
+
+import sys
+
+from flask import g
+
+from benchmarks.utils import measure
+from app import create_app, db, token_cache
+from app.models import User
+from app.api.authentication import verify_token
+from configurations.env_setup import TestConfig
+
+
+def main(n: int = 2000) -> None:
+    # Token must outlive the benchmark, set before "create_app" configures the token signer.
+    TestConfig.TOKEN_EXPIRY = 3600
+    app = create_app("test")
+
+    with app.app_context():
+        db.session.add(User(email="bench@example.com", username="bench", password="bench", role_id=1))
+        db.session.commit()
+
+        token = User.query.first().generate_auth_token()["token"]
+
+        def verify(clear: bool):
+            def _verify():
+                if clear:
+                    token_cache.clear()
+                with app.test_request_context(headers={"Authorization": f"Bearer {token}"}):
+                    assert verify_token(token)
+                    g.pop("auth_context")
+            return _verify
+
+        print(measure("token verification (cold)", n, verify(clear=True)))
+        print(measure("token verification (warm)", n, verify(clear=False)))
+        print(f"cache stats: {token_cache.stats.as_dict()}")
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
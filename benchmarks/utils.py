@@ -0,0 +1,61 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+# Benchmarks run against the test configuration, provide keys if not set.
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("ADMIN_SECRET_KEY", "benchmark-admin")
+
+
+@dataclass
+class Result:
+    """Throughput result for a single benchmark run."""
+    name: str
+    operations: int
+    seconds: float
+
+    @property
+    def rate(self) -> float:
+        """Operations per second."""
+        return self.operations / self.seconds if self.seconds else float("inf")
+
+    def __str__(self) -> str:
+        return f"{self.name:<40} {self.operations:>8} ops {self.seconds:>9.4f}s {self.rate:>12.1f} ops/s"
+
+
+def measure(name: str, operations: int, func: Callable[[], None]) -> Result:
+    """
+    Runs a callable a number of times and reports the throughput.
+
+    :param name: The name of the benchmark.
+    :param operations: The number of times to call the function.
+    :param func: The callable to benchmark.
+    :return: A Result object.
+    """
+    start = time.perf_counter()
+    for _ in range(operations):
+        func()
+
+    return Result(name=name, operations=operations, seconds=time.perf_counter() - start)
+
+
+@contextmanager
+def timer(name: str, operations: int) -> Iterator[list]:
+    """
+    Context manager variant of "measure" for benchmarks that batch their own operations.
+
+    :param name: The name of the benchmark.
+    :param operations: The number of operations carried out inside the block.
+    :return: A list the Result object is appended to on exit.
+    """
+    results = []
+    start = time.perf_counter()
+    yield results
+    results.append(Result(name=name, operations=operations, seconds=time.perf_counter() - start))
@@ -5,7 +5,6 @@ Date:       10 May 2021
 
 import os
 import logging
-from werkzeug.security import generate_password_hash
 
 logger = logging.getLogger(__name__)
 
@@ -21,8 +20,90 @@ class Config:
     LOGGER_CONFIG = os.path.join(BASE_DIR, "configurations", "logger", "prod_logger.yml")
     # Set secret key for flask-login sessions
     SECRET_KEY = os.environ.get("SECRET_KEY")
-    ADMIN_SECRET_KEY = generate_password_hash(os.environ.get("ADMIN_SECRET_KEY"))
+    # Admin registration password, reduced to a keyed digest when the application is created.
+    ADMIN_SECRET_KEY = os.environ.get("ADMIN_SECRET_KEY")
     TOKEN_EXPIRY = 3600  # 1 Hour
+    # Password hash method and cost, calibrate the cost per host with "flask hashing calibrate".
+    PASSWORD_HASH_METHOD = "pbkdf2:sha256"
+    PASSWORD_HASH_ITERATIONS = 150000
+    # Read-only database for read-only handlers, e.g. a replica. Unset, a file SQLite database is reopened read-only
+    # ("mode=ro") with its own pool and any other database is shared with writes.
+    SQLALCHEMY_READ_DATABASE_URI = os.environ.get("READ_DATABASE_URL")
+    SQLALCHEMY_READ_POOL_SIZE = 10
+    SQLALCHEMY_READ_MAX_OVERFLOW = 10
+    # Pragmas applied to every SQLite connection, WAL lets readers run alongside a writer and writers wait up to
+    # busy_timeout (ms) for the lock instead of failing with "database is locked". Set to {} for SQLite defaults.
+    SQLITE_PRAGMAS = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",  # Durable with WAL except for the last commits on power loss.
+        "cache_size": -64000,  # Negative values are KiB, 64MB.
+        "mmap_size": 268435456,  # 256MB
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    }
+    PASSWORD_HASH_TARGET_P99_MS = 250
+    # Password hashing process pool, 0 workers hashes synchronously on the request thread.
+    PASSWORD_HASH_WORKERS = os.cpu_count() or 1
+    PASSWORD_HASH_QUEUE_SIZE = 64
+    # Admission control for password verification, token buckets are rate (per second) and burst.
+    ADMISSION_ENABLED = True
+    ADMISSION_MAX_CONCURRENT = os.cpu_count() or 1
+    ADMISSION_QUEUE_SIZE = 32
+    ADMISSION_QUEUE_TIMEOUT = 2.0  # Seconds
+    ADMISSION_EMAIL_RATE = 1.0
+    ADMISSION_EMAIL_BURST = 10
+    ADMISSION_CLIENT_RATE = 10.0
+    ADMISSION_CLIENT_BURST = 50
+    # Token signing algorithm, one of HS256/HS384/HS512.
+    TOKEN_ALGORITHM = "HS256"
+    # Cache of successful Basic auth password verifications.
+    CREDENTIAL_CACHE_ENABLED = True
+    CREDENTIAL_CACHE_SIZE = 1024
+    CREDENTIAL_CACHE_TTL = 300  # 5 Minutes
+    # Cache of decoded Bearer tokens and their Users, entries expire with their token or after TOKEN_CACHE_TTL.
+    # Bounds how long a password change, demotion or deletion by another process leaves old tokens accepted.
+    TOKEN_CACHE_ENABLED = True
+    TOKEN_CACHE_SIZE = 4096
+    TOKEN_CACHE_TTL = 5  # Seconds
+    # Stateless tokens carry the role and credential epoch, Bearer role checks skip the User load.
+    TOKEN_STATELESS = False
+    TOKEN_EPOCH_REFRESH = 5  # Seconds
+    TOKEN_EPOCH_TABLE_SIZE = 100000
+    # Bloom filter of registered emails, lookups for unknown emails skip the database.
+    # Users written by other processes are loaded before a negative answer at most every EMAIL_FILTER_REFRESH
+    # seconds, until then they are rejected. Off by default, enable where that staleness is acceptable.
+    EMAIL_FILTER_ENABLED = False
+    EMAIL_FILTER_CAPACITY = 100000
+    EMAIL_FILTER_ERROR_RATE = 0.01
+    EMAIL_FILTER_REBUILD_RATIO = 0.25  # Rebuild once deleted emails pass this fraction of entries.
+    EMAIL_FILTER_REFRESH = 5  # Seconds
+    EMAIL_FILTER_REBUILD_INTERVAL = 600  # Seconds, full rebuilds drop deleted emails and see reused ids.
+    # Page sizes for GET /api/v1/users, larger "limit" arguments are capped.
+    USERS_PAGE_SIZE = 100
+    USERS_MAX_PAGE_SIZE = 1000
+    # Rows fetched and serialized per chunk for streamed listings, GET /api/v1/users?stream=true.
+    USERS_STREAM_BATCH_SIZE = 1000
+    # Maximum number of users in a batch update, PUT /api/v1/users.
+    USERS_BATCH_MAX_ITEMS = 1000
+    # Users deleted per statement and transaction, keeps bulk deletes under SQLite's bound parameter limit.
+    USERS_DELETE_CHUNK_SIZE = 500
+    # Buffer last login times and write them in batches instead of committing on every login.
+    # The flush interval bounds how stale a stored last login may be, buffered times are lost if the process is killed.
+    LAST_LOGIN_WRITE_BEHIND = False
+    LAST_LOGIN_FLUSH_INTERVAL = 1.0  # Seconds
+    LAST_LOGIN_FLUSH_SIZE = 500  # Flush early once this many Users are pending.
+    # Records inserted per transaction by "flask users import".
+    USERS_IMPORT_BATCH_SIZE = 1000
+    # Commit mutations from a single writer thread, grouping concurrent requests into one transaction.
+    # Needs a file or server database, an in-memory database is shared by one connection.
+    WRITE_QUEUE_ENABLED = False
+    WRITE_QUEUE_MAX_BATCH = 64  # Jobs committed per transaction.
+    WRITE_QUEUE_MAX_WAIT = 0.0  # Seconds to wait for more jobs, 0 only groups jobs queued during the last commit.
+    WRITE_QUEUE_SIZE = 1024  # Requests block once this many jobs are queued.
+    # Unknown role ids or names reload the roles table at most once every ROLES_REFRESH seconds.
+    ROLES_REFRESH = 60  # Seconds
+    # JSON encoder for responses, one of "auto", "orjson" or "stdlib". "auto" uses orjson when installed.
+    JSON_BACKEND = "auto"
 
     @classmethod
     def init_app(cls, app):
@@ -42,16 +123,21 @@ class TestConfig(Config):
     """Test Environment"""
     # Disables error catching during request handling, improves error report output.
     TESTING = True
+    LOGGER_CONFIG = os.path.join(BASE_DIR, "configurations", "logger", "dev_logger.yml")
     # Disables authentication checks for testing, if required.
     LOGIN_DISABLED = False
     # Use a in-memory database for testing.
     SQLALCHEMY_DATABASE_URI = os.environ.get("DEV_DATABASE_URL") or "sqlite://"
     TOKEN_EXPIRY = 5
+    # Hash synchronously during tests.
+    PASSWORD_HASH_WORKERS = 0
 
 
 class ProductionConfig(Config):
     """Production Environment"""
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or f"sqlite:///{os.path.join(BASE_DIR, 'data.sqlite')}"
+    # Sync every commit, a power loss must not lose acknowledged writes.
+    SQLITE_PRAGMAS = {**Config.SQLITE_PRAGMAS, "synchronous": "FULL"}
 
 
 def get_config(env: str = None) -> Config:
@@ -10,6 +10,18 @@ from datetime import datetime
 import pytest
 
 
+@pytest.fixture(scope="session", autouse=True)
+def init_logging():
+    """
+    Configures logging before the first test, applications created by the tests keep it along with the
+    capture handlers pytest adds to the root logger.
+    """
+    from app.common.logger import init_logger
+    from configurations.env_setup import TestConfig
+
+    init_logger(TestConfig.LOGGER_CONFIG)
+
+
 @pytest.fixture(autouse=True)
 def set_log_level(caplog):
     """Set the log level for the test session."""
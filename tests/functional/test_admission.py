@@ -0,0 +1,41 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import json
+
+from flask import Response
+
+from app import admission
+from app.common.admission import RateLimiter
+from tests.functional.utils import FlaskTestRig, basic_auth_header_field
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_basic_auth_flood_rejected_with_429(mocker, client_factory, make_users, **kwargs):
+    """
+    Validate repeated Basic auth attempts for one email are rejected with a 429 once the burst is spent.
+
+    :endpoint:  /api/v1/users/me
+    :method:    GET
+    :auth:      True (Email/Password)
+    :params:    None
+    :status:    401, 429
+    :response:  An unauthorised error, then a too many requests error.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    user = rig.get_first_user(keep_password=True)
+    headers = basic_auth_header_field(user["email"], "wrong-password")
+
+    # Allow a single attempt per email, with no refill.
+    mocker.patch.object(admission, "_email_limiter", RateLimiter(rate=0.0, capacity=1))
+
+    first: Response = rig.client.get("/api/v1/users/me", headers=headers)
+    second: Response = rig.client.get("/api/v1/users/me", headers=headers)
+
+    assert first.status_code == 401
+    assert second.status_code == 429
+    assert json.loads(second.data)["error"] == "Too Many Requests"
+    assert admission.stats.shed == 1
@@ -0,0 +1,71 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import json
+
+from flask import Response
+
+from tests.functional.utils import FlaskTestRig, login, token_auth_header_field, basic_auth_header_field
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_nested_handlers_verify_token_once(client_factory, make_users, caplog, **kwargs):
+    """
+    Validate an Admin request routed through nested "login_required" handlers
+    only verifies the Bearer token and looks up the User once.
+
+    :endpoint:  /api/v1/users/<int:id>
+    :method:    GET
+    :auth:      True (Token)
+    :params:    Auth Token, A user ID to get information on.
+    :status:    200
+    :response:  A object describing the requested user.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    # Acquire login token for the admin user.
+    user = rig.get_first_user(keep_password=True, admin_only=True)
+    token = login(rig.client, user)
+
+    caplog.clear()
+
+    # Make request and gather response.
+    res: Response = rig.client.get("/api/v1/users/2", headers=token_auth_header_field(token))
+
+    # Verify the token was only verified once across both handlers.
+    assert res.status_code == 200
+    assert "Auth context: 1 verification(s), 1 user lookup(s)." in caplog.messages
+    assert caplog.messages.count("Authorized with Token.") == 1
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_nested_handlers_verify_password_once(client_factory, make_users, caplog, **kwargs):
+    """
+    Validate an Admin request routed through nested "login_required" handlers
+    only verifies the Basic credentials once and exposes the User object to the handlers.
+
+    :endpoint:  /api/v1/users/<int:id>
+    :method:    GET
+    :auth:      True (Email/Password)
+    :params:    A user ID to get information on.
+    :status:    200
+    :response:  A object describing the requested user.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    user = rig.get_first_user(keep_password=True, admin_only=True)
+
+    # Make request and gather response.
+    res: Response = rig.client.get("/api/v1/users/2",
+                                   headers=basic_auth_header_field(user["email"], user["password"]))
+
+    # Get JSON data returned.
+    data = json.loads(res.data)
+
+    # Verify the credentials were only verified once across both handlers.
+    assert res.status_code == 200
+    assert data["id"] == 2
+    assert "Auth context: 1 verification(s), 1 user lookup(s)." in caplog.messages
+    assert caplog.messages.count("Authorized with Email/Password.") == 1
@@ -0,0 +1,125 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import pytest
+from flask import Response
+
+from app import email_filter
+from configurations.env_setup import TestConfig
+from tests.functional.utils import FlaskTestRig, basic_auth_header_field, login
+from tests.functional.users.test_list_users_queries import record_queries
+
+
+@pytest.fixture
+def filter_enabled(mocker):
+    """Enables the email filter, off by default."""
+    mocker.patch.object(TestConfig, "EMAIL_FILTER_ENABLED", True)
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_unknown_email_skips_database(filter_enabled, client_factory, make_users, **kwargs):
+    """
+    Validate Basic auth for an email that was never registered is rejected without querying the users table.
+
+    :endpoint:  /api/v1/users/me
+    :method:    GET
+    :auth:      True (Email/Password)
+    :params:    None
+    :status:    401
+    :response:  An unauthorised error.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    with rig.app_context():
+        engine = rig.db.engine
+
+    with record_queries(engine) as statements:
+        res: Response = rig.client.get("/api/v1/users/me",
+                                       headers=basic_auth_header_field("scanner@example.com", "guess"))
+
+    assert res.status_code == 401
+    assert not any("FROM users" in statement for statement in statements)
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_registered_email_added_to_filter(filter_enabled, client_factory, make_users, **kwargs):
+    """
+    Validate a newly registered User can log in straight away, the filter is updated on registration.
+
+    :endpoint:  /api/v1/register, /api/v1/login
+    :method:    POST
+    :auth:      False
+    :params:    None
+    :status:    201, 200
+    :response:  An authentication token.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    new_user = rig.create_new_user(keep_password=True)
+
+    res: Response = rig.client.post("/api/v1/register", data=new_user)
+
+    assert res.status_code == 201
+    assert email_filter.might_contain(new_user["email"]) is True
+    assert login(rig.client, new_user)
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_email_written_elsewhere_caught_up(filter_enabled, mocker, client_factory, make_users, **kwargs):
+    """
+    Validate a User inserted by another process, bypassing this process' filter, can log in once the
+    refresh interval has passed.
+
+    :endpoint:  /api/v1/login
+    :method:    POST
+    :auth:      False
+    :params:    The new user's email/password.
+    :status:    400, then 200
+    :response:  An authentication token.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    new_user = rig.create_new_user(keep_password=True)
+    user_id = len(rig.get_current_users())
+
+    with rig.app_context():
+        # A Core INSERT on its own connection, as another worker would write it.
+        with rig.db.engine.begin() as connection:
+            connection.execute(rig.User.__table__.insert().values(
+                id=user_id, email=new_user["email"], username=new_user["username"], role_id=1, credential_epoch=0,
+                password_hash=rig.User(password=new_user["password"]).password_hash))
+
+    mocker.patch.object(email_filter, "refresh", 3600)
+    login(rig.client, new_user, should_fail=True)
+
+    mocker.patch.object(email_filter, "refresh", 0)
+    assert login(rig.client, new_user)
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_login_loads_user_once(filter_enabled, client_factory, make_users, **kwargs):
+    """
+    Validate a login for an email the filter may contain loads the User with a single query.
+
+    :endpoint:  /api/v1/login
+    :method:    POST
+    :auth:      True (Email/Password)
+    :params:    A current user's email/password.
+    :status:    200
+    :response:  A new authentication token.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    user = rig.get_first_user(keep_password=True)
+
+    with rig.app_context():
+        engine = rig.db.engine
+
+    with record_queries(engine) as statements:
+        login(rig.client, user)
+
+    # The row loaded by email is reused for the token, no existence check or reload after the last login write.
+    selects = [statement for statement in statements if statement.startswith("SELECT") and "FROM users" in statement]
+    assert len(selects) == 1
@@ -0,0 +1,156 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import csv
+import json
+import os
+
+import pytest
+
+from app.commands.users import UserImporter
+from configurations.env_setup import TestConfig
+from tests.functional.utils import FlaskTestRig, basic_auth_header_field, login
+
+
+@pytest.fixture
+def cheap_hashing(mocker):
+    """Keeps password hashing cheap for bulk imports."""
+    mocker.patch.object(TestConfig, "PASSWORD_HASH_ITERATIONS", 1000)
+
+
+def write_csv(path, records):
+    """Writes import records as CSV."""
+    with open(path, "w", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=["email", "username", "password", "role"])
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def write_ndjson(path, records):
+    """Writes import records as newline delimited JSON."""
+    with open(path, "w") as fh:
+        fh.writelines(json.dumps(record) + "\n" for record in records)
+
+
+def make_records(n, start=0):
+    """Creates n import records."""
+    return [{"email": f"import{i}@example.com", "username": f"import{i}", "password": f"secret{i}", "role": "user"}
+            for i in range(start, start + n)]
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_import_users_csv(cheap_hashing, tmp_path, client_factory, make_users, **kwargs):
+    """
+    Validate a CSV import inserts each record, skips existing emails and counts invalid records.
+
+    :command:   flask users import
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    existing = rig.get_first_user(keep_password=True)
+    records = make_records(5) + [{"email": existing["email"], "username": "dup", "password": "x", "role": "user"},
+                                 {"email": "not-an-email", "username": "bad", "password": "x", "role": "user"}]
+    path = tmp_path / "users.csv"
+    write_csv(path, records)
+
+    result = rig.app.test_cli_runner().invoke(args=["users", "import", str(path), "--batch-size", "2",
+                                                    "--workers", "0"])
+
+    assert result.exit_code == 0, result.output
+    assert "Import complete: 5 inserted, 1 skipped, 1 invalid." in result.output
+    assert not os.path.exists(f"{path}.checkpoint")
+
+    with rig.app_context():
+        imported = rig.User.query.filter(rig.User.email.like("import%")).all()
+        assert len(imported) == 5
+        assert all(user.verify_password(f"secret{user.username[6:]}") for user in imported)
+        assert {user.get_roles() for user in imported} == {"user"}
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_import_users_ndjson_process_pool(cheap_hashing, tmp_path, client_factory, make_users, **kwargs):
+    """
+    Validate an NDJSON import hashing passwords in worker processes.
+
+    :command:   flask users import
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    path = tmp_path / "users.ndjson"
+    write_ndjson(path, make_records(10))
+
+    result = rig.app.test_cli_runner().invoke(args=["users", "import", str(path), "--workers", "2"])
+
+    assert result.exit_code == 0, result.output
+    assert "Import complete: 10 inserted, 0 skipped, 0 invalid." in result.output
+
+    with rig.app_context():
+        assert rig.User.user_from_email("import9@example.com").verify_password("secret9")
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_import_users_resume(cheap_hashing, tmp_path, client_factory, make_users, **kwargs):
+    """
+    Validate an interrupted import resumes after the last committed batch.
+
+    :command:   flask users import
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    path = tmp_path / "users.ndjson"
+    write_ndjson(path, make_records(6))
+
+    def interrupt(progress, seconds):
+        raise KeyboardInterrupt
+
+    with rig.app_context():
+        with pytest.raises(KeyboardInterrupt):
+            UserImporter(str(path), batch_size=4, workers=0).run(report=interrupt)
+
+    assert os.path.exists(f"{path}.checkpoint")
+
+    result = rig.app.test_cli_runner().invoke(args=["users", "import", str(path), "--workers", "0"])
+
+    assert result.exit_code == 0, result.output
+    assert "Resuming after record 4." in result.output
+    assert "Import complete: 6 inserted, 0 skipped, 0 invalid." in result.output
+
+    with rig.app_context():
+        assert rig.User.query.filter(rig.User.email.like("import%")).count() == 6
+
+
+@pytest.fixture
+def email_filter_enabled(mocker):
+    """Enables the email filter, catching up on Users written elsewhere before every negative answer."""
+    mocker.patch.object(TestConfig, "EMAIL_FILTER_ENABLED", True)
+    mocker.patch.object(TestConfig, "EMAIL_FILTER_REFRESH", 0)
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_imported_users_authenticate(cheap_hashing, email_filter_enabled, tmp_path, client_factory, make_users,
+                                     **kwargs):
+    """
+    Validate imported users can log in to an application started before the import, its email filter
+    loads the imported Users instead of rejecting them.
+
+    :command:   flask users import
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    records = make_records(2)
+    path = tmp_path / "users.csv"
+    write_csv(path, records)
+
+    # Not yet imported, rejected by the filter.
+    login(rig.client, records[0], should_fail=True)
+
+    result = rig.app.test_cli_runner().invoke(args=["users", "import", str(path), "--workers", "0"])
+    assert result.exit_code == 0, result.output
+
+    assert login(rig.client, records[0])
+
+    res = rig.client.get("/api/v1/users/me", headers=basic_auth_header_field(records[1]["email"],
+                                                                              records[1]["password"]))
+    assert res.status_code == 200
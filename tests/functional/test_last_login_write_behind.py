@@ -0,0 +1,61 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import pytest
+from flask import Response
+
+from app import last_logins
+from configurations.env_setup import TestConfig
+from tests.functional.users.test_list_users_queries import record_queries
+from tests.functional.utils import FlaskTestRig, basic_auth_header_field
+
+
+@pytest.fixture
+def write_behind(mocker):
+    """Enables the last login write-behind buffer, flushed by the test."""
+    mocker.patch.object(TestConfig, "LAST_LOGIN_WRITE_BEHIND", True)
+    mocker.patch.object(TestConfig, "LAST_LOGIN_FLUSH_INTERVAL", 60)
+
+    yield
+
+    last_logins.shutdown()
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_login_write_behind(write_behind, client_factory, make_users, **kwargs):
+    """
+    Validate logins buffer the last login time instead of writing it, until the buffer is flushed.
+
+    :endpoint:  /api/v1/login
+    :method:    POST
+    :auth:      False
+    :params:    A current user's email/password.
+    :status:    200
+    :response:  A new authentication token.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    current_user = rig.get_first_user(keep_password=True)
+
+    with rig.app_context():
+        before = rig.User.query.get(current_user["id"]).last_login
+
+        with record_queries(rig.db.engine) as statements:
+            res: Response = rig.client.post("/api/v1/login",
+                                            headers=basic_auth_header_field(current_user["email"],
+                                                                            current_user["password"]),
+                                            data=current_user)
+
+    assert res.status_code == 200
+    assert not [statement for statement in statements if statement.startswith("UPDATE")]
+    assert last_logins.stats.pending == 1
+
+    with rig.app_context():
+        assert rig.User.query.get(current_user["id"]).last_login == before
+
+    assert last_logins.flush() == 1
+
+    with rig.app_context():
+        assert rig.User.query.get(current_user["id"]).last_login > before
@@ -0,0 +1,78 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import json
+
+import pytest
+from flask import Response
+from sqlalchemy.exc import OperationalError
+
+from app import read_db
+from app.common.replica import read_only_url
+from configurations.env_setup import TestConfig
+from tests.functional.utils import FlaskTestRig, login, token_auth_header_field
+
+
+@pytest.fixture
+def file_database(mocker, tmp_path):
+    """Uses a file database, which is reopened read-only for reads."""
+    mocker.patch.object(TestConfig, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{tmp_path / 'replica.sqlite'}")
+
+
+@pytest.mark.parametrize("url, expected",
+                         [
+                             ("sqlite:////data/users.sqlite", "sqlite:///file:/data/users.sqlite?mode=ro&uri=true"),
+                             ("sqlite://", None),
+                             ("sqlite:///file:/data/users.sqlite?mode=ro&uri=true", None),
+                             ("postgresql://localhost/users", None),
+                         ])
+def test_read_only_url(url, expected):
+    """
+    :GIVEN: A primary database URL.
+    :WHEN:  Deriving the read-only database URL.
+    :THEN:  Verify only file SQLite databases are reopened read-only.
+    """
+    assert read_only_url(url) == expected
+
+
+@FlaskTestRig.setup_app(n_users=5)
+def test_list_users_read_pool(file_database, client_factory, make_users, **kwargs):
+    """
+    Validate user listings are served from the read-only pool, and see users written through the primary.
+
+    :endpoint:  /api/v1/users
+    :method:    GET
+    :auth:      True
+    :params:    Auth Token
+    :status:    200
+    :response:  A JSON list of users.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    assert read_db.separate
+    assert "mode=ro" in str(read_db.engine.url)
+
+    admin = rig.get_first_user(keep_password=True, admin_only=True)
+    token = login(rig.client, admin)
+
+    new_user = rig.create_new_user(keep_password=True)
+    assert rig.client.post("/api/v1/register", data=new_user).status_code == 201
+
+    before = read_db.stats
+
+    res: Response = rig.client.get("/api/v1/users", headers=token_auth_header_field(token))
+
+    assert res.status_code == 200
+    assert new_user["email"] in [user["email"] for user in json.loads(res.data)]
+
+    after = read_db.stats
+    assert after["read"].checkouts == before["read"].checkouts + 1
+    assert after["read"].checked_out == 0
+    assert after["read"].size == TestConfig.SQLALCHEMY_READ_POOL_SIZE
+
+    # The read pool cannot write.
+    with rig.app_context():
+        with pytest.raises(OperationalError, match="readonly"):
+            read_db.session.execute(rig.User.__table__.delete())
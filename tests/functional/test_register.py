@@ -6,6 +6,7 @@ Date:       13 May 2021
 import os
 import json
 
+import pytest
 from flask import Response
 
 from tests.functional.utils import FlaskTestRig
@@ -74,3 +75,31 @@ def test_register_fail(client_factory, make_users, **kwargs):
     assert data.get("message") == expected["message"]
     # Assert error status code.
     assert res.status_code == 400
+
+
+@FlaskTestRig.setup_app(n_users=3)
+@pytest.mark.parametrize("admin_password, role", [(None, "user"), ("wrong", "user"), ("env", "admin")])
+def test_register_admin_password(admin_password, role, client_factory, make_users, **kwargs):
+    """
+    Verifies only the configured admin password registers an admin, without it a user is registered.
+
+    :endpoint:  /api/v1/register
+    :method:    POST
+    :auth:      False
+    :params:    New user email/password, optional admin password.
+    :status:    201
+    :response:  A new authentication token.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    new_user = rig.create_new_user(keep_password=True)
+
+    if admin_password is not None:
+        new_user["admin_password"] = os.environ["ADMIN_SECRET_KEY"] if admin_password == "env" else admin_password
+
+    res: Response = rig.client.post("/api/v1/register", data=new_user)
+
+    assert res.status_code == 201
+
+    with rig.app_context():
+        assert rig.User.query.filter_by(email=new_user["email"]).first().get_roles() == role
@@ -0,0 +1,85 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from typing import List
+
+import pytest
+from flask import Flask
+
+from configurations.env_setup import TestConfig
+from tests.functional.utils import FlaskTestRig
+
+THREADS = 8
+
+
+@pytest.fixture
+def file_database(mocker, tmp_path):
+    """Uses a file database so concurrent requests get their own connections, with a cheap password hash."""
+    mocker.patch.object(TestConfig, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{tmp_path / 'register.sqlite'}")
+    mocker.patch.object(TestConfig, "PASSWORD_HASH_ITERATIONS", 1000)
+
+
+def register_concurrently(app: Flask, users: List[dict]) -> List[int]:
+    """Registers users from parallel threads released together, returning the response status codes."""
+    barrier = Barrier(len(users))
+
+    def register(user: dict) -> int:
+        with app.test_client() as client:
+            barrier.wait()
+            return client.post("/api/v1/register", data=user).status_code
+
+    with ThreadPoolExecutor(max_workers=len(users)) as pool:
+        return list(pool.map(register, users))
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_concurrent_registration_same_email(file_database, client_factory, make_users, **kwargs):
+    """
+    Validate concurrent registrations for one email create a single account, the rest get the usual 400 error.
+
+    :endpoint:  /api/v1/register
+    :method:    POST
+    :auth:      False
+    :params:    New user email/password.
+    :status:    201, 400
+    :response:  A new authentication token, or a bad request error.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    new_user = rig.create_new_user(keep_password=True)
+
+    statuses = register_concurrently(rig.app, [new_user] * THREADS)
+
+    assert sorted(statuses) == [201] + [400] * (THREADS - 1)
+
+    with rig.app_context():
+        assert rig.User.query.filter_by(email=new_user["email"]).count() == 1
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_concurrent_registration_distinct_emails(file_database, client_factory, make_users, **kwargs):
+    """
+    Validate concurrent registrations for different emails all succeed.
+
+    :endpoint:  /api/v1/register
+    :method:    POST
+    :auth:      False
+    :params:    New user email/password.
+    :status:    201
+    :response:  A new authentication token.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    new_users = make_users(THREADS)
+    _ = [user.pop("id") for user in new_users]
+
+    statuses = register_concurrently(rig.app, new_users)
+
+    assert statuses == [201] * THREADS
+
+    with rig.app_context():
+        assert rig.User.query.count() == 3 + THREADS
@@ -0,0 +1,55 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+from flask import Response
+from werkzeug.security import generate_password_hash
+
+from app import hasher, writer
+from tests.functional.utils import FlaskTestRig, basic_auth_header_field, token_auth_header_field
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_outdated_hash_rehashed_on_login(mocker, client_factory, make_users, **kwargs):
+    """
+    Validate a password hash made with an outdated cost is regenerated through the writer on a successful Basic
+    auth request, without revoking tokens issued before it.
+
+    :endpoint:  /api/v1/users/me
+    :method:    GET
+    :auth:      True (Email/Password)
+    :params:    None
+    :status:    200
+    :response:  A object describing the current user.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    user = rig.get_first_user(keep_password=True)
+
+    # Store a hash made with a lower cost than configured.
+    with rig.app_context():
+        current = rig.User.user_from_email(user["email"])
+        current.password_hash = generate_password_hash(user["password"], "pbkdf2:sha256:1000")
+        rig.db.session.commit()
+        epoch = current.credential_epoch
+        # Issued directly, a login would already rehash.
+        token = current.generate_auth_token()["token"]
+
+    execute = mocker.spy(writer, "execute")
+
+    res: Response = rig.client.get("/api/v1/users/me",
+                                   headers=basic_auth_header_field(user["email"], user["password"]))
+
+    assert res.status_code == 200
+    assert execute.call_count == 1
+
+    # Verify the hash was regenerated with the configured method and still verifies.
+    with rig.app_context():
+        current = rig.User.user_from_email(user["email"])
+
+        assert current.password_hash.startswith(hasher.method + "$")
+        assert current.verify_password(user["password"]) is True
+        assert current.credential_epoch == epoch
+
+    assert rig.client.get("/api/v1/users/me", headers=token_auth_header_field(token)).status_code == 200
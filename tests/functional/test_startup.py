@@ -0,0 +1,154 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import json
+from contextlib import contextmanager
+from typing import Iterator, List
+
+import pytest
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import Engine
+from werkzeug.security import generate_password_hash
+
+from app import create_app, db
+from app.models import Role, User
+from app.models.schema import SCHEMA_VERSION, schema_version
+from configurations.env_setup import TestConfig
+from tests.functional.utils import basic_auth_header_field, token_auth_header_field
+
+
+@pytest.fixture
+def file_database(mocker, tmp_path):
+    """Uses a file database, which keeps its schema version across application starts."""
+    mocker.patch.object(TestConfig, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{tmp_path / 'startup.sqlite'}")
+
+
+@contextmanager
+def record_startup() -> Iterator[List[str]]:
+    """Records the SQL statements executed on any engine, the application's engines do not exist yet."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+
+
+def test_startup_sets_up_schema_once(file_database):
+    """
+    :GIVEN: A new file database.
+    :WHEN:  Starting the application twice.
+    :THEN:  Verify the first start creates the schema and seeds the roles, and the second only reads the version.
+    """
+    with record_startup() as first:
+        app = create_app("test")
+
+    with app.app_context():
+        assert schema_version(db.engine) == SCHEMA_VERSION
+        assert sorted(name for name, in db.session.query(Role.name)) == ["admin", "user"]
+        db.session.remove()
+
+    assert any(statement.startswith("\nCREATE TABLE") for statement in first)
+    assert any(statement.startswith("INSERT INTO roles") for statement in first)
+
+    with record_startup() as second:
+        create_app("test")
+
+    # No DDL, table checks ("PRAGMA main.table_info") or role inserts.
+    setup = ("CREATE", "INSERT", "PRAGMA main")
+    assert not [statement for statement in second if statement.lstrip().startswith(setup)]
+    assert second.count("PRAGMA user_version") == 1
+
+
+def test_startup_upgrades_schema(file_database):
+    """
+    :GIVEN: A database set up before schema versions were stored, missing an index and a role.
+    :WHEN:  Starting the application.
+    :THEN:  Verify the migration steps add the index and the role before the schema version is stored.
+    """
+    app = create_app("test")
+
+    with app.app_context():
+        Role.query.filter_by(name="admin").delete()
+        db.session.commit()
+
+        with db.engine.begin() as connection:
+            connection.exec_driver_sql("DROP INDEX ix_users_username")
+            connection.exec_driver_sql("PRAGMA user_version = 0")
+
+        db.session.remove()
+
+    app = create_app("test")
+
+    with app.app_context():
+        assert schema_version(db.engine) == SCHEMA_VERSION
+        assert "ix_users_username" in {index["name"] for index in inspect(db.engine).get_indexes("users")}
+        assert sorted(name for name, in db.session.query(Role.name)) == ["admin", "user"]
+        db.session.remove()
+
+
+def test_startup_rejects_newer_schema(file_database):
+    """
+    :GIVEN: A database stamped with a schema version newer than supported.
+    :WHEN:  Starting the application.
+    :THEN:  Verify the start fails rather than running against an unknown schema.
+    """
+    app = create_app("test")
+
+    with app.app_context():
+        with db.engine.begin() as connection:
+            connection.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+
+        db.session.remove()
+
+    with pytest.raises(RuntimeError, match="newer than supported"):
+        create_app("test")
+
+
+# The users and roles tables as created before credential epochs and schema versions, user_version 0.
+BASELINE_SCHEMA = (
+    "CREATE TABLE roles (id INTEGER NOT NULL, name VARCHAR, PRIMARY KEY (id), UNIQUE (name))",
+    "CREATE TABLE users (id INTEGER NOT NULL, username VARCHAR, email VARCHAR, password_hash VARCHAR, "
+    "last_login DATETIME, role_id INTEGER, PRIMARY KEY (id), UNIQUE (email), FOREIGN KEY(role_id) REFERENCES roles (id))",
+    "INSERT INTO roles (id, name) VALUES (1, 'user'), (2, 'admin')",
+)
+
+
+def test_startup_migrates_baseline_database(mocker, tmp_path):
+    """
+    :GIVEN: A database created before the credential epoch column, holding a User.
+    :WHEN:  Starting the application and logging in.
+    :THEN:  Verify the column is added with existing users at epoch 0 and the User can log in.
+    """
+    url = f"sqlite:///{tmp_path / 'baseline.sqlite'}"
+    mocker.patch.object(TestConfig, "SQLALCHEMY_DATABASE_URI", url)
+
+    password_hash = generate_password_hash("password")
+    engine = create_engine(url)
+    with engine.begin() as connection:
+        _ = [connection.exec_driver_sql(statement) for statement in BASELINE_SCHEMA]
+        connection.exec_driver_sql("INSERT INTO users (id, username, email, password_hash, role_id) "
+                                   "VALUES (1, 'baseline', 'baseline@example.com', ?, 1)", (password_hash,))
+    engine.dispose()
+
+    app = create_app("test")
+
+    with app.app_context():
+        assert schema_version(db.engine) == SCHEMA_VERSION
+        assert "credential_epoch" in {column["name"] for column in inspect(db.engine).get_columns("users")}
+        assert User.user_from_email("baseline@example.com").credential_epoch == 0
+        db.session.remove()
+
+    client = app.test_client()
+    res = client.post("/api/v1/login", headers=basic_auth_header_field("baseline@example.com", "password"),
+                      data=dict(email="baseline@example.com", password="password"))
+    assert res.status_code == 200
+
+    token = json.loads(res.data)["token"]
+    assert client.get("/api/v1/users/me", headers=token_auth_header_field(token)).status_code == 200
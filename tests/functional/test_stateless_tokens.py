@@ -0,0 +1,136 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import json
+
+import pytest
+from flask import Response
+
+from configurations.env_setup import TestConfig
+from tests.functional.utils import FlaskTestRig, login, token_auth_header_field
+
+
+@pytest.fixture
+def stateless_tokens(mocker):
+    """Enables stateless tokens for the application under test."""
+    mocker.patch.object(TestConfig, "TOKEN_STATELESS", True)
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_stateless_admin_request_skips_user_load(stateless_tokens, client_factory, make_users, caplog, **kwargs):
+    """
+    Validate an Admin request with a stateless token passes the role checks without loading the User.
+
+    :endpoint:  /api/v1/users/<int:id>
+    :method:    GET
+    :auth:      True (Stateless Token)
+    :params:    Auth Token, A user ID to get information on.
+    :status:    200
+    :response:  A object describing the requested user, including the admin only fields.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    user = rig.get_first_user(keep_password=True, admin_only=True)
+    token = login(rig.client, user)
+
+    caplog.clear()
+    res: Response = rig.client.get("/api/v1/users/2", headers=token_auth_header_field(token))
+
+    # Verify admin fields were returned without a User lookup for authentication.
+    assert res.status_code == 200
+    assert json.loads(res.data)["role_name"] == "user"
+    assert "Auth context: 1 verification(s), 0 user lookup(s)." in caplog.messages
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_stateless_me(stateless_tokens, client_factory, make_users, **kwargs):
+    """
+    Validate the /me endpoint is served from the stateless token claims.
+
+    :endpoint:  /api/v1/users/me
+    :method:    GET
+    :auth:      True (Stateless Token)
+    :params:    Auth Token
+    :status:    200
+    :response:  A object describing the current user.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    expected = rig.get_first_user()
+    expected.pop("last_login")
+
+    user = rig.get_first_user(keep_password=True)
+    token = login(rig.client, user)
+
+    res: Response = rig.client.get("/api/v1/users/me", headers=token_auth_header_field(token))
+
+    data = json.loads(res.data)
+    data.pop("last_login")
+
+    assert data == expected
+    assert res.status_code == 200
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_stateless_token_revoked_on_update(stateless_tokens, client_factory, make_users, **kwargs):
+    """
+    Validate a stateless token is revoked once the User's credentials change.
+
+    :endpoint:  /api/v1/users/me
+    :method:    PUT, GET
+    :auth:      True (Stateless Token)
+    :params:    Auth Token, a new username.
+    :status:    401
+    :response:  An unauthorised error.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    user = rig.get_first_user(keep_password=True)
+    token = login(rig.client, user)
+
+    res: Response = rig.client.put("/api/v1/users/me", headers=token_auth_header_field(token),
+                                   data={"username": "foobar"})
+    assert res.status_code == 204
+
+    res: Response = rig.client.get("/api/v1/users/me", headers=token_auth_header_field(token))
+
+    # Verify the old token was revoked by the credential epoch change.
+    assert res.status_code == 401
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_stateless_token_not_reused_401(stateless_tokens, client_factory, make_users, **kwargs):
+    """
+    Validate a deleted Admin's stateless token is rejected once a new account is given the same id.
+
+    :endpoint:  /api/v1/users/<int:id>
+    :method:    GET
+    :auth:      True (Stateless Token)
+    :params:    The deleted Admin's Auth Token, A user ID to get information on.
+    :status:    401
+    :response:  An unauthorised error.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    # SQLite reuses the id of the newest user once deleted, make that user an Admin without bumping its epoch.
+    user = max(rig.get_current_users(keep_password=True), key=lambda user: user["id"])
+    with rig.app_context():
+        table = rig.User.__table__
+        rig.db.session.execute(table.update().where(table.c.id == user["id"]).values(role_id=2))
+        rig.db.session.commit()
+
+    token = login(rig.client, user)
+
+    res: Response = rig.client.delete("/api/v1/users/me", headers=token_auth_header_field(token))
+    assert res.status_code == 200
+
+    new_user = rig.create_new_user(keep_password=True)
+    assert rig.client.post("/api/v1/register", data=new_user).status_code == 201
+
+    with rig.app_context():
+        assert rig.User.user_from_email(new_user["email"]).id == user["id"]
+
+    res = rig.client.get("/api/v1/users/1", headers=token_auth_header_field(token))
+    assert res.status_code == 401
@@ -0,0 +1,113 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import json
+import time
+
+import pytest
+from flask import Response
+
+from app import token_cache
+from configurations.env_setup import TestConfig
+from tests.functional.utils import FlaskTestRig, login, token_auth_header_field
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_repeat_token_skips_user_lookup(client_factory, make_users, caplog, **kwargs):
+    """
+    Validate a repeat Bearer request is served from the token cache without a User lookup.
+
+    :endpoint:  /api/v1/users/me
+    :method:    GET
+    :auth:      True (Token)
+    :params:    Auth Token
+    :status:    200
+    :response:  A object describing the current user.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    user = rig.get_first_user(keep_password=True)
+    token = login(rig.client, user)
+
+    # First request populates the cache.
+    rig.client.get("/api/v1/users/me", headers=token_auth_header_field(token))
+
+    caplog.clear()
+    res: Response = rig.client.get("/api/v1/users/me", headers=token_auth_header_field(token))
+
+    # Verify the second request did not look up the User.
+    assert res.status_code == 200
+    assert json.loads(res.data)["email"] == user["email"]
+    assert "Auth context: 1 verification(s), 0 user lookup(s)." in caplog.messages
+    assert token_cache.stats.hits >= 1
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_cached_token_dropped_on_password_update(client_factory, make_users, **kwargs):
+    """
+    Validate a cached token is no longer accepted once the User's password is updated.
+
+    :endpoint:  /api/v1/users/me
+    :method:    PUT, GET
+    :auth:      True (Token)
+    :params:    Auth Token, a new password.
+    :status:    401
+    :response:  An unauthorised error.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    user = rig.get_first_user(keep_password=True)
+    token = login(rig.client, user)
+
+    # Populate the cache, then change the password.
+    rig.client.get("/api/v1/users/me", headers=token_auth_header_field(token))
+    res: Response = rig.client.put("/api/v1/users/me", headers=token_auth_header_field(token),
+                                   data={"password": "top_secret"})
+    assert res.status_code == 204
+
+    res: Response = rig.client.get("/api/v1/users/me", headers=token_auth_header_field(token))
+
+    # Verify the old token was rejected.
+    assert res.status_code == 401
+
+
+@pytest.fixture
+def short_token_cache(mocker):
+    """Keeps cached tokens for half a second."""
+    mocker.patch.object(TestConfig, "TOKEN_CACHE_TTL", 0.5)
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_cached_token_expires_after_change_elsewhere(short_token_cache, client_factory, make_users, **kwargs):
+    """
+    Validate a cached token is rechecked once older than TOKEN_CACHE_TTL, so a password change made by another
+    process revokes it.
+
+    :endpoint:  /api/v1/users/me
+    :method:    GET
+    :auth:      True (Token)
+    :params:    Auth Token
+    :status:    200, then 401
+    :response:  An unauthorised error.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    user = rig.get_first_user(keep_password=True)
+    token = login(rig.client, user)
+
+    assert rig.client.get("/api/v1/users/me", headers=token_auth_header_field(token)).status_code == 200
+
+    with rig.app_context():
+        # A Core UPDATE on its own connection, as another worker would write it, unseen by this process' cache.
+        table = rig.User.__table__
+        with rig.db.engine.begin() as connection:
+            connection.execute(table.update().where(table.c.email == user["email"])
+                               .values(password_hash="changed", credential_epoch=table.c.credential_epoch + 1))
+
+    assert rig.client.get("/api/v1/users/me", headers=token_auth_header_field(token)).status_code == 200
+
+    time.sleep(0.6)
+
+    assert rig.client.get("/api/v1/users/me", headers=token_auth_header_field(token)).status_code == 401
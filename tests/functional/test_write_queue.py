@@ -0,0 +1,98 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app import writer
+from configurations.env_setup import TestConfig
+from tests.functional.utils import FlaskTestRig, login, token_auth_header_field
+
+
+@pytest.fixture
+def write_queue(mocker, tmp_path):
+    """Enables the single writer on a file database, the writer thread needs its own connection."""
+    mocker.patch.object(TestConfig, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{tmp_path / 'writer.sqlite'}")
+    mocker.patch.object(TestConfig, "WRITE_QUEUE_ENABLED", True)
+
+    yield
+
+    writer.shutdown()
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_register_concurrent(write_queue, client_factory, make_users, **kwargs):
+    """
+    Validate concurrent registrations are committed by the single writer, duplicates still rejected.
+
+    :endpoint:  /api/v1/register
+    :method:    POST
+    :auth:      False
+    :params:    New user emails/passwords.
+    :status:    201, 400 for a repeated email
+    :response:  An authentication token.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    new_users = [rig.create_new_user(keep_password=True) for _ in range(8)]
+
+    def register(user: dict) -> int:
+        return rig.app.test_client().post("/api/v1/register", data=user).status_code
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        statuses = list(pool.map(register, new_users + new_users[:1]))
+
+    assert sorted(statuses) == [201] * 8 + [400]
+
+    stats = writer.stats
+    assert stats.completed == 8
+    assert stats.failed == 1
+    assert stats.queue_depth == 0
+
+    # Registered users can log in and are visible to other connections.
+    login(rig.client, new_users[-1])
+
+    admin = rig.get_first_user(keep_password=True, admin_only=True)
+    res = rig.client.get("/api/v1/users", headers=token_auth_header_field(login(rig.client, admin)))
+
+    assert res.status_code == 200
+    assert {user["email"] for user in new_users} <= {user["email"] for user in json.loads(res.data)}
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_update_delete_queued(write_queue, client_factory, make_users, **kwargs):
+    """
+    Validate updates and deletes are committed by the single writer and revoke the changed users' tokens.
+
+    :endpoint:  /api/v1/users/<id>
+    :method:    PUT, DELETE
+    :auth:      True (Token)
+    :params:    Auth Token, new username.
+    :status:    204, 200
+    :response:  None, id and username of the deleted user.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    admin = rig.get_first_user(keep_password=True, admin_only=True)
+    users = rig.get_current_users(keep_password=True, keep_role_id=True)
+    user = [user for user in users if user["role_id"] == 1 and user["id"]][-1]
+    admin_token = login(rig.client, admin)
+    user_token = login(rig.client, user)
+
+    res = rig.client.put(f"/api/v1/users/{user['id']}", headers=token_auth_header_field(admin_token),
+                         data=json.dumps({"username": "renamed"}))
+    assert res.status_code == 204
+
+    with rig.app_context():
+        assert rig.User.query.get(user["id"]).username == "renamed"
+
+    res = rig.client.delete(f"/api/v1/users/{user['id']}", headers=token_auth_header_field(admin_token))
+    assert res.status_code == 200
+    assert json.loads(res.data) == [{"id": user["id"], "username": "renamed"}]
+
+    assert rig.client.get("/api/v1/users", headers=token_auth_header_field(user_token)).status_code == 401
+    assert writer.stats.failed == 0
@@ -183,3 +183,34 @@ def test_delete_user_id_with_auth_admin_200(user_id, client_factory, make_users,
     assert res.status_code == 200
 
     login(rig.client, expected_full, should_fail=True)
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_delete_me_token_not_reused_401(client_factory, make_users, **kwargs):
+    """
+    Validate a deleted user's token is rejected once a new account is given the same id.
+
+    :endpoint:  /api/v1/users/me
+    :method:    GET
+    :auth:      True (Token)
+    :params:    The deleted user's Auth Token
+    :status:    401
+    :response:  An unauthorised error.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    # SQLite reuses the id of the newest user once deleted.
+    user = max(rig.get_current_users(keep_password=True), key=lambda user: user["id"])
+    token = login(rig.client, user)
+
+    res: Response = rig.client.delete("/api/v1/users/me", headers=token_auth_header_field(token))
+    assert res.status_code == 200
+
+    new_user = rig.create_new_user(keep_password=True)
+    assert rig.client.post("/api/v1/register", data=new_user).status_code == 201
+
+    with rig.app_context():
+        assert rig.User.user_from_email(new_user["email"]).id == user["id"]
+
+    res = rig.client.get("/api/v1/users/me", headers=token_auth_header_field(token))
+    assert res.status_code == 401
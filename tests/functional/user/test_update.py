@@ -210,4 +210,33 @@ def test_update_user_id_with_auth_admin_400(client_factory, make_users, **kwargs
                                    data={})
 
     # Verify response matches expected.
-    assert res.status_code == 400
\ No newline at end of file
+    assert res.status_code == 400
+
+@FlaskTestRig.setup_app(n_users=10)
+@pytest.mark.parametrize("role_id, status, role_name", [("2", 204, "admin"), ("abc", 400, "user"), ("99", 400, "user")])
+def test_update_user_id_role_id_with_auth_admin(role_id, status, role_name, client_factory, make_users, **kwargs):
+    """
+    Updates a User's role by ID, only known role ids are accepted.
+
+    :endpoint:  /api/v1/user/<int:id>
+    :method:    PUT
+    :auth:      True
+    :params:    Auth Token, a role id.
+    :status:    204, 400 for an unknown role id
+    :response:  Nothing, error message.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    user = rig.get_first_user(keep_password=True, admin_only=True)
+    token = login(rig.client, user)
+    user_id = [user for user in rig.get_current_users(keep_role_id=True) if user["role_id"] == 1 and user["id"]][0]["id"]
+
+    res: Response = rig.client.put(f"/api/v1/users/{user_id}",
+                                   headers=token_auth_header_field(token),
+                                   data={"role_id": role_id})
+
+    assert res.status_code == status
+
+    res: Response = rig.client.get(f"/api/v1/users/{user_id}", headers=token_auth_header_field(token))
+
+    assert json.loads(res.data)["role_name"] == role_name
@@ -0,0 +1,126 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import json
+
+from flask import Response
+
+from tests.functional.users.test_list_users_queries import record_queries
+from tests.functional.utils import FlaskTestRig, login, token_auth_header_field
+
+
+@FlaskTestRig.setup_app(n_users=10)
+def test_batch_update_users_admin_200(client_factory, make_users, **kwargs):
+    """
+    Updates a batch of Users in one request, with a result per item.
+
+    :endpoint:  /api/v1/users
+    :method:    PUT
+    :auth:      True
+    :params:    Auth Token, a JSON list of {id, username?, password?, role_id?} objects.
+    :status:    200
+    :response:  A JSON list of per-item results.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    admin = rig.get_first_user(keep_password=True, admin_only=True)
+    token = login(rig.client, admin)
+
+    items = [
+        {"id": 5, "username": "McGuffin"},
+        {"id": 6, "username": "Maguffin"},
+        {"id": 7, "password": "new_secret", "role_id": 2},
+        {"id": 8, "role_id": 99},
+        {"id": 100, "username": "Nobody"},
+        {"id": 5, "username": "Again"},
+        {"username": "NoId"},
+        {"id": "9", "role_id": "2"},
+        {"id": 4, "role_id": "admin"},
+        1,
+        {"id": 3, "role_id": True},
+    ]
+
+    with rig.app_context():
+        epochs = dict(rig.db.session.query(rig.User.id, rig.User.credential_epoch))
+        rig.db.session.remove()
+
+        with record_queries(rig.db.engine) as statements:
+            res: Response = rig.client.put("/api/v1/users", headers=token_auth_header_field(token),
+                                           data=json.dumps(items), content_type="application/json")
+
+    assert res.status_code == 200
+
+    results = json.loads(res.data)
+
+    assert [(result["id"], result["status"]) for result in results] == [
+        (5, 200), (6, 200), (7, 200), (8, 400), (100, 404), (5, 400), (None, 400), (9, 200), (4, 400), (None, 400), (3, 400)]
+    assert results[3]["message"] == "Unknown role_id."
+    assert results[5]["message"] == "Duplicate id."
+    assert results[8]["message"] == "Unknown role_id."
+    # A malformed item is reported without an id.
+    assert results[9]["message"] == "_schema: Invalid input type."
+    # JSON true is not loaded as role id 1.
+    assert results[10]["message"] == "Unknown role_id."
+
+    # One executemany UPDATE per set of updated fields, the two username updates share one.
+    assert len([statement for statement in statements if statement.startswith("UPDATE users")]) == 3
+
+    with rig.app_context():
+        users = {user.id: user for user in rig.User.query.filter(rig.User.id.in_([4, 5, 6, 7, 8, 9])).all()}
+
+        assert users[5].username == "McGuffin"
+        assert users[6].username == "Maguffin"
+        assert users[7].verify_password("new_secret")
+        assert users[7].is_admin
+        assert users[8].role_id != 99
+        assert users[9].is_admin
+        assert [users[user_id].credential_epoch - epochs[user_id] for user_id in (5, 6, 7, 8)] == [1, 1, 1, 0]
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_batch_update_users_400(client_factory, make_users, **kwargs):
+    """
+    Attempts a batch update without a list of Users.
+
+    :endpoint:  /api/v1/users
+    :method:    PUT
+    :auth:      True
+    :params:    Auth Token, a JSON object.
+    :status:    400
+    :response:  A bad request error.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    admin = rig.get_first_user(keep_password=True, admin_only=True)
+    token = login(rig.client, admin)
+
+    res: Response = rig.client.put("/api/v1/users", headers=token_auth_header_field(token),
+                                   data=json.dumps({"id": 2, "username": "foobar"}), content_type="application/json")
+
+    assert res.status_code == 400
+    assert json.loads(res.data)["message"] == "Request data must be a non-empty list of users."
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_batch_update_users_non_admin_401(client_factory, make_users, **kwargs):
+    """
+    Attempts a batch update as a non-admin User.
+
+    :endpoint:  /api/v1/users
+    :method:    PUT
+    :auth:      True
+    :params:    Auth Token, a JSON list of Users.
+    :status:    401
+    :response:  An unauthorised error.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    user = [user for user in rig.get_current_users(keep_password=True, keep_role_id=True) if user["role_id"] == 1][0]
+    token = login(rig.client, user)
+
+    res: Response = rig.client.put("/api/v1/users", headers=token_auth_header_field(token),
+                                   data=json.dumps([{"id": 2, "username": "foobar"}]), content_type="application/json")
+
+    assert res.status_code == 401
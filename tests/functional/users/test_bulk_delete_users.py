@@ -0,0 +1,86 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import json
+
+import pytest
+from flask import Response
+from sqlalchemy import event
+
+from app.api.v1.handlers import delete
+from configurations.env_setup import TestConfig
+from tests.functional.users.test_list_users_queries import record_queries
+from tests.functional.utils import FlaskTestRig, login, token_auth_header_field
+
+
+@pytest.fixture
+def small_chunks(mocker):
+    """Deletes users two at a time."""
+    mocker.patch.object(TestConfig, "USERS_DELETE_CHUNK_SIZE", 2)
+
+
+@FlaskTestRig.setup_app(n_users=10)
+@pytest.mark.parametrize("returning", [True, False])
+def test_bulk_delete_users_chunked(returning, small_chunks, mocker, client_factory, make_users, **kwargs):
+    """
+    Validate bulk deletes run in chunks, each its own transaction, with a single DELETE ... RETURNING
+    statement per chunk where supported and SELECT then DELETE otherwise.
+
+    :endpoint:  /api/v1/users
+    :method:    DELETE
+    :auth:      True (Token)
+    :params:    Auth Token, users to delete.
+    :status:    200
+    :response:  id and username of deleted users.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+    mocker.patch.object(delete, "supports_returning", return_value=returning)
+
+    users = rig.get_current_users(keep_password=True)
+    victims = users[3:8]
+
+    admin = rig.get_first_user(keep_password=True, admin_only=True)
+    token = login(rig.client, admin)
+    victim_token = login(rig.client, victims[0])
+
+    # Unknown and repeated ids are ignored.
+    ids = [user["id"] for user in victims] + [victims[0]["id"], 100]
+
+    commits = []
+
+    def on_commit(conn):
+        commits.append(conn)
+
+    with rig.app_context():
+        engine = rig.db.engine
+        event.listen(engine, "commit", on_commit)
+
+        with record_queries(engine) as statements:
+            res: Response = rig.client.delete("/api/v1/users", headers=token_auth_header_field(token),
+                                              data=json.dumps({"users": [{"id": user_id} for user_id in ids]}))
+
+        event.remove(engine, "commit", on_commit)
+
+    assert res.status_code == 200
+    assert json.loads(res.data) == [{"id": user["id"], "username": user["username"]} for user in victims]
+
+    deletes = [statement for statement in statements if statement.startswith("DELETE")]
+    # The projected (id, username) lookup of the fallback, not the authentication query.
+    lookup = "SELECT users.id, users.username \nFROM"
+    selects = [statement for statement in statements if statement.startswith(lookup)]
+
+    # 6 distinct ids in chunks of 2.
+    assert len(deletes) == 3
+    assert len(commits) == 3
+    assert all(("RETURNING" in statement) == returning for statement in deletes)
+    assert len(selects) == (0 if returning else 3)
+
+    with rig.app_context():
+        assert rig.User.query.filter(rig.User.id.in_(ids)).count() == 0
+        assert rig.User.query.count() == 5
+
+    # Cached tokens of deleted users no longer authenticate.
+    res = rig.client.get("/api/v1/users/me", headers=token_auth_header_field(victim_token))
+    assert res.status_code == 401
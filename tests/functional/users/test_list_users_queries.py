@@ -0,0 +1,75 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+from contextlib import contextmanager
+from typing import List
+
+from flask import Response
+from sqlalchemy import event
+
+from tests.functional.utils import FlaskTestRig, login, token_auth_header_field
+
+
+@contextmanager
+def record_queries(engine) -> List[str]:
+    """Records the SQL statements executed on an engine."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_get_users_query_count_is_constant(client_factory, make_users, **kwargs):
+    """
+    Validate listing all users as an admin issues the same number of queries regardless of the
+    number of users, with role names resolved without querying the roles table and only the
+    returned columns selected.
+
+    :endpoint:  /api/v1/users
+    :method:    GET
+    :auth:      True
+    :params:    Auth Token
+    :status:    200
+    :response:  A list of user objects containing email, username, role_name and last_login fields.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    user = rig.get_first_user(keep_password=True, admin_only=True)
+    headers = token_auth_header_field(login(rig.client, user))
+
+    with rig.app_context():
+        engine = rig.db.engine
+
+    # Warm up the token caches so both measured requests take the same authentication path.
+    rig.client.get("/api/v1/users", headers=headers)
+
+    with record_queries(engine) as few:
+        res: Response = rig.client.get("/api/v1/users", headers=headers)
+    assert res.status_code == 200
+
+    # Add more users, with both roles.
+    with rig.app_context():
+        for new_user in make_users(10):
+            new_user.pop("id")
+            new_user.pop("password")
+            rig.db.session.add(rig.User(password_hash="-", **new_user))
+        rig.db.session.commit()
+
+    with record_queries(engine) as many:
+        res: Response = rig.client.get("/api/v1/users", headers=headers)
+    assert res.status_code == 200
+    assert len(res.json) == 13
+
+    assert len(many) == len(few)
+    assert not any("FROM roles" in statement for statement in few + many)
+    # Only the columns returned are selected.
+    assert not any("password_hash" in statement for statement in many)
@@ -0,0 +1,135 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import re
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+import pytest
+from flask import Response
+
+from tests.functional.utils import FlaskTestRig, login, token_auth_header_field
+
+
+def next_link(res: Response) -> str:
+    """Returns the next page link from a response, None on the last page."""
+    match = re.match(r'<([^>]+)>; rel="next"', res.headers.get("Link", ""))
+
+    return match.group(1) if match else None
+
+
+def collect_pages(rig: FlaskTestRig, headers: Dict[str, str], url: str) -> Tuple[List[dict], int]:
+    """Follows the next page links from a url, returning all Users and the number of pages."""
+    users, pages = [], 0
+
+    while url:
+        res: Response = rig.client.get(url, headers=headers)
+        assert res.status_code == 200
+
+        users.extend(res.json)
+        pages += 1
+        url = next_link(res)
+
+    return users, pages
+
+
+@pytest.fixture
+def admin_headers():
+    """Returns a function adding users with unordered and missing sort keys, returning admin auth headers."""
+
+    def setup(rig: FlaskTestRig) -> Dict[str, str]:
+        with rig.app_context():
+            for i, new_user in enumerate(rig.make_users(10)):
+                new_user.pop("id")
+                new_user.pop("password")
+                # Repeated and missing values exercise the id tie-breaker and NULL handling.
+                new_user["username"] = None if i % 4 == 0 else new_user["username"]
+                new_user["last_login"] = None if i % 3 == 0 else datetime(2021, 5, 1 + i % 2)
+                rig.db.session.add(rig.User(password_hash="-", **new_user))
+            rig.db.session.commit()
+
+        user = rig.get_first_user(keep_password=True, admin_only=True)
+        return token_auth_header_field(login(rig.client, user))
+
+    return setup
+
+
+@pytest.mark.parametrize("sort", ["id", "-id", "last_login", "-last_login", "username", "-username"])
+@FlaskTestRig.setup_app(n_users=3)
+def test_paginate_users(sort, admin_headers, client_factory, make_users, **kwargs):
+    """
+    Validate following the next page links returns every user exactly once, in the requested order.
+
+    :endpoint:  /api/v1/users
+    :method:    GET
+    :auth:      True
+    :params:    limit, sort, cursor
+    :status:    200
+    :response:  A page of user objects with a Link header to the next page.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+    headers = admin_headers(rig)
+
+    everyone: List[dict] = rig.client.get("/api/v1/users", headers=headers).json
+    users, pages = collect_pages(rig, headers, f"/api/v1/users?limit=4&sort={sort}")
+
+    assert len(everyone) == 13
+    assert pages == 4
+    assert sorted(user["id"] for user in users) == sorted(user["id"] for user in everyone)
+
+    # Verify the order, NULLs first ascending and last descending with the id as tie-breaker.
+    key = sort.lstrip("-")
+    descending = sort.startswith("-")
+    expected = sorted(everyone, key=lambda u: (u[key] is not None, u[key] if u[key] is not None else "", u["id"]), reverse=descending)
+
+    assert [user["id"] for user in users] == [user["id"] for user in expected]
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_paginate_users_max_page_size(client_factory, make_users, **kwargs):
+    """
+    Validate the page size is capped by the server.
+
+    :endpoint:  /api/v1/users
+    :method:    GET
+    :auth:      True
+    :params:    limit
+    :status:    200
+    :response:  A page of user objects no larger than the maximum page size.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+    rig.app.config["USERS_MAX_PAGE_SIZE"] = 2
+
+    user = rig.get_first_user(keep_password=True)
+    headers = token_auth_header_field(login(rig.client, user))
+
+    res: Response = rig.client.get("/api/v1/users?limit=1000", headers=headers)
+
+    assert len(res.json) == 2
+    assert "limit=2" in next_link(res)
+
+
+@pytest.mark.parametrize("query", ["limit=0", "limit=abc", "sort=password_hash", "cursor=abc"])
+@FlaskTestRig.setup_app(n_users=3)
+def test_paginate_users_invalid(query, client_factory, make_users, **kwargs):
+    """
+    Validate invalid pagination arguments are rejected.
+
+    :endpoint:  /api/v1/users
+    :method:    GET
+    :auth:      True
+    :params:    limit, sort, cursor
+    :status:    400
+    :response:  A bad request error.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+
+    user = rig.get_first_user(keep_password=True)
+    headers = token_auth_header_field(login(rig.client, user))
+
+    res: Response = rig.client.get(f"/api/v1/users?{query}", headers=headers)
+
+    assert res.status_code == 400
+    assert res.json["error"] == "Bad Request"
@@ -0,0 +1,95 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import json
+import tracemalloc
+from datetime import datetime
+
+from flask import Response
+
+from tests.functional.utils import FlaskTestRig, login, token_auth_header_field
+
+
+def add_users(rig: FlaskTestRig, n: int, start: int = 0) -> None:
+    """Bulk inserts "n" minimal users."""
+    with rig.app_context():
+        rig.db.session.execute(rig.User.__table__.insert(), [
+            {"username": f"user{i}", "email": f"user{i}@example.com", "password_hash": "-",
+             "last_login": datetime(2021, 5, 1), "role_id": 1, "credential_epoch": 0}
+            for i in range(start, start + n)
+        ])
+        rig.db.session.commit()
+
+
+def stream_peak_memory(rig: FlaskTestRig, headers: dict) -> int:
+    """Consumes a streamed listing chunk by chunk, returning the peak memory allocated."""
+    tracemalloc.start()
+    try:
+        res: Response = rig.client.get("/api/v1/users?stream=true", headers=headers, buffered=False)
+        assert res.status_code == 200
+
+        size = sum(len(chunk) for chunk in res.response)
+        assert size > 0
+
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_stream_users_matches_listing(client_factory, make_users, **kwargs):
+    """
+    Validate the streamed listing is a single valid JSON array holding every user.
+
+    :endpoint:  /api/v1/users
+    :method:    GET
+    :auth:      True
+    :params:    stream
+    :status:    200
+    :response:  A JSON list of all user objects.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+    rig.app.config["USERS_STREAM_BATCH_SIZE"] = 4
+    add_users(rig, 10)
+
+    user = rig.get_first_user(keep_password=True, admin_only=True)
+    headers = token_auth_header_field(login(rig.client, user))
+
+    listed = rig.client.get("/api/v1/users", headers=headers)
+    streamed = rig.client.get("/api/v1/users?stream=true", headers=headers)
+
+    assert streamed.status_code == 200
+    assert streamed.mimetype == "application/json"
+    assert json.loads(streamed.data) == listed.json
+    assert len(listed.json) == 13
+
+
+@FlaskTestRig.setup_app(n_users=3)
+def test_stream_users_memory_is_flat(client_factory, make_users, **kwargs):
+    """
+    Validate streaming memory is bounded by the batch size, not the number of rows.
+
+    Peak memory while streaming 10x more users should stay close to the smaller listing.
+
+    :endpoint:  /api/v1/users
+    :method:    GET
+    :auth:      True
+    :params:    stream
+    :status:    200
+    :response:  A JSON list of all user objects, streamed.
+    """
+    rig: FlaskTestRig = FlaskTestRig.extract_rig_from_kwargs(kwargs)
+    rig.app.config["USERS_STREAM_BATCH_SIZE"] = 500
+
+    user = rig.get_first_user(keep_password=True)
+    headers = token_auth_header_field(login(rig.client, user))
+
+    add_users(rig, 2000)
+    small = stream_peak_memory(rig, headers)
+
+    add_users(rig, 18000, start=2000)
+    large = stream_peak_memory(rig, headers)
+
+    assert large < small * 1.5
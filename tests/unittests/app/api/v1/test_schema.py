@@ -0,0 +1,108 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+from datetime import datetime
+
+import pytest
+from flask import json, jsonify
+
+import app.api.v1.schema as sut
+from app import db, json_provider
+from app.models import User
+
+FIELD_SETS = [
+    None,
+    ("id", "email", "username", "role_name", "last_login"),
+    ("id", "username", "last_login"),
+    ("id", "username", "email", "last_login"),
+    ("id", "username"),
+    ("role_id", "password_hash"),
+]
+
+
+@pytest.fixture
+def users(app_context):
+    """Adds users with a missing username and last login, yields them as entities and projected rows."""
+    with app_context:
+        db.session.add_all([
+            User(username="one", email="one@example.com", password_hash="-", role_id=1,
+                 last_login=datetime(2021, 5, 15, 10, 51, 20)),
+            User(username=None, email="two@example.com", password_hash="-", role_id=2, last_login=None),
+        ])
+        db.session.commit()
+
+        yield {
+            "entities": User.query.order_by(User.id).all(),
+            "rows": db.session.query(User.id, User.username, User.email, User.last_login, User.role_id,
+                                     User.password_hash).order_by(User.id).all(),
+        }
+
+
+@pytest.mark.parametrize("only", FIELD_SETS)
+@pytest.mark.parametrize("kind", ["entities", "rows"])
+def test_serializer_matches_schema(only, kind, users):
+    """
+    :GIVEN: Users loaded as entities or projected rows.
+    :WHEN:  Serializing with the compiled serializer and UserSchema.
+    :THEN:  Verify the output is identical, for lists and single objects.
+    """
+    data = users[kind]
+
+    if kind == "rows" and (only is None or "role" in only):
+        pytest.skip("Relationships are not available on projected rows.")
+
+    for many, value in [(True, data), (False, data[0]), (False, data[1])]:
+        expected = sut.UserSchema(only=only, many=many)
+        actual = sut.UserSerializer.get(only=only, many=many)
+
+        assert json.dumps(actual.dump(value)) == json.dumps(expected.dump(value))
+        assert actual.jsonify(value).json == expected.jsonify(value).json
+
+
+@pytest.mark.parametrize("backend", ["stdlib", "orjson"])
+def test_serializer_response_bytes(backend, users, app_context, mocker):
+    """
+    :GIVEN: A JSON backend.
+    :WHEN:  Creating a response with native datetimes, and through UserSchema.
+    :THEN:  Verify both bodies match Flask's "jsonify" of the marshmallow output byte-for-byte, encoded by the backend.
+    """
+    pytest.importorskip(backend if backend != "stdlib" else "json")
+    only = ("id", "email", "username", "role_name", "last_login")
+
+    with app_context as ctx:
+        ctx.app.config["JSON_BACKEND"] = backend
+        json_provider.init_app(ctx.app)
+
+        actual = sut.UserSerializer.get(only=only, many=True).jsonify(users["rows"])
+        expected = jsonify(sut.UserSchema(only=only, many=True).dump(users["rows"]))
+
+        assert actual.mimetype == "application/json"
+        assert actual.data == expected.data
+
+        dumps = mocker.spy(json_provider, "dumps")
+        assert sut.UserSchema(only=only, many=True).jsonify(users["rows"]).data == expected.data
+        assert dumps.call_count == 1
+
+
+def test_serializer_cached():
+    """
+    :GIVEN: Requests for serializers with the same fields.
+    :WHEN:  Getting the serializer.
+    :THEN:  Verify one serializer is shared per (only, many) combination.
+    """
+    serializer = sut.UserSerializer.get(only=["id", "username"], many=True)
+
+    assert sut.UserSerializer.get(only=("id", "username"), many=True) is serializer
+    assert sut.UserSerializer.get(only=("id", "username"), many=False) is not serializer
+
+
+def test_chunked():
+    """
+    :GIVEN: An iterable.
+    :WHEN:  Splitting it into chunks.
+    :THEN:  Verify all items are returned in order, in lists of up to the chunk size.
+    """
+    assert list(sut.chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(sut.chunked([], 2)) == []
@@ -0,0 +1,125 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+from threading import Thread, Event
+from types import SimpleNamespace
+
+import pytest
+
+import app.common.admission as sut
+
+
+@pytest.fixture
+def controller_factory():
+    """Factory for AdmissionController objects."""
+
+    def factory(**overrides) -> sut.AdmissionController:
+        config = {
+            "ADMISSION_ENABLED": True,
+            "ADMISSION_MAX_CONCURRENT": 1,
+            "ADMISSION_QUEUE_SIZE": 0,
+            "ADMISSION_QUEUE_TIMEOUT": 0.1,
+            "ADMISSION_EMAIL_RATE": 0.0,
+            "ADMISSION_EMAIL_BURST": 2,
+            "ADMISSION_CLIENT_RATE": 0.0,
+            "ADMISSION_CLIENT_BURST": 100,
+            **overrides
+        }
+        return sut.AdmissionController(SimpleNamespace(config=config))
+
+    return factory
+
+
+def test_token_bucket_refills(mocker):
+    """
+    :GIVEN: An empty token bucket.
+    :WHEN:  Time passes.
+    :THEN:  Verify tokens are refilled at the configured rate.
+    """
+    clock = mocker.patch("app.common.admission.time.monotonic", return_value=0.0)
+    bucket = sut.TokenBucket(rate=1.0, capacity=1)
+
+    assert bucket.take() is True
+    assert bucket.take() is False
+
+    clock.return_value = 1.0
+    assert bucket.take() is True
+
+
+def test_email_rate_limit_sheds(controller_factory):
+    """
+    :GIVEN: A per-email burst of 2 with no refill.
+    :WHEN:  Verifying credentials for the same email 3 times.
+    :THEN:  Verify the third attempt is shed before being admitted.
+    """
+    controller = controller_factory()
+
+    for _ in range(2):
+        with controller.admit("a@example.com", "127.0.0.1"):
+            pass
+
+    with pytest.raises(sut.AdmissionRejected):
+        with controller.admit("a@example.com", "127.0.0.1"):
+            pass
+
+    stats = controller.stats
+    assert (stats.admitted, stats.shed) == (2, 1)
+
+
+def test_concurrency_gate_sheds_when_queue_full(controller_factory):
+    """
+    :GIVEN: A single verification slot with no wait queue.
+    :WHEN:  A second verification arrives while the slot is busy.
+    :THEN:  Verify the second verification is shed.
+    """
+    controller = controller_factory(ADMISSION_EMAIL_BURST=100)
+    entered, release = Event(), Event()
+
+    def busy():
+        with controller.admit("a@example.com", "127.0.0.1"):
+            entered.set()
+            release.wait(5)
+
+    thread = Thread(target=busy)
+    thread.start()
+    entered.wait(5)
+
+    with pytest.raises(sut.AdmissionRejected):
+        with controller.admit("b@example.com", "127.0.0.1"):
+            pass
+
+    release.set()
+    thread.join()
+
+    assert controller.stats.shed == 1
+    assert controller.stats.in_flight == 0
+
+
+def test_concurrency_gate_queues(controller_factory):
+    """
+    :GIVEN: A single verification slot with a wait queue.
+    :WHEN:  A second verification arrives while the slot is busy.
+    :THEN:  Verify the second verification waits and is then admitted.
+    """
+    controller = controller_factory(ADMISSION_EMAIL_BURST=100, ADMISSION_QUEUE_SIZE=1, ADMISSION_QUEUE_TIMEOUT=5)
+    entered = Event()
+
+    def busy():
+        with controller.admit("a@example.com", "127.0.0.1"):
+            entered.set()
+            while controller.stats.waiting == 0:
+                pass
+
+    thread = Thread(target=busy)
+    thread.start()
+    entered.wait(5)
+
+    with controller.admit("b@example.com", "127.0.0.1"):
+        pass
+
+    thread.join()
+
+    stats = controller.stats
+    assert (stats.admitted, stats.queued, stats.shed) == (2, 1, 0)
@@ -0,0 +1,129 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+import app.common.bloom as sut
+
+
+def test_no_false_negatives_and_error_rate():
+    """
+    :GIVEN: A Bloom filter filled to capacity.
+    :WHEN:  Checking added and never added items.
+    :THEN:  Verify every added item is found and the false positive rate is near the target.
+    """
+    bloom = sut.BloomFilter(capacity=5000, error_rate=0.01)
+    bloom.update(f"user{i}@example.com" for i in range(5000))
+
+    assert all(f"user{i}@example.com" in bloom for i in range(5000))
+
+    false_positives = sum(f"other{i}@example.com" in bloom for i in range(10000))
+    assert false_positives / 10000 < 0.03
+
+
+@pytest.mark.parametrize("error_rate", [0.1, 0.01, 0.001])
+def test_memory_footprint(error_rate):
+    """
+    :GIVEN: A configured capacity and false positive rate.
+    :WHEN:  Creating a Bloom filter.
+    :THEN:  Verify the reported memory matches the optimal bit count, about 9.6 bits per item at 1%.
+    """
+    bloom = sut.BloomFilter(capacity=10000, error_rate=error_rate)
+
+    stats = bloom.stats
+    assert stats.memory_bytes == (stats.bits + 7) // 8
+    assert stats.count == 0 and stats.estimated_error_rate == 0
+
+    if error_rate == 0.01:
+        assert 9 < stats.bits / 10000 < 10
+        assert stats.hashes == 7
+
+
+def test_invalid_error_rate():
+    """
+    :GIVEN: An out of range false positive rate.
+    :WHEN:  Creating a Bloom filter.
+    :THEN:  Verify a ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        sut.BloomFilter(capacity=10, error_rate=1)
+
+
+def make_email_filter(lookup, refresh: float = 60) -> sut.EmailFilter:
+    """Returns an enabled EmailFilter backed by a lookup of (id, email) rows."""
+    email_filter = sut.EmailFilter(SimpleNamespace(config={
+        "EMAIL_FILTER_ENABLED": True,
+        "EMAIL_FILTER_CAPACITY": 100,
+        "EMAIL_FILTER_ERROR_RATE": 0.01,
+        "EMAIL_FILTER_REBUILD_RATIO": 0.25,
+        "EMAIL_FILTER_REFRESH": refresh,
+        "EMAIL_FILTER_REBUILD_INTERVAL": 600,
+    }))
+    email_filter._lookup = lookup
+
+    return email_filter
+
+
+def test_email_filter_rebuilds_after_deletes():
+    """
+    :GIVEN: An email filter built from the database.
+    :WHEN:  Enough emails are deleted to pass the rebuild ratio.
+    :THEN:  Verify the filter is rebuilt from the database, keeping emails added since the last build.
+    """
+    emails = ["a@example.com", "b@example.com", "c@example.com", "d@example.com"]
+
+    email_filter = make_email_filter(lambda after=None: list(enumerate(emails)))
+    email_filter.rebuild()
+
+    assert email_filter.might_contain("a@example.com") is True
+    assert email_filter.might_contain("z@example.com") is False
+
+    # An email flushed in a transaction the rebuild cannot see yet.
+    email_filter.add("new@example.com")
+    emails.remove("a@example.com")
+    emails.remove("b@example.com")
+    email_filter.discard(2)
+
+    email_filter.might_contain("c@example.com")
+
+    assert email_filter.stats.count == 3
+    assert email_filter.might_contain("new@example.com") is True
+    assert email_filter.might_contain("c@example.com") is True
+
+
+def test_email_filter_catches_up_before_negative(mocker):
+    """
+    :GIVEN: An email filter built from the database.
+    :WHEN:  Another process adds a User and the email is looked up.
+    :THEN:  Verify the new User is loaded once the refresh interval has passed, with a query for newer ids only.
+    """
+    rows = [(1, "a@example.com"), (2, "b@example.com")]
+    queries = []
+
+    def lookup(after=None):
+        queries.append(after)
+        return [row for row in rows if after is None or row[0] > after]
+
+    clock = mocker.patch.object(sut.time, "monotonic", return_value=100.0)
+    email_filter = make_email_filter(lookup, refresh=5)
+    email_filter.rebuild()
+
+    rows.append((3, "c@example.com"))
+
+    # Within the refresh interval the negative is trusted.
+    clock.return_value = 104.0
+    assert email_filter.might_contain("c@example.com") is False
+
+    clock.return_value = 106.0
+    assert email_filter.might_contain("c@example.com") is True
+    assert email_filter.might_contain("z@example.com") is False
+    assert queries == [None, 2]
+
+    # The next catch-up starts after the newest id loaded.
+    clock.return_value = 112.0
+    assert email_filter.might_contain("z@example.com") is False
+    assert queries == [None, 2, 3]
@@ -0,0 +1,100 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+from unittest.mock import MagicMock
+
+import app.common.cache as sut
+
+
+def test_lru_cache_evicts_least_recently_used():
+    """
+    :GIVEN: A full LRU cache.
+    :WHEN:  Adding a new entry.
+    :THEN:  Verify the least recently used entry is evicted and counted.
+    """
+    cache = sut.LRUCache(maxsize=2)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # Touch "a" so "b" becomes the least recently used entry.
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats.evictions == 1
+    assert cache.stats.hits == 3
+    assert cache.stats.misses == 1
+
+
+def test_lru_cache_expires_entries(mocker):
+    """
+    :GIVEN: A cache entry with a time-to-live.
+    :WHEN:  Reading the entry after it has expired.
+    :THEN:  Verify a cache miss occurs.
+    """
+    clock = mocker.patch("app.common.cache.time.monotonic", return_value=100.0)
+    cache = sut.LRUCache(maxsize=2, ttl=10)
+
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+    clock.return_value = 111.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_credential_cache_skips_verifier_on_hit(app_context):
+    """
+    :GIVEN: A set of credentials that were successfully verified.
+    :WHEN:  Verifying the same credentials again.
+    :THEN:  Verify the expensive verifier is not called again.
+    """
+    cache = sut.CredentialCache()
+    verifier = MagicMock(return_value=True)
+
+    with app_context as ctx:
+        cache.init_app(ctx.app)
+
+    assert cache.verify("a@example.com", "secret", "hash-1", verifier) is True
+    assert cache.verify("a@example.com", "secret", "hash-1", verifier) is True
+
+    verifier.assert_called_once()
+    assert cache.stats.hits == 1
+
+
+def test_credential_cache_stale_on_password_hash_change(app_context):
+    """
+    :GIVEN: A set of credentials that were successfully verified.
+    :WHEN:  The stored password hash changes.
+    :THEN:  Verify the cached verification is not reused.
+    """
+    cache = sut.CredentialCache()
+    verifier = MagicMock(side_effect=[True, False])
+
+    with app_context as ctx:
+        cache.init_app(ctx.app)
+
+    assert cache.verify("a@example.com", "secret", "hash-1", verifier) is True
+    assert cache.verify("a@example.com", "secret", "hash-2", verifier) is False
+    assert verifier.call_count == 2
+
+
+def test_credential_cache_never_caches_failures(app_context):
+    """
+    :GIVEN: A set of invalid credentials.
+    :WHEN:  Verifying them repeatedly.
+    :THEN:  Verify the verifier runs every time.
+    """
+    cache = sut.CredentialCache()
+    verifier = MagicMock(return_value=False)
+
+    with app_context as ctx:
+        cache.init_app(ctx.app)
+
+    assert cache.verify("a@example.com", "wrong", "hash-1", verifier) is False
+    assert cache.verify("a@example.com", "wrong", "hash-1", verifier) is False
+    assert verifier.call_count == 2
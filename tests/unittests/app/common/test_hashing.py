@@ -0,0 +1,115 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+import app.common.hashing as sut
+
+
+@pytest.fixture
+def service_factory():
+    """Factory for HashingService objects, shut down after the test."""
+    services = []
+
+    def factory(workers: int) -> sut.HashingService:
+        app = SimpleNamespace(config={"PASSWORD_HASH_WORKERS": workers, "PASSWORD_HASH_QUEUE_SIZE": 2,
+                                      "PASSWORD_HASH_METHOD": "pbkdf2:sha256", "PASSWORD_HASH_ITERATIONS": 150000})
+        services.append(sut.HashingService(app))
+        return services[-1]
+
+    yield factory
+
+    _ = [service.shutdown() for service in services]
+
+
+@pytest.mark.parametrize("workers", [0, 1])
+def test_hash_and_verify(workers, service_factory):
+    """
+    :GIVEN: A hashing service, synchronous or backed by a process pool.
+    :WHEN:  Hashing and verifying a password.
+    :THEN:  Verify only the correct password matches and the statistics are recorded.
+    """
+    service = service_factory(workers)
+
+    password_hash = service.hash("cricket")
+
+    assert service.verify(password_hash, "cricket") is True
+    assert service.verify(password_hash, "wrong") is False
+
+    stats = service.stats
+    assert stats.submitted == stats.completed == 3
+    assert stats.queue_depth == 0
+    assert stats.max_latency_ms >= stats.mean_latency_ms > 0
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_hash_many(workers, service_factory):
+    """
+    :GIVEN: A hashing service, synchronous or backed by a process pool.
+    :WHEN:  Hashing a batch of passwords.
+    :THEN:  Verify a hash is returned per password, in order.
+    """
+    service = service_factory(workers)
+    passwords = [f"cricket{i}" for i in range(5)]
+
+    hashes = service.hash_many(passwords)
+
+    assert len(hashes) == len(passwords)
+    assert all(service.verify(password_hash, password) for password_hash, password in zip(hashes, passwords))
+    assert service.stats.queue_depth == 0
+
+
+@pytest.mark.parametrize("method, iterations, expected",
+                         [
+                             ("pbkdf2:sha256", 150000, "pbkdf2:sha256:150000"),
+                             ("pbkdf2:sha256:1000", 150000, "pbkdf2:sha256:1000"),
+                             ("pbkdf2:sha512", None, "pbkdf2:sha512"),
+                         ])
+def test_hash_method(method, iterations, expected):
+    """
+    :GIVEN: A configured hash method and iteration count.
+    :WHEN:  Building the werkzeug method string.
+    :THEN:  Verify the iteration count is only added to PBKDF2 methods without one.
+    """
+    assert sut.hash_method(method, iterations) == expected
+
+
+def test_needs_rehash(service_factory):
+    """
+    :GIVEN: Stored hashes made with the current and an outdated cost.
+    :WHEN:  Checking if they need rehashing.
+    :THEN:  Verify only the outdated hash is flagged.
+    """
+    service = service_factory(0)
+
+    assert service.needs_rehash(service.hash("cricket")) is False
+    assert service.needs_rehash("pbkdf2:sha256:1000$salt$abc") is True
+
+
+def test_calibrate():
+    """
+    :GIVEN: A set of candidate iteration counts.
+    :WHEN:  Calibrating the hash cost.
+    :THEN:  Verify a latency result is returned for each candidate.
+    """
+    results = sut.calibrate("pbkdf2:sha256", [1000, 2000], samples=3)
+
+    assert [result.iterations for result in results] == [1000, 2000]
+    assert all(result.p99_ms >= result.p50_ms > 0 for result in results)
+
+
+def test_percentile():
+    """
+    :GIVEN: A set of samples.
+    :WHEN:  Requesting percentiles.
+    :THEN:  Verify the nearest-rank sample is returned.
+    """
+    samples = list(range(1, 101))
+
+    assert sut.percentile(samples, 50) == 50
+    assert sut.percentile(samples, 99) == 99
+    assert sut.percentile([5], 99) == 5
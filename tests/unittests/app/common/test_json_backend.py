@@ -0,0 +1,83 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+import app.common.json_backend as sut
+
+
+def make_app(backend: str) -> SimpleNamespace:
+    """Returns a minimal application object for a JSON backend."""
+    return SimpleNamespace(config={"JSON_BACKEND": backend, "JSON_SORT_KEYS": True, "JSON_AS_ASCII": True})
+
+
+@pytest.mark.parametrize("backend", ["stdlib", "orjson"])
+def test_backend_encodes_datetimes(backend):
+    """
+    :GIVEN: A JSON backend.
+    :WHEN:  Encoding an object holding a datetime.
+    :THEN:  Verify the datetime is written as ISO 8601 with compact, sorted output.
+    """
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+
+    provider = sut.JSONProvider(make_app(backend))
+
+    data = provider.dumps({"b": datetime(2021, 5, 15, 10, 51, 20), "a": None})
+
+    assert provider.name == backend
+    assert data == b'{"a":null,"b":"2021-05-15T10:51:20"}'
+    assert provider.loads(data) == {"a": None, "b": "2021-05-15T10:51:20"}
+
+
+def test_auto_falls_back_to_stdlib(mocker):
+    """
+    :GIVEN: orjson is not installed.
+    :WHEN:  The backend is set to "auto" or "orjson".
+    :THEN:  Verify the stdlib backend is used.
+    """
+    mocker.patch.object(sut, "orjson", None)
+
+    assert sut.JSONProvider(make_app("auto")).name == "stdlib"
+    assert sut.JSONProvider(make_app("orjson")).name == "stdlib"
+
+
+def test_unknown_backend():
+    """
+    :GIVEN: An unknown backend name.
+    :WHEN:  Initialising the provider.
+    :THEN:  Verify a ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        sut.JSONProvider(make_app("simplejson"))
+
+
+def test_unserializable_type():
+    """
+    :GIVEN: An object the backend cannot encode.
+    :WHEN:  Encoding it.
+    :THEN:  Verify a TypeError is raised.
+    """
+    with pytest.raises(TypeError):
+        sut.JSONProvider(make_app("stdlib")).dumps({"a": object()})
+
+
+def test_response(app_context):
+    """
+    :GIVEN: An object to return.
+    :WHEN:  Creating a response.
+    :THEN:  Verify the status, mimetype and body are set.
+    """
+    provider = sut.JSONProvider(make_app("stdlib"))
+
+    with app_context:
+        res = provider.response({"a": 1}, 201)
+
+    assert res.status_code == 201
+    assert res.mimetype == "application/json"
+    assert res.data == b'{"a":1}\n'
@@ -0,0 +1,26 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import app.common.logger as sut
+from configurations.env_setup import DevelopmentConfig, ProductionConfig
+
+
+def test_init_logger_once_per_config(mocker):
+    """
+    :GIVEN: A logger configuration file.
+    :WHEN:  Initialising the logger repeatedly.
+    :THEN:  Verify logging is configured once per configuration file.
+    """
+    mocker.patch.object(sut, "_config_file", None)
+    dict_config = mocker.patch.object(sut.logging.config, "dictConfig")
+
+    sut.init_logger(DevelopmentConfig.LOGGER_CONFIG)
+    sut.init_logger(DevelopmentConfig.LOGGER_CONFIG)
+
+    assert dict_config.call_count == 1
+
+    sut.init_logger(ProductionConfig.LOGGER_CONFIG)
+
+    assert dict_config.call_count == 2
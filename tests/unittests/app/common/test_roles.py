@@ -0,0 +1,73 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import app.common.roles as sut
+
+
+def make_registry(rows: list) -> sut.RoleRegistry:
+    """Returns a RoleRegistry backed by a list of (id, name) rows."""
+    registry = sut.RoleRegistry()
+    registry._lookup = lambda: list(rows)
+    registry.reload()
+
+    return registry
+
+
+def test_resolves_ids_and_names():
+    """
+    :GIVEN: A registry loaded with the seeded roles.
+    :WHEN:  Resolving role ids and names.
+    :THEN:  Verify both directions resolve in memory.
+    """
+    registry = make_registry([(1, "user"), (2, "admin")])
+
+    assert registry.name(1) == "user"
+    assert registry.name(2) == "admin"
+    assert registry.id("admin") == 2
+    assert registry.names == {1: "user", 2: "admin"}
+
+
+def test_unknown_role_triggers_reload(mocker):
+    """
+    :GIVEN: A registry loaded before a role was added.
+    :WHEN:  Resolving the new role id, and unknown ids and names.
+    :THEN:  Verify unknown roles reload at most once per refresh interval.
+    """
+    rows = [(1, "user")]
+    lookup = mocker.Mock(side_effect=lambda: list(rows))
+    clock = mocker.patch.object(sut.time, "monotonic", return_value=100.0)
+
+    registry = sut.RoleRegistry()
+    registry._lookup = lookup
+    registry.reload()
+    rows.append((2, "admin"))
+
+    # Within the refresh interval misses are answered from memory.
+    clock.return_value = 159.0
+    assert registry.name(2) is None
+    assert registry.id("admin") is None
+    assert lookup.call_count == 1
+
+    clock.return_value = 160.0
+    assert registry.name(2) == "admin"
+    assert registry.name(3) is None
+    assert registry.id("bogus") is None
+    assert lookup.call_count == 2
+
+
+def test_registry_is_read_only():
+    """
+    :GIVEN: A loaded registry.
+    :WHEN:  Attempting to change a mapping.
+    :THEN:  Verify the mapping cannot be changed.
+    """
+    registry = make_registry([(1, "user")])
+
+    try:
+        registry.names[1] = "admin"
+    except TypeError:
+        pass
+
+    assert registry.name(1) == "user"
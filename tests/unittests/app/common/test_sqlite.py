@@ -0,0 +1,64 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+
+import app.common.sqlite as sut
+
+PROFILE = {"journal_mode": "WAL", "synchronous": "NORMAL", "cache_size": -2000, "temp_store": "MEMORY",
+           "busy_timeout": 2500}
+
+
+def make_profile(pragmas: dict) -> sut.SQLiteProfile:
+    """Creates a SQLiteProfile from a pragma set."""
+    return sut.SQLiteProfile(SimpleNamespace(config={"SQLITE_PRAGMAS": pragmas}))
+
+
+def test_profile_applied(tmp_path):
+    """
+    :GIVEN: A SQLite profile attached to a file database engine.
+    :WHEN:  Reporting the pragmas in effect.
+    :THEN:  Verify every connection has the configured pragmas.
+    """
+    profile = make_profile(PROFILE)
+    engine = create_engine(f"sqlite:///{tmp_path / 'profile.sqlite'}")
+
+    profile.attach(engine)
+
+    assert profile.report(engine) == {"journal_mode": "wal", "synchronous": 1, "cache_size": -2000, "temp_store": 2,
+                                      "busy_timeout": 2500}
+
+
+def test_empty_profile(tmp_path):
+    """
+    :GIVEN: An empty SQLite profile.
+    :WHEN:  Attaching it to an engine.
+    :THEN:  Verify no listener is registered and SQLite defaults are kept.
+    """
+    profile = make_profile({})
+    engine = create_engine(f"sqlite:///{tmp_path / 'profile.sqlite'}")
+
+    profile.attach(engine)
+
+    with engine.connect() as connection:
+        assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "delete"
+
+
+@pytest.mark.parametrize("pragmas",
+                         [
+                             {"user_version": 1},
+                             {"journal_mode": "WAL; DROP TABLE users"},
+                         ])
+def test_invalid_profile(pragmas):
+    """
+    :GIVEN: A SQLite profile with an unsupported pragma or value.
+    :WHEN:  Initialising the profile.
+    :THEN:  Verify a ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        make_profile(pragmas)
@@ -0,0 +1,89 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from itsdangerous import BadSignature
+
+import app.common.tokens as sut
+
+
+@pytest.fixture
+def signer(app_context) -> sut.TokenSigner:
+    """Returns a TokenSigner initialised from the test configuration."""
+    with app_context as ctx:
+        return sut.TokenSigner(ctx.app)
+
+
+def test_token_round_trip(signer):
+    """
+    :GIVEN: A set of token claims.
+    :WHEN:  Signing and then loading the token.
+    :THEN:  Verify the claims are returned and the configured algorithm is used.
+    """
+    token = signer.dumps({"id": 1, "fp": "abc"})
+
+    claims, header = signer.loads(token)
+
+    assert claims == {"id": 1, "fp": "abc"}
+    assert header["alg"] == "HS256"
+    assert "exp" in header
+
+
+def test_tampered_token_rejected(signer):
+    """
+    :GIVEN: A signed token.
+    :WHEN:  The token is altered.
+    :THEN:  Verify the signature check fails.
+    """
+    token = signer.dumps({"id": 1, "fp": "abc"})
+
+    with pytest.raises(BadSignature):
+        signer.loads(token[:-2] + ("AA" if not token.endswith("AA") else "BB"))
+
+
+def test_fingerprint_tracks_credential(signer):
+    """
+    :GIVEN: A fingerprint of a credential key.
+    :WHEN:  Verifying it against the same and a changed credential key.
+    :THEN:  Verify only the original key matches.
+    """
+    fingerprint = signer.fingerprint("7:3")
+
+    assert signer.verify_fingerprint("7:3", fingerprint) is True
+    assert signer.verify_fingerprint("7:4", fingerprint) is False
+    assert signer.verify_fingerprint("7:3", None) is False
+
+
+@pytest.mark.parametrize("password, expected",
+                         [
+                             ("admin-secret", True),
+                             ("admin-secret ", False),
+                             ("", False),
+                             (None, False),
+                             (1234, False),
+                         ])
+def test_admin_secret(password, expected):
+    """
+    :GIVEN: An admin secret derived from the configuration.
+    :WHEN:  Verifying an admin password.
+    :THEN:  Verify only the configured secret matches.
+    """
+    app = SimpleNamespace(config={"SECRET_KEY": "key", "ADMIN_SECRET_KEY": "admin-secret"})
+
+    assert sut.AdminSecret(app).verify(password) is expected
+
+
+def test_admin_secret_unset():
+    """
+    :GIVEN: No admin secret configured.
+    :WHEN:  Verifying an admin password.
+    :THEN:  Verify no password matches.
+    """
+    app = SimpleNamespace(config={"SECRET_KEY": "key", "ADMIN_SECRET_KEY": None})
+
+    assert sut.AdminSecret(app).verify("") is False
+    assert sut.AdminSecret(app).verify("None") is False
@@ -0,0 +1,143 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table, create_engine, select
+from sqlalchemy.pool import StaticPool
+
+import app.common.writebehind as sut
+
+
+@pytest.fixture
+def users():
+    """An in-memory users table with three rows."""
+    # One shared connection, the flush thread must see the same in-memory database.
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    table = Table("users", MetaData(), Column("id", Integer, primary_key=True), Column("last_login", DateTime))
+    table.create(engine)
+
+    with engine.begin() as connection:
+        connection.execute(table.insert(), [{"id": user_id} for user_id in (1, 2, 3)])
+
+    return SimpleNamespace(engine=engine, table=table, model=SimpleNamespace(__table__=table))
+
+
+@pytest.fixture
+def buffer_factory(users):
+    """Factory for LastLoginBuffer objects bound to the users table, shut down after the test."""
+    buffers = []
+
+    def factory(enabled: bool = True, interval: float = 60, size: int = 100) -> sut.LastLoginBuffer:
+        app = SimpleNamespace(config={"LAST_LOGIN_WRITE_BEHIND": enabled, "LAST_LOGIN_FLUSH_INTERVAL": interval,
+                                      "LAST_LOGIN_FLUSH_SIZE": size})
+        buffer = sut.LastLoginBuffer(app)
+        buffer.bind(users.engine, users.model)
+        buffers.append(buffer)
+        return buffer
+
+    yield factory
+
+    _ = [buffer.shutdown() for buffer in buffers]
+
+
+def stored(users) -> dict:
+    """Returns the stored last login times by User id."""
+    with users.engine.connect() as connection:
+        return dict(connection.execute(select(users.table.c.id, users.table.c.last_login)).all())
+
+
+def test_disabled(users, buffer_factory):
+    """
+    :GIVEN: A disabled write-behind buffer.
+    :WHEN:  Recording a login.
+    :THEN:  Verify the caller is told to write it.
+    """
+    buffer = buffer_factory(enabled=False)
+
+    assert buffer.record(1, datetime(2026, 1, 1)) is False
+    assert buffer.stats.pending == 0
+
+
+def test_flush_batches_latest_login(users, buffer_factory):
+    """
+    :GIVEN: A write-behind buffer.
+    :WHEN:  Recording logins and flushing.
+    :THEN:  Verify nothing is written until the flush, which writes the latest login per User.
+    """
+    buffer = buffer_factory()
+    first, second = datetime(2026, 1, 1), datetime(2026, 1, 2)
+
+    assert buffer.record(1, first) is True
+    buffer.record(2, first)
+    buffer.record(1, second)
+
+    assert stored(users) == {1: None, 2: None, 3: None}
+    assert buffer.flush() == 2
+    assert stored(users) == {1: second, 2: first, 3: None}
+
+    stats = buffer.stats
+    assert (stats.pending, stats.recorded, stats.written, stats.flushes) == (0, 3, 2, 1)
+
+
+def test_flush_when_full(users, buffer_factory):
+    """
+    :GIVEN: A write-behind buffer with a long interval.
+    :WHEN:  The number of pending Users reaches the flush size.
+    :THEN:  Verify the buffer is flushed without waiting for the interval.
+    """
+    buffer = buffer_factory(size=2)
+    login = datetime(2026, 1, 1)
+
+    buffer.record(1, login)
+    buffer.record(2, login)
+
+    deadline = time.monotonic() + 5
+    while buffer.stats.written < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert stored(users) == {1: login, 2: login, 3: None}
+
+
+def test_shutdown_flushes(users, buffer_factory):
+    """
+    :GIVEN: A write-behind buffer with pending logins.
+    :WHEN:  Shutting the buffer down.
+    :THEN:  Verify the pending logins are written.
+    """
+    buffer = buffer_factory()
+    login = datetime(2026, 1, 1)
+
+    buffer.record(3, login)
+    buffer.shutdown()
+
+    assert stored(users) == {1: None, 2: None, 3: login}
+
+
+def test_failed_flush_retries(users, buffer_factory):
+    """
+    :GIVEN: A write-behind buffer whose flush fails.
+    :WHEN:  Flushing again after the failure.
+    :THEN:  Verify the logins are kept and written, without overwriting a newer login.
+    """
+    buffer = buffer_factory()
+    first, second = datetime(2026, 1, 1), datetime(2026, 1, 2)
+    engine = buffer._engine
+
+    buffer.record(1, first)
+    buffer.record(2, first)
+    buffer._engine = SimpleNamespace(begin=lambda: (_ for _ in ()).throw(RuntimeError("database is locked")))
+
+    assert buffer.flush() == 0
+
+    buffer.record(1, second)
+    buffer._engine = engine
+
+    assert buffer.flush() == 2
+    assert stored(users) == {1: second, 2: first, 3: None}
+    assert buffer.stats.failures == 1
@@ -0,0 +1,236 @@
+"""
+Author:     David Walshe
+Date:       18 October 2026
+"""
+
+from functools import partial
+from threading import Event
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, select
+from sqlalchemy.exc import DBAPIError, IntegrityError, OperationalError
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+import app.common.writer as sut
+
+
+@pytest.fixture
+def users(tmp_path):
+    """A file database with an empty users table, shared by the writer thread and the test."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'writer.sqlite'}")
+    table = Table("users", MetaData(), Column("id", Integer, primary_key=True))
+    table.create(engine)
+
+    return SimpleNamespace(engine=engine, table=table)
+
+
+@pytest.fixture
+def writer_factory(users):
+    """Factory for WriteQueue objects bound to the users database, shut down after the test."""
+    writers = []
+    session = scoped_session(sessionmaker(bind=users.engine))
+
+    def factory(enabled: bool = True, max_batch: int = 64) -> sut.WriteQueue:
+        app = SimpleNamespace(config={"WRITE_QUEUE_ENABLED": enabled, "WRITE_QUEUE_MAX_BATCH": max_batch,
+                                      "WRITE_QUEUE_MAX_WAIT": 0.0, "WRITE_QUEUE_SIZE": 100})
+        writer = sut.WriteQueue(app)
+        writer.bind(session, users.engine)
+        writers.append(writer)
+        return writer
+
+    yield factory
+
+    _ = [writer.shutdown() for writer in writers]
+    session.remove()
+
+
+def insert(users, user_id: int, connection) -> int:
+    """Write job inserting a User."""
+    connection.execute(users.table.insert().values(id=user_id))
+    return user_id
+
+
+def break_connection(connections: list, connection) -> None:
+    """Write job closing the underlying DBAPI connection, as if the database went away, before using it."""
+    connections.append(connection)
+    connection.connection.connection.close()
+    connection.exec_driver_sql("SELECT 1")
+
+
+def stored(users) -> list:
+    """Returns the stored User ids."""
+    with users.engine.connect() as connection:
+        return list(connection.execute(select(users.table.c.id).order_by(users.table.c.id)).scalars())
+
+
+def blocked(writer: sut.WriteQueue) -> Event:
+    """Occupies the writer thread until the returned event is set, so following jobs queue up."""
+    started, release = Event(), Event()
+
+    def job(connection) -> None:
+        started.set()
+        release.wait(5)
+
+    writer.submit(job)
+    started.wait(5)
+
+    return release
+
+
+def test_disabled(users, writer_factory):
+    """
+    :GIVEN: A disabled writer.
+    :WHEN:  Executing jobs.
+    :THEN:  Verify each job is committed on the calling thread and a failing job is rolled back.
+    """
+    writer = writer_factory(enabled=False)
+
+    assert writer.execute(partial(insert, users, 1)) == 1
+
+    with pytest.raises(IntegrityError):
+        writer.execute(partial(insert, users, 1))
+
+    assert writer.execute(partial(insert, users, 2)) == 2
+    assert stored(users) == [1, 2]
+    assert writer.stats.submitted == 0
+
+
+def test_group_commit(users, writer_factory):
+    """
+    :GIVEN: An enabled writer.
+    :WHEN:  Submitting jobs while the writer is busy.
+    :THEN:  Verify the queued jobs are committed together as one group.
+    """
+    writer = writer_factory()
+    release = blocked(writer)
+
+    futures = [writer.submit(partial(insert, users, user_id)) for user_id in range(1, 6)]
+    assert writer.stats.queue_depth == 6
+
+    release.set()
+
+    assert [future.result(5) for future in futures] == [1, 2, 3, 4, 5]
+    assert stored(users) == [1, 2, 3, 4, 5]
+
+    stats = writer.stats
+    assert (stats.submitted, stats.completed, stats.failed, stats.queue_depth) == (6, 6, 0, 0)
+    assert (stats.groups, stats.largest_group) == (2, 5)
+
+
+def test_group_max_batch(users, writer_factory):
+    """
+    :GIVEN: An enabled writer with a maximum group size.
+    :WHEN:  Queuing more jobs than the maximum.
+    :THEN:  Verify the jobs are split across groups.
+    """
+    writer = writer_factory(max_batch=2)
+    release = blocked(writer)
+
+    futures = [writer.submit(partial(insert, users, user_id)) for user_id in range(1, 6)]
+    release.set()
+    _ = [future.result(5) for future in futures]
+
+    assert writer.stats.groups == 4
+    assert writer.stats.largest_group == 2
+
+
+def test_group_failure_isolated(users, writer_factory):
+    """
+    :GIVEN: An enabled writer.
+    :WHEN:  A job in a group fails.
+    :THEN:  Verify only that job's caller sees the error and the rest of the group is committed.
+    """
+    writer = writer_factory()
+    release = blocked(writer)
+
+    futures = [writer.submit(partial(insert, users, user_id)) for user_id in (1, 2, 1, 3)]
+    release.set()
+
+    assert futures[0].result(5) == 1
+    assert futures[1].result(5) == 2
+    with pytest.raises(IntegrityError):
+        futures[2].result(5)
+    assert futures[3].result(5) == 3
+
+    assert stored(users) == [1, 2, 3]
+    assert writer.stats.failed == 1
+
+
+def test_execute_waits_for_commit(users, writer_factory):
+    """
+    :GIVEN: An enabled writer.
+    :WHEN:  Executing a job.
+    :THEN:  Verify the result is returned once the job is committed and errors are raised to the caller.
+    """
+    writer = writer_factory()
+
+    assert writer.execute(partial(insert, users, 1)) == 1
+    assert stored(users) == [1]
+
+    with pytest.raises(IntegrityError):
+        writer.execute(partial(insert, users, 1))
+
+
+def test_shutdown_drains_queue(users, writer_factory):
+    """
+    :GIVEN: An enabled writer with queued jobs.
+    :WHEN:  Shutting down.
+    :THEN:  Verify the queued jobs are committed before the thread stops.
+    """
+    writer = writer_factory()
+    release = blocked(writer)
+
+    futures = [writer.submit(partial(insert, users, user_id)) for user_id in (1, 2)]
+    release.set()
+    writer.shutdown()
+
+    assert all(future.done() for future in futures)
+    assert stored(users) == [1, 2]
+
+
+def test_reconnect_after_connection_lost(users, writer_factory):
+    """
+    :GIVEN: An enabled writer.
+    :WHEN:  The writer connection is lost during a job.
+    :THEN:  Verify the job fails and later jobs run on a new connection.
+    """
+    writer = writer_factory()
+    connections = []
+
+    with pytest.raises(DBAPIError) as info:
+        writer.execute(partial(break_connection, connections))
+
+    assert info.value.connection_invalidated
+
+    assert writer.execute(lambda connection: connections.append(connection)) is None
+    assert writer.execute(partial(insert, users, 1)) == 1
+
+    assert connections[0] is not connections[1]
+    assert stored(users) == [1]
+    assert writer.stats.failed == 1
+
+
+def test_reconnect_after_connect_failure(users, writer_factory, mocker):
+    """
+    :GIVEN: An enabled writer whose first connection attempt fails.
+    :WHEN:  Executing jobs.
+    :THEN:  Verify the first job sees the error and the next job connects.
+    """
+    writer = writer_factory()
+    error = OperationalError("connect", {}, Exception("unable to open database file"))
+    connect, attempts = users.engine.connect, []
+
+    def flaky_connect():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise error
+        return connect()
+
+    mocker.patch.object(users.engine, "connect", side_effect=flaky_connect)
+
+    with pytest.raises(OperationalError):
+        writer.execute(partial(insert, users, 1))
+
+    assert writer.execute(partial(insert, users, 2)) == 2
+    assert stored(users) == [2]